@@ -0,0 +1,270 @@
+"""Walk-forward backtest of the prediction models on ``Data/ufc-master.csv``.
+
+``python -m Prediction.backtest`` replays the bouts in date order.  The
+older ``--initial`` share of them is only ever used for training; the rest
+is cut into ``--folds`` consecutive folds (on event boundaries).  Each fold
+is predicted from what was known before its first event:
+
+* ``xgboost`` -- a model retrained on every earlier bout, on the
+  red-minus-blue differences of ``MASTER_STATS``
+* ``mathmodel`` -- the MMA math scores (:func:`score_all` plus the
+  relative-victory bonus) from every earlier fight, turned into a win
+  probability by a logistic fit on the last part of the training bouts
+
+Folds run in a process pool.  Each fold reports accuracy, log-loss, Brier
+score, expected calibration error, and the return on a flat one-unit bet
+on every pick (``roi``) or only where the model beats the bookmaker's
+implied probability (``value_roi``).  The ``all`` rows pool every fold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss
+
+from Prediction.data_loader import MASTER_CSV, load_csv
+from Prediction.ufc_predict_math import FightHistory, score_all
+
+# Pre-fight stats of each corner (Red<stat> / Blue<stat>) used by the XGBoost model
+MASTER_STATS = [
+    'AvgSigStrLanded', 'AvgSigStrPct', 'AvgSubAtt', 'AvgTDLanded', 'AvgTDPct',
+    'Wins', 'Losses', 'CurrentWinStreak', 'CurrentLoseStreak', 'LongestWinStreak',
+    'TotalRoundsFought', 'WinsByKO', 'WinsBySubmission', 'HeightCms', 'ReachCms', 'WeightLbs', 'Age',
+]
+XGB_PARAMS = {'max_depth': 4, 'learning_rate': 0.1, 'n_estimators': 100}
+
+# ufc-master's Finish codes as the methods mathmodel understands
+FINISH_METHODS = {
+    'U-DEC': 'Decision - Unanimous', 'S-DEC': 'Decision - Split', 'M-DEC': 'Decision - Majority',
+    'KO/TKO': 'KO/TKO', 'SUB': 'Submission', 'DQ': 'DQ', 'Overturned': 'Overturned',
+}
+MODELS = ('xgboost', 'mathmodel')
+CALIBRATION_BINS = 10
+
+
+def load_bouts(path=MASTER_CSV):
+    """Return one row per bout, oldest first, with ``red_win`` as the label."""
+    columns = ['Date', 'RedFighter', 'BlueFighter', 'Winner', 'RedOdds', 'BlueOdds', 'Finish', 'Country',
+               'RMatchWCRank', 'BMatchWCRank']
+    columns += [f'{side}{stat}' for stat in MASTER_STATS for side in ('Red', 'Blue')]
+    bouts = load_csv(path, columns)
+    bouts = bouts[bouts['Winner'].isin(['Red', 'Blue'])]
+    # The file is newest first; reverse before the stable sort to keep card order
+    bouts = bouts.iloc[::-1].sort_values('Date', kind='mergesort').reset_index(drop=True)
+    bouts['red_win'] = (bouts['Winner'] == 'Red').astype(int)
+    return bouts
+
+
+def fight_rows(bouts):
+    """Return both fighters' side of every bout in ``mathmodel``'s columns."""
+    method = bouts['Finish'].astype(object).map(FINISH_METHODS).fillna('')
+    sides = []
+    for side, other, win in (('Red', 'Blue', 1), ('Blue', 'Red', 0)):
+        opp_rank = bouts['RMatchWCRank' if other == 'Red' else 'BMatchWCRank']
+        sides.append(pd.DataFrame({
+            'fighter_id': bouts[f'{side}Fighter'].astype(str),
+            'opponent_id': bouts[f'{other}Fighter'].astype(str),
+            'result': np.where(bouts['red_win'] == win, 'Win', 'Loss'),
+            'method': method,
+            'date': bouts['Date'],
+            'opponent_rank': opp_rank,
+            'opponent_is_champ': (opp_rank == 0).to_numpy(),
+            'fighter_age': bouts[f'{side}Age'],
+            'fighter_total_losses': bouts[f'{side}Losses'],
+            'fight_country': bouts['Country'].astype(object),
+        }))
+    return pd.concat(sides, ignore_index=True)
+
+
+def walk_forward_folds(dates, folds=10, initial=0.5):
+    """Return ``(start, stop)`` row ranges of the test folds.
+
+    A boundary that falls inside an event is moved forward to the next
+    one, so a card is never split between training and testing.
+    """
+    dates = np.asarray(dates)
+    starts = np.linspace(max(int(len(dates) * initial), 1), len(dates), folds + 1).astype(int)[:-1]
+    mid_event = dates[starts - 1] == dates[starts]
+    starts = np.where(mid_event, np.searchsorted(dates, dates[starts], side='right'), starts)
+    edges = [int(s) for s in np.unique(starts) if s < len(dates)] + [len(dates)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def xgb_features(bouts):
+    return pd.DataFrame({
+        f'{stat}_diff': bouts[f'Red{stat}'].to_numpy(np.float64) - bouts[f'Blue{stat}'].to_numpy(np.float64)
+        for stat in MASTER_STATS
+    })
+
+
+def math_score_diffs(fights, bouts, cutoff, last_n=5):
+    """Return red minus blue MMA math scores for ``bouts``, using fights before ``cutoff``."""
+    history_rows = fights[fights['date'] < cutoff]
+    scores = score_all(history_rows, last_n).to_dict() if len(history_rows) else {}
+    history = FightHistory(history_rows, last_n) if len(history_rows) else None
+
+    def total(fighter, opponent):
+        score = scores.get(fighter, 0)
+        if history is not None:
+            score += history.relative_victory_score(fighter, opponent)
+        return score
+
+    red = bouts['RedFighter'].astype(str).tolist()
+    blue = bouts['BlueFighter'].astype(str).tolist()
+    return np.array([total(r, b) - total(b, r) for r, b in zip(red, blue)], dtype=float)
+
+
+def predict_xgboost(train, test, seed=0):
+    model = xgb.XGBClassifier(objective='binary:logistic', eval_metric='logloss', tree_method='hist',
+                              n_jobs=1, random_state=seed, verbosity=0, **XGB_PARAMS)
+    model.fit(xgb_features(train), train['red_win'])
+    return model.predict_proba(xgb_features(test))[:, 1]
+
+
+def predict_mathmodel(fights, train, test, calibration=0.2):
+    # Map score differences to probabilities with a logistic fit on the
+    # newest training bouts, scored the same way as the fold itself
+    calib = train.iloc[int(len(train) * (1 - calibration)):]
+    calib_diffs = math_score_diffs(fights, calib, calib['Date'].iloc[0])
+    test_diffs = math_score_diffs(fights, test, test['Date'].iloc[0])
+    if calib['red_win'].nunique() < 2:
+        return np.full(len(test), calib['red_win'].mean())
+    logistic = LogisticRegression().fit(calib_diffs.reshape(-1, 1), calib['red_win'])
+    return logistic.predict_proba(test_diffs.reshape(-1, 1))[:, 1]
+
+
+def decimal_odds(american):
+    american = np.asarray(american, dtype=float)
+    return np.where(american > 0, 1 + american / 100, 1 + 100 / np.abs(american))
+
+
+def betting_returns(y, p, red_odds, blue_odds):
+    """Return ``(flat_profit, flat_bets, value_profit, value_bets)`` for one-unit stakes."""
+    has_odds = ~(np.isnan(red_odds) | np.isnan(blue_odds))
+    y, p = np.asarray(y)[has_odds], np.asarray(p)[has_odds]
+    red_dec, blue_dec = decimal_odds(red_odds[has_odds]), decimal_odds(blue_odds[has_odds])
+    red_profit = np.where(y == 1, red_dec - 1, -1.0)
+    blue_profit = np.where(y == 0, blue_dec - 1, -1.0)
+
+    flat = np.where(p >= 0.5, red_profit, blue_profit)
+    red_edge = p - 1 / red_dec
+    blue_edge = (1 - p) - 1 / blue_dec
+    value_red = (red_edge > 0) & (red_edge >= blue_edge)
+    value_blue = (blue_edge > 0) & ~value_red
+    value = np.where(value_red, red_profit, 0.0) + np.where(value_blue, blue_profit, 0.0)
+    return float(flat.sum()), int(len(flat)), float(value.sum()), int((value_red | value_blue).sum())
+
+
+def calibration_table(y, p, bins=CALIBRATION_BINS):
+    """Return predicted vs. observed red-win rates per probability bin."""
+    y, p = np.asarray(y), np.asarray(p)
+    which = np.minimum((p * bins).astype(int), bins - 1)
+    rows = []
+    for b in range(bins):
+        mask = which == b
+        if mask.any():
+            rows.append({'bin': f'{b / bins:.1f}-{(b + 1) / bins:.1f}', 'count': int(mask.sum()),
+                         'predicted': float(p[mask].mean()), 'observed': float(y[mask].mean())})
+    return pd.DataFrame(rows)
+
+
+def score_predictions(y, p, red_odds, blue_odds):
+    y, p = np.asarray(y), np.clip(np.asarray(p, dtype=float), 1e-6, 1 - 1e-6)
+    table = calibration_table(y, p)
+    ece = float((table['count'] * (table['predicted'] - table['observed']).abs()).sum() / len(y))
+    flat, bets, value, value_bets = betting_returns(y, p, np.asarray(red_odds, float), np.asarray(blue_odds, float))
+    return {
+        'bouts': len(y),
+        'accuracy': float(accuracy_score(y, p >= 0.5)),
+        'log_loss': float(log_loss(y, p, labels=[0, 1])),
+        'brier': float(brier_score_loss(y, p)),
+        'ece': ece,
+        'roi': flat / bets if bets else np.nan,
+        'bets': bets,
+        'value_roi': value / value_bets if value_bets else np.nan,
+        'value_bets': value_bets,
+    }
+
+
+# Set once per worker process by _init_worker, so folds don't re-send the data
+_bouts = None
+_fights = None
+
+
+def _init_worker(bouts, fights):
+    global _bouts, _fights
+    _bouts, _fights = bouts, fights
+
+
+def run_fold(fold, start, stop, models=MODELS, seed=0):
+    """Train on bouts before ``start`` and predict ``start:stop``; returns per-bout predictions."""
+    train, test = _bouts.iloc[:start], _bouts.iloc[start:stop]
+    predictions = pd.DataFrame({
+        'fold': fold,
+        'Date': test['Date'].to_numpy(),
+        'red_win': test['red_win'].to_numpy(),
+        'RedOdds': test['RedOdds'].to_numpy(np.float64),
+        'BlueOdds': test['BlueOdds'].to_numpy(np.float64),
+    })
+    if 'xgboost' in models:
+        predictions['xgboost'] = predict_xgboost(train, test, seed)
+    if 'mathmodel' in models:
+        predictions['mathmodel'] = predict_mathmodel(_fights, train, test)
+    return predictions
+
+
+def backtest(path=MASTER_CSV, folds=10, initial=0.5, jobs=None, models=MODELS, seed=0):
+    """Run the walk-forward backtest; returns ``(report, predictions)`` DataFrames."""
+    bouts = load_bouts(path)
+    fights = fight_rows(bouts)
+    ranges = walk_forward_folds(bouts['Date'].to_numpy(), folds, initial)
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1, initializer=_init_worker,
+                             initargs=(bouts, fights)) as pool:
+        futures = [pool.submit(run_fold, i, start, stop, models, seed) for i, (start, stop) in enumerate(ranges)]
+        predictions = pd.concat([f.result() for f in futures], ignore_index=True)
+
+    rows = []
+    for model in models:
+        for fold, group in predictions.groupby('fold'):
+            rows.append({'model': model, 'fold': fold, 'start': group['Date'].min(), 'end': group['Date'].max(),
+                         **score_predictions(group['red_win'], group[model], group['RedOdds'], group['BlueOdds'])})
+        rows.append({'model': model, 'fold': 'all', 'start': predictions['Date'].min(),
+                     'end': predictions['Date'].max(),
+                     **score_predictions(predictions['red_win'], predictions[model],
+                                         predictions['RedOdds'], predictions['BlueOdds'])})
+    return pd.DataFrame(rows), predictions
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Walk-forward backtest on ufc-master.csv.")
+    parser.add_argument('--data', default=MASTER_CSV)
+    parser.add_argument('--folds', type=int, default=10)
+    parser.add_argument('--initial', type=float, default=0.5, help="share of bouts used only for training")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=list(MODELS))
+    parser.add_argument('--output', help="write the per-fold report to this CSV")
+    parser.add_argument('--calibration', action='store_true', help="also print calibration tables")
+    args = parser.parse_args(argv)
+
+    report, predictions = backtest(args.data, args.folds, args.initial, args.jobs, tuple(args.models))
+    with pd.option_context('display.width', 200, 'display.max_columns', None, 'display.precision', 3):
+        print(report.to_string(index=False))
+        if args.calibration:
+            for model in args.models:
+                print(f'\n{model} calibration')
+                print(calibration_table(predictions['red_win'], predictions[model]).to_string(index=False))
+    if args.output:
+        report.to_csv(args.output, index=False)
+
+
+if __name__ == '__main__':
+    main()
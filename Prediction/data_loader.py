@@ -0,0 +1,124 @@
+"""Memory-conscious loading of the historical fight CSVs.
+
+``Data/ufc-master.csv`` and the 1993-2019 historical file are wide (118
+and 161 columns) and keep growing, while each pipeline only needs a
+handful of their columns.  :func:`load_csv` reads just the requested
+columns with compact dtypes:
+
+* names, stances, weight classes and other labels -> ``category``
+* dates -> ``datetime64``
+* every other numeric column -> ``float32`` (counts included, so missing
+  values stay representable)
+
+Pass ``chunksize`` (or use :func:`iter_csv`) to stream the file as
+DataFrames of at most that many rows, so memory stays bounded by the
+chunk rather than the whole history::
+
+    for chunk in iter_csv(MASTER_CSV, ["RedFighter", "BlueFighter", "Winner"]):
+        ...
+
+Categorical chunks each carry their own categories;
+:func:`concat_chunks` unions them when the chunks are combined.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data")
+MASTER_CSV = os.path.join(DATA_DIR, "ufc-master.csv")
+HISTORICAL_CSV = os.path.join(DATA_DIR, "UFC-Fight_historical_data_from_1993_to_2019_1551_40.csv")
+
+DEFAULT_CHUNKSIZE = 50_000
+
+# Low-cardinality labels of both files
+CATEGORY_COLUMNS = {
+    "RedFighter", "BlueFighter", "R_fighter", "B_fighter", "Referee",
+    "Location", "location", "Country", "Winner", "winner", "WeightClass", "weight_class", "Gender",
+    "RedStance", "BlueStance", "R_Stance", "B_Stance",
+    "BetterRank", "Finish", "FinishDetails",
+}
+DATE_COLUMNS = {"Date", "date"}
+# Left to pandas: booleans and free-form text
+PASSTHROUGH_COLUMNS = {"TitleBout", "title_bout", "FinishRoundTime"}
+
+
+def read_header(path: str) -> list[str]:
+    """Return the column names of the CSV at ``path``."""
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def column_dtypes(columns: Iterable[str]) -> dict:
+    """Return the ``read_csv`` dtypes for ``columns`` (dates excluded)."""
+    dtypes = {}
+    for column in columns:
+        if column in CATEGORY_COLUMNS:
+            dtypes[column] = "category"
+        elif column not in DATE_COLUMNS and column not in PASSTHROUGH_COLUMNS:
+            dtypes[column] = "float32"
+    return dtypes
+
+
+def _read_kwargs(path: str, columns: Optional[Iterable[str]], dtypes: Optional[dict] = None) -> dict:
+    header = read_header(path)
+    if columns is None:
+        columns = header
+    else:
+        columns = list(columns)
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise KeyError(f"{os.path.basename(path)} has no column(s) {missing}")
+    return {
+        "usecols": columns,
+        "dtype": {**column_dtypes(columns), **(dtypes or {})},
+        "parse_dates": [c for c in columns if c in DATE_COLUMNS],
+    }
+
+
+def iter_csv(path: str, columns: Optional[Iterable[str]] = None,
+             chunksize: int = DEFAULT_CHUNKSIZE, dtypes: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+    """Yield ``path`` as DataFrames of up to ``chunksize`` rows, columns in ``columns`` order."""
+    kwargs = _read_kwargs(path, columns, dtypes)
+    with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            yield chunk[kwargs["usecols"]]
+
+
+def load_csv(path: str, columns: Optional[Iterable[str]] = None, chunksize: Optional[int] = None,
+             dtypes: Optional[dict] = None):
+    """Read ``columns`` of ``path`` with compact dtypes.
+
+    Returns a DataFrame, or a chunk iterator as :func:`iter_csv` when
+    ``chunksize`` is given.  Columns keep the order of ``columns``;
+    ``dtypes`` overrides the default dtype of individual columns.
+    """
+    if chunksize is not None:
+        return iter_csv(path, columns, chunksize, dtypes)
+    kwargs = _read_kwargs(path, columns, dtypes)
+    return pd.read_csv(path, **kwargs)[kwargs["usecols"]]
+
+
+def concat_chunks(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate chunks from :func:`iter_csv`, keeping categoricals categorical."""
+    chunks = list(chunks)
+    if not chunks:
+        return pd.DataFrame()
+    df = pd.concat(chunks, ignore_index=True)
+    for column in chunks[0].columns:
+        if isinstance(chunks[0][column].dtype, pd.CategoricalDtype):
+            df[column] = pd.Categorical(union_categoricals([c[column] for c in chunks]))
+    return df
+
+
+def load_master(columns: Optional[Iterable[str]] = None, chunksize: Optional[int] = None):
+    """Read ``Data/ufc-master.csv`` (one row per bout, newest first)."""
+    return load_csv(MASTER_CSV, columns, chunksize)
+
+
+def load_historical(columns: Optional[Iterable[str]] = None, chunksize: Optional[int] = None):
+    """Read the 1993-2019 historical fight file (one row per bout, newest first)."""
+    return load_csv(HISTORICAL_CSV, columns, chunksize)
@@ -0,0 +1,231 @@
+"""Train the fight-outcome XGBoost model outside the notebook.
+
+``python -m Prediction.train`` reproduces the Model 2.0 notebook and
+replaces the hand export of ``xgb_ufc_model.pkl``:
+
+1. load the red/blue pre-fight stats (``r_<col>`` / ``b_<col>`` for every
+   column in ``PRE_FIGHT_COLS``) and the winner,
+2. reverse the file so the oldest fight comes first,
+3. label red wins ``winner_binary = 1`` and build the ``<col>_diff``
+   features as red minus blue, the order the backend predicts in,
+4. search the hyperparameter grid in parallel worker processes, each
+   candidate using the ``hist`` tree method with early stopping on the
+   most recent part of the training fights,
+5. refit the best candidate on all training fights, score it on the
+   newest third, and write the model plus ``<model>.meta.json``.
+
+Workers train single-threaded, so ``--jobs`` bounds the CPU use of the
+whole search.  Each stage's wall time is printed and kept in the
+metadata.  ``--deploy`` also installs the model into ``webapp/backend``,
+where a running backend picks it up on its next reload.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import joblib
+import xgboost as xgb
+from joblib import Parallel, delayed
+from sklearn.metrics import accuracy_score, log_loss
+
+from Prediction.data_loader import load_csv, read_header
+
+PREDICTION_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(PREDICTION_DIR, "xgb_ufc_model.pkl")
+BACKEND_MODEL = os.path.join(os.path.dirname(PREDICTION_DIR), "webapp", "backend", "xgb_ufc_model.pkl")
+
+# Pre-fight stats of each corner; the model sees their red - blue diffs
+PRE_FIGHT_COLS = [
+    'SLpM_total', 'SApM_total', 'sig_str_acc_total', 'td_acc_total',
+    'str_def_total', 'td_def_total', 'sub_avg', 'td_avg',
+    'age', 'height', 'weight', 'reach', 'wins_total', 'losses_total'
+]
+DIFF_FEATURES = [f"{col}_diff" for col in PRE_FIGHT_COLS]
+
+PARAM_GRID = {
+    'max_depth': [3, 4, 5, 6],
+    'learning_rate': [0.03, 0.1, 0.3],
+    'min_child_weight': [1, 5],
+    'subsample': [0.8, 1.0],
+}
+MAX_ROUNDS = 1000
+EARLY_STOPPING_ROUNDS = 50
+
+
+class StageTimer:
+    """Records and prints the wall time of each named stage."""
+
+    def __init__(self):
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        yield
+        self.timings[name] = round(time.perf_counter() - start, 3)
+        print(f"{name}: {self.timings[name]:.2f}s")
+
+
+def load_fights(path):
+    """Return the features and ``winner_binary`` label, oldest fight first."""
+    header = read_header(path)
+    winner = 'winner' if 'winner' in header else 'Winner'
+    stat_columns = [f"{side}_{col}" for col in PRE_FIGHT_COLS for side in ('r', 'b')]
+    # float64 like the backend's fighter store, so diffs round the same way
+    df = load_csv(path, stat_columns + [winner], dtypes=dict.fromkeys(stat_columns, 'float64'))
+
+    # Reverse the dataset to begin with the oldest fight
+    df = df.iloc[::-1].reset_index(drop=True)
+
+    df['winner_binary'] = df[winner].map({'Red': 1, 'Blue': 0}).astype('float64')
+    for col in PRE_FIGHT_COLS:
+        df[f"{col}_diff"] = df[f"r_{col}"] - df[f"b_{col}"]
+
+    df = df.dropna(subset=DIFF_FEATURES + ['winner_binary']).reset_index(drop=True)
+    return df[DIFF_FEATURES], df['winner_binary'].astype(int)
+
+
+def chronological_split(X, y, fraction):
+    """Split off the newest ``1 - fraction`` of the fights."""
+    split_idx = int(len(X) * fraction)
+    return X.iloc[:split_idx], y.iloc[:split_idx], X.iloc[split_idx:], y.iloc[split_idx:]
+
+
+def param_grid(grid=PARAM_GRID):
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def make_model(params, n_estimators=MAX_ROUNDS, early_stopping=True, seed=0):
+    return xgb.XGBClassifier(
+        objective='binary:logistic',
+        eval_metric='logloss',
+        tree_method='hist',
+        n_estimators=n_estimators,
+        early_stopping_rounds=EARLY_STOPPING_ROUNDS if early_stopping else None,
+        n_jobs=1,
+        random_state=seed,
+        verbosity=0,
+        **params,
+    )
+
+
+def evaluate_candidate(params, X_fit, y_fit, X_val, y_val, seed=0):
+    """Fit one candidate with early stopping; return its validation score."""
+    model = make_model(params, seed=seed)
+    model.fit(X_fit, y_fit, eval_set=[(X_val, y_val)], verbose=False)
+    return {
+        'params': params,
+        'best_iteration': int(model.best_iteration),
+        'val_logloss': float(model.best_score),
+    }
+
+
+def search(X_train, y_train, grid=PARAM_GRID, jobs=None, seed=0):
+    """Score every grid candidate in parallel; return results, best first."""
+    X_fit, y_fit, X_val, y_val = chronological_split(X_train, y_train, 0.8)
+    results = Parallel(n_jobs=jobs or os.cpu_count() or 1)(
+        delayed(evaluate_candidate)(params, X_fit, y_fit, X_val, y_val, seed) for params in param_grid(grid)
+    )
+    return sorted(results, key=lambda r: r['val_logloss'])
+
+
+def _digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def metadata_path(model_path):
+    return os.path.splitext(model_path)[0] + '.meta.json'
+
+
+def _write_atomic(path, write):
+    tmp_path = path + '.tmp'
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def train(data_path, output=DEFAULT_OUTPUT, grid=PARAM_GRID, jobs=None, seed=0, deploy=False):
+    """Run the whole pipeline and return the metadata it wrote."""
+    timer = StageTimer()
+
+    with timer.stage('load'):
+        X, y = load_fights(data_path)
+        X_train, y_train, X_test, y_test = chronological_split(X, y, 2 / 3)
+
+    with timer.stage('search'):
+        results = search(X_train, y_train, grid, jobs, seed)
+        best = results[0]
+
+    with timer.stage('fit'):
+        model = make_model(best['params'], n_estimators=best['best_iteration'] + 1, early_stopping=False,
+                           seed=seed)
+        model.set_params(n_jobs=jobs or os.cpu_count() or 1)
+        model.fit(X_train, y_train)
+
+    with timer.stage('evaluate'):
+        proba = model.predict_proba(X_test)[:, 1]
+        metrics = {
+            'test_accuracy': float(accuracy_score(y_test, proba >= 0.5)),
+            'test_logloss': float(log_loss(y_test, proba, labels=[0, 1])),
+            'val_logloss': best['val_logloss'],
+        }
+        print(f"Accuracy: {metrics['test_accuracy']:.4f}  log-loss: {metrics['test_logloss']:.4f}")
+
+    with timer.stage('save'):
+        model.set_params(n_jobs=None)
+        _write_atomic(output, lambda path: joblib.dump(model, path))
+        meta = {
+            'version': hashlib.sha256(_digest(output).encode()).hexdigest()[:12],
+            'trained_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'data': {'path': os.path.basename(data_path), 'sha256': _digest(data_path),
+                     'train_rows': len(X_train), 'test_rows': len(X_test)},
+            'features': DIFF_FEATURES,
+            'params': best['params'],
+            'n_estimators': best['best_iteration'] + 1,
+            'candidates': len(results),
+            'metrics': metrics,
+            'xgboost': xgb.__version__,
+        }
+
+    meta['timings'] = timer.timings
+    _write_atomic(metadata_path(output), lambda path: _dump_json(meta, path))
+    if deploy:
+        # The backend watches the pickle, so it goes in last
+        _write_atomic(metadata_path(BACKEND_MODEL), lambda path: _dump_json(meta, path))
+        _write_atomic(BACKEND_MODEL, lambda path: shutil.copyfile(output, path))
+    return meta
+
+
+def _dump_json(data, path):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the fight-outcome XGBoost model.")
+    parser.add_argument('--data', required=True, help="CSV with r_/b_ pre-fight stats and the winner")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--jobs', type=int, default=None, help="parallel search workers (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--deploy', action='store_true', help="also install the model into webapp/backend")
+    args = parser.parse_args()
+
+    meta = train(args.data, args.output, jobs=args.jobs, seed=args.seed, deploy=args.deploy)
+    print(f"Wrote {args.output} (version {meta['version']}) in {sum(meta['timings'].values()):.1f}s")
+
+
+if __name__ == '__main__':
+    main()
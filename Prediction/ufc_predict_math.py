@@ -8,6 +8,7 @@ optionally adjusted with "MMA math" relative victory bonuses.
 """
 
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------
@@ -89,41 +90,174 @@ def _base_score(last_fights: pd.DataFrame) -> int:
     return score
 
 
-def _relative_victory_score(df: pd.DataFrame, fighter_a: int, fighter_b: int, last_n: int = 5) -> int:
-    """Return bonus points for fighter ``fighter_a`` over ``fighter_b``."""
+class FightHistory:
+    """Index of every fighter's last ``last_n`` fights for MMA-math bonuses.
 
-    a_fights = _get_last_fights(df, fighter_a, last_n)
-    b_fights = _get_last_fights(df, fighter_b, last_n)
+    The fights are sorted once by fighter and date.  Each fighter keeps
+    ``records`` of ``(date, opponent_id, result)`` in chronological order,
+    the opponents they beat, and a map of the opponents they lost to, so
+    the bonus for a pair is a handful of dict lookups instead of DataFrame
+    filters.  A loss counts as avenged when the fighter beat that opponent
+    later in the window.
+    """
 
-    score = 0
-    for _, row in a_fights[a_fights["result"] == "Win"].iterrows():
-        opp = row.get("opponent_id")
-        if pd.isna(opp):
-            continue
-        b_losses = b_fights[(b_fights["opponent_id"] == opp) & (b_fights["result"] == "Loss")]
-        if b_losses.empty:
-            continue
-        loss_index = b_losses.index[0]
-        avenged = not b_fights[(b_fights["opponent_id"] == opp) & (b_fights["result"] == "Win") & (b_fights.index > loss_index)].empty
-        score += 1 if avenged else 5
+    def __init__(self, df: pd.DataFrame, last_n: int = 5):
+        if "date" in df.columns:
+            df = df.sort_values(["fighter_id", "date"], kind="mergesort")
+        else:
+            df = df.sort_values("fighter_id", kind="mergesort")
+        fights = df.groupby("fighter_id", sort=False).tail(last_n)
+
+        dates = fights["date"] if "date" in fights.columns else pd.Series(None, index=fights.index)
+        self.records: dict = {}
+        self.wins_over: dict = {}
+        self.losses_to: dict = {}
+        self.avenged: dict = {}
+        self.beaten_by: dict = {}
+        for fighter, date, opp, result in zip(fights["fighter_id"], dates, fights["opponent_id"], fights["result"]):
+            self.records.setdefault(fighter, []).append((date, opp, result))
+            if pd.isna(opp):
+                continue
+            if result == "Win":
+                self.wins_over.setdefault(fighter, []).append(opp)
+                self.beaten_by.setdefault(opp, []).append(fighter)
+                if opp in self.losses_to.get(fighter, ()):
+                    self.avenged.setdefault(fighter, set()).add(opp)
+            elif result == "Loss":
+                self.losses_to.setdefault(fighter, {}).setdefault(opp, len(self.records[fighter]) - 1)
+
+    def relative_victory_score(self, fighter_a: int, fighter_b: int) -> int:
+        """Return bonus points for ``fighter_a`` over ``fighter_b``."""
+        losses = self.losses_to.get(fighter_b)
+        if not losses:
+            return 0
+        avenged = self.avenged.get(fighter_b, ())
+        return sum(1 if opp in avenged else 5 for opp in self.wins_over.get(fighter_a, ()) if opp in losses)
+
+    def bonus_matrix(self, fighter_ids=None) -> pd.DataFrame:
+        """Return the bonus of every fighter (rows) over every other (columns)."""
+        ids = list(self.records) if fighter_ids is None else list(fighter_ids)
+        pos = {fighter: i for i, fighter in enumerate(ids)}
+        matrix = np.zeros((len(ids), len(ids)), dtype=int)
+        # Walk each fighter's losses and credit whoever beat the same opponent
+        for fighter_b, col in pos.items():
+            avenged = self.avenged.get(fighter_b, ())
+            for opp in self.losses_to.get(fighter_b, ()):
+                points = 1 if opp in avenged else 5
+                for fighter_a in self.beaten_by.get(opp, ()):
+                    row = pos.get(fighter_a)
+                    if row is not None:
+                        matrix[row, col] += points
+        return pd.DataFrame(matrix, index=ids, columns=ids)
+
+
+def _relative_victory_score(df: pd.DataFrame, fighter_a: int, fighter_b: int, last_n: int = 5,
+                            history: Optional[FightHistory] = None) -> int:
+    """Return bonus points for fighter ``fighter_a`` over ``fighter_b``."""
+
+    if history is None:
+        history = FightHistory(df[df["fighter_id"].isin([fighter_a, fighter_b])], last_n)
+    return history.relative_victory_score(fighter_a, fighter_b)
 
-    return score
 
+def mathmodel(df: pd.DataFrame, fighter_id: int, opponent_id: Optional[int] = None, last_n: int = 5,
+              history: Optional[FightHistory] = None) -> int:
+    """Compute the total MMA math score for ``fighter_id``.
 
-def mathmodel(df: pd.DataFrame, fighter_id: int, opponent_id: Optional[int] = None, last_n: int = 5) -> int:
-    """Compute the total MMA math score for ``fighter_id``."""
+    Pass a :class:`FightHistory` built from ``df`` with the same ``last_n``
+    to reuse it across many matchups.
+    """
 
     last_fights = _get_last_fights(df, fighter_id, last_n)
     score = _base_score(last_fights)
 
     if opponent_id is not None:
-        score += _relative_victory_score(df, fighter_id, opponent_id, last_n)
+        score += _relative_victory_score(df, fighter_id, opponent_id, last_n, history)
 
     return score
 
 
-def adjusted_scores(df: pd.DataFrame, fighter_a: int, fighter_b: int, last_n: int = 5) -> tuple[int, int]:
+def _column(df: pd.DataFrame, name: str, default=None) -> pd.Series:
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def score_all(df: pd.DataFrame, last_n: int = 5) -> pd.Series:
+    """Return the base ``mathmodel`` score of every fighter in ``df``.
+
+    Equivalent to ``mathmodel(df, fighter_id, last_n=last_n)`` for each
+    ``fighter_id``, but sorts and groups the fights once and scores them
+    with array operations instead of filtering and walking rows per
+    fighter.  The result is indexed by ``fighter_id``.
+    """
+
+    if "date" in df.columns:
+        df = df.sort_values(["fighter_id", "date"], kind="mergesort")
+    else:
+        df = df.sort_values("fighter_id", kind="mergesort")
+    fights = df.groupby("fighter_id", sort=False).tail(last_n)
+    if fights.empty:
+        return pd.Series([], index=pd.Index([], name="fighter_id"), name="score", dtype=int)
+
+    fighter = fights["fighter_id"].to_numpy()
+    result = _column(fights, "result", "")
+    win = (result == "Win").to_numpy()
+    loss = (result == "Loss").to_numpy()
+    method = _column(fights, "method", "").fillna("").astype(str)
+    finish = ((method != "") & ~method.str.lower().str.contains("decision", regex=False)).to_numpy()
+
+    # Truthiness as in mathmodel: bool(value), so a missing (NaN) flag counts
+    champ = _column(fights, "opponent_is_champ", False).astype(bool).to_numpy()
+    shutout = _column(fights, "two_judges_all_rounds").astype(bool).to_numpy()
+    rank = np.trunc(pd.to_numeric(_column(fights, "opponent_rank"), errors="coerce").to_numpy(dtype=float))
+    ranked = (rank >= 0) & (rank <= 15)
+    rank_points = np.where(champ, RANK_POINTS[0], np.where(ranked, 16 - np.nan_to_num(rank), 0))
+
+    # Length of the finishing streak each finish belongs to so far: distance
+    # to the last row that broke the streak (or the row before the fighter's
+    # first fight)
+    n = len(fights)
+    pos = np.arange(n)
+    first = np.ones(n, dtype=bool)
+    first[1:] = fighter[1:] != fighter[:-1]
+    finish_win = win & finish
+    breaks = np.where(~finish_win, pos, np.where(first, pos - 1, -1))
+    streak = pos - np.maximum.accumulate(breaks)
+
+    points = np.where(win, rank_points, 0)
+    points = points + np.where(finish_win, 4 + streak, 0)
+    points = points + np.where(win & ~finish & shutout, 5, 0)
+    points = points - np.where(loss, np.where(finish, 3, 2), 0)
+
+    group = np.cumsum(first) - 1
+    ids = fighter[first]
+    score = np.bincount(group, weights=points, minlength=len(ids))
+
+    last = np.flatnonzero(np.r_[first[1:], True])
+    age = pd.to_numeric(_column(fights, "fighter_age"), errors="coerce").to_numpy(dtype=float)[last]
+    score -= np.where(age > 35, 5 + np.trunc(np.nan_to_num(age - 35)), 0)
+
+    total_losses = pd.to_numeric(_column(fights, "fighter_total_losses"), errors="coerce").to_numpy(dtype=float)[last]
+    no_loss_in_window = np.bincount(group, weights=loss, minlength=len(ids)) == 0
+    score += np.where(np.trunc(total_losses) == 0, 5, np.where(no_loss_in_window, 3, 0))
+
+    ccol = "fight_country" if "fight_country" in fights.columns else "location_country"
+    if ccol in fights.columns:
+        country = _column(fights, "fighter_country")
+        home = country.iloc[last].to_numpy()
+        at_home = (fights[ccol].to_numpy() == home[group]) & pd.notna(home[group])
+        foreign = pd.notna(home) & ~np.isin(home, ["USA", "United States"])
+        score += np.where(foreign & (np.bincount(group, weights=at_home, minlength=len(ids)) > 0), 5, 0)
+
+    return pd.Series(score.astype(int), index=pd.Index(ids, name="fighter_id"), name="score")
+
+
+def adjusted_scores(df: pd.DataFrame, fighter_a: int, fighter_b: int, last_n: int = 5,
+                    history: Optional[FightHistory] = None) -> tuple[int, int]:
     """Return scores for both fighters in a matchup."""
-    score_a = mathmodel(df, fighter_a, opponent_id=fighter_b, last_n=last_n)
-    score_b = mathmodel(df, fighter_b, opponent_id=fighter_a, last_n=last_n)
+    if history is None:
+        history = FightHistory(df[df["fighter_id"].isin([fighter_a, fighter_b])], last_n)
+    score_a = mathmodel(df, fighter_a, opponent_id=fighter_b, last_n=last_n, history=history)
+    score_b = mathmodel(df, fighter_b, opponent_id=fighter_a, last_n=last_n, history=history)
     return score_a, score_b
\ No newline at end of file
@@ -4,6 +4,7 @@ USE ufc_data;
 -- Initialize Starter DB
 CREATE TABLE ufc_fighters (
     id INT AUTO_INCREMENT NOT NULL,
+    ufcstats_id VARCHAR(32),
     name VARCHAR(30),
     nickname VARCHAR(30),
     dob VARCHAR(30),
@@ -25,7 +26,46 @@ CREATE TABLE ufc_fighters (
     TD_Acc INT NOT NULL,
     TD_Def INT NOT NULL,
     Sub_Avg DECIMAL(5,2) NOT NULL,
-    PRIMARY KEY (id)	
+    -- Lookup key matching the backend's normalize_name(); that also collapses
+    -- inner whitespace, which BatchWriter does to names before inserting them
+    name_normalized VARCHAR(30) AS (LOWER(TRIM(name))) STORED,
+    PRIMARY KEY (id),
+    UNIQUE KEY uq_ufc_fighters_ufcstats_id (ufcstats_id),
+    KEY idx_ufc_fighters_name_normalized (name_normalized),
+    FULLTEXT KEY ft_ufc_fighters_name (name, nickname)
+);
+
+-- Existing databases: add the natural key used by the scraper's upserts
+-- ALTER TABLE ufc_fighters
+--     ADD COLUMN ufcstats_id VARCHAR(32) AFTER id,
+--     ADD UNIQUE KEY uq_ufc_fighters_ufcstats_id (ufcstats_id);
+-- ALTER TABLE ufc_fighters
+--     ADD COLUMN name_normalized VARCHAR(30) AS (LOWER(TRIM(name))) STORED,
+--     ADD KEY idx_ufc_fighters_name_normalized (name_normalized),
+--     ADD FULLTEXT KEY ft_ufc_fighters_name (name, nickname);
+
+-- Fight history, one row per fighter per bout, upserted by the scrapers'
+-- stats crawls (db_writer.fight_writer) on (fighter_id, fight_url)
+CREATE TABLE fights (
+    id INT AUTO_INCREMENT NOT NULL,
+    fighter_id INT NOT NULL,
+    opponent VARCHAR(60) NOT NULL,
+    opponent_id INT,
+    result VARCHAR(10) NOT NULL,
+    method VARCHAR(60),
+    round INT,
+    time VARCHAR(10),
+    event VARCHAR(120),
+    event_date DATE,
+    event_url VARCHAR(255),
+    fight_url VARCHAR(255),
+    opponent_rank INT,
+    title_bout BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (id),
+    UNIQUE KEY uq_fights_fighter_fight (fighter_id, fight_url),
+    KEY idx_fights_fighter_date (fighter_id, event_date),
+    KEY idx_fights_opponent (opponent_id),
+    CONSTRAINT fk_fights_fighter FOREIGN KEY (fighter_id) REFERENCES ufc_fighters (id) ON DELETE CASCADE
 );
 
 SELECT * FROM ufc_data.ufc_fighters LIMIT 5000;
@@ -36,29 +76,66 @@ SELECT user FROM mysql.user;
 
 USE ufc_data;
 
-CREATE VIEW clean_ufc_fights AS
-SELECT *
-FROM ufc_data.ufc_fighters
-WHERE 
-    age IS NOT NULL
-        AND NOT (
-        SLpM = 0.00 AND
-        Str_Acc = 0 AND
-        SApM = 0.00 AND
-        Str_Def = 0 AND
-        TD_Avg = 0.00 AND
-        TD_Acc = 0 AND
-        TD_Def = 0 AND
-        Sub_Avg = 0.00
-    );
+-- clean_ufc_fights used to be a view, re-filtering the whole table on every
+-- lookup. It is now a real table with its own indexes, rebuilt after each
+-- crawl with CALL refresh_clean_ufc_fights().
+DROP VIEW IF EXISTS clean_ufc_fights;
+
+CREATE TABLE IF NOT EXISTS clean_ufc_fights LIKE ufc_fighters;
+
+CREATE TABLE IF NOT EXISTS clean_ufc_fights_refresh (
+    id INT AUTO_INCREMENT NOT NULL,
+    refreshed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    fighters INT NOT NULL,
+    PRIMARY KEY (id)
+);
+
+DELIMITER //
+CREATE PROCEDURE refresh_clean_ufc_fights()
+BEGIN
+    -- Build the new copy aside and swap it in with one atomic RENAME, so
+    -- readers never see a half-filled table
+    DROP TABLE IF EXISTS clean_ufc_fights_new, clean_ufc_fights_old;
+    CREATE TABLE clean_ufc_fights_new LIKE ufc_fighters;
+    -- name_normalized is generated, so the other columns are listed
+    INSERT INTO clean_ufc_fights_new (
+        id, ufcstats_id, name, nickname, dob, age, height, weight, reach, stance,
+        winstreak, wins, losses, draws, belt,
+        SLpM, Str_Acc, SApM, Str_Def, TD_Avg, TD_Acc, TD_Def, Sub_Avg
+    )
+    SELECT
+        id, ufcstats_id, name, nickname, dob, age, height, weight, reach, stance,
+        winstreak, wins, losses, draws, belt,
+        SLpM, Str_Acc, SApM, Str_Def, TD_Avg, TD_Acc, TD_Def, Sub_Avg
+    FROM ufc_data.ufc_fighters
+    WHERE 
+        age IS NOT NULL
+            AND NOT (
+            SLpM = 0.00 AND
+            Str_Acc = 0 AND
+            SApM = 0.00 AND
+            Str_Def = 0 AND
+            TD_Avg = 0.00 AND
+            TD_Acc = 0 AND
+            TD_Def = 0 AND
+            Sub_Avg = 0.00
+        );
+    RENAME TABLE clean_ufc_fights TO clean_ufc_fights_old,
+                 clean_ufc_fights_new TO clean_ufc_fights;
+    DROP TABLE clean_ufc_fights_old;
+    INSERT INTO clean_ufc_fights_refresh (fighters) SELECT COUNT(*) FROM clean_ufc_fights;
+END //
+DELIMITER ;
+
+CALL refresh_clean_ufc_fights();
 
 SELECT * FROM ufc_data.clean_ufc_fights LIMIT 5000;
 
 
--- ID search for live prediction
+-- ID search for live prediction (indexed; see webapp/backend/fighter_db.py)
 SELECT * FROM ufc_data.clean_ufc_fights
-WHERE name LIKE '%Pereira%';
+WHERE name_normalized = 'alex pereira';
 
 SELECT * FROM ufc_data.clean_ufc_fights
-WHERE name LIKE '%Ankalaev%';
+WHERE MATCH(name, nickname) AGAINST ('+Ankalaev*' IN BOOLEAN MODE);
 
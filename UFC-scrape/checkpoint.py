@@ -0,0 +1,163 @@
+"""Durable crawl frontier so a crashed scrape can resume where it stopped.
+
+A :class:`CrawlCheckpoint` records the letter tabs and listing pages that
+are finished and the profile URLs already written, in a small JSON file
+that is replaced atomically on every save.  For CSV output it also records
+how many bytes of the file were flushed at that moment; on ``--resume``
+the CSV is cut back to that length and reopened for appending, so rows
+are never duplicated or left half-written even if the crash happened
+between a write and the next save.
+
+Typical use::
+
+    checkpoint = CrawlCheckpoint.for_output("scores.csv", resume=args.resume)
+    csvfile, writer = checkpoint.open_csv("scores.csv", fieldnames)
+    ...
+    checkpoint.mark_profile(url)     # after the row is written
+    checkpoint.mark_page(letter_url, page)
+    checkpoint.mark_letter(letter_url)
+    ...
+    checkpoint.finish()
+"""
+
+import csv
+import json
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def page_url(letter_url, page):
+    """Return ``letter_url`` pointing at listing page ``page``.
+
+    Page 1 is the letter URL itself, unchanged; only later pages (when
+    resuming) get their ``page`` parameter set.
+    """
+    if page <= 1:
+        return letter_url
+    parts = urlsplit(letter_url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class CrawlCheckpoint:
+    """Completed letters, pages and profiles of one crawl."""
+
+    def __init__(self, path, state=None, save_every=20):
+        self.path = path
+        self.save_every = save_every
+        self.resumed = state is not None
+        state = state or {}
+        self.letters_done = set(state.get("letters_done", []))
+        self.pages_done = dict(state.get("pages_done", {}))
+        self.profiles_done = set(state.get("profiles_done", []))
+        self.output_bytes = state.get("output_bytes")
+        self.output = None
+        # Called first on every save, e.g. to commit buffered DB rows so the
+        # checkpoint never runs ahead of what is stored
+        self.before_save = None
+        self._unsaved = 0
+
+    @classmethod
+    def load(cls, path, resume=False, save_every=20):
+        """Continue the checkpoint at ``path`` if ``resume``, else start afresh."""
+        if resume and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return cls(path, json.load(f), save_every)
+        if os.path.exists(path):
+            os.remove(path)
+        return cls(path, save_every=save_every)
+
+    @classmethod
+    def for_output(cls, output_path, resume=False, save_every=20):
+        return cls.load(output_path + ".checkpoint.json", resume, save_every)
+
+    # --- output -------------------------------------------------------------
+
+    def open_csv(self, output_path, fieldnames):
+        """Open ``output_path`` for writing and return ``(file, DictWriter)``.
+
+        When resuming, the file is cut back to the length recorded at the
+        last save and appended to; otherwise it is rewritten from scratch.
+        """
+        if self.resumed and self.output_bytes is not None and os.path.exists(output_path):
+            with open(output_path, "r+b") as f:
+                f.truncate(self.output_bytes)
+            csvfile = open(output_path, "a", newline="", encoding="utf-8")
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        else:
+            csvfile = open(output_path, "w", newline="", encoding="utf-8")
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+        self.output = csvfile
+        return csvfile, writer
+
+    # --- frontier -----------------------------------------------------------
+
+    def letter_done(self, letter_url):
+        return letter_url in self.letters_done
+
+    def next_page(self, letter_url):
+        """Return the first listing page of ``letter_url`` still to scrape."""
+        return self.pages_done.get(letter_url, 0) + 1
+
+    def profile_done(self, profile_url):
+        return profile_url in self.profiles_done
+
+    def mark_profile(self, profile_url):
+        self.profiles_done.add(profile_url)
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
+
+    def mark_profiles(self, profile_urls):
+        """Record a batch of stored profiles and save once."""
+        self.profiles_done.update(profile_urls)
+        self.save()
+
+    def mark_page(self, letter_url, page):
+        self.pages_done[letter_url] = page
+        self.save()
+
+    def mark_letter(self, letter_url):
+        self.letters_done.add(letter_url)
+        self.save()
+
+    # --- persistence --------------------------------------------------------
+
+    def save(self):
+        """Flush the output and atomically write the frontier next to it."""
+        if self.before_save is not None:
+            self.before_save()
+        if self.output is not None:
+            self.output.flush()
+            os.fsync(self.output.fileno())
+            self.output_bytes = self.output.tell()
+        state = {
+            "letters_done": sorted(self.letters_done),
+            "pages_done": self.pages_done,
+            "profiles_done": sorted(self.profiles_done),
+            "output_bytes": self.output_bytes,
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+    def close(self):
+        """Save and close the output, keeping the checkpoint for ``--resume``."""
+        if self.output is not None:
+            self.save()
+            self.output.close()
+            self.output = None
+
+    def finish(self):
+        """Close the output and drop the checkpoint after a complete crawl."""
+        if self.output is not None:
+            self.output.close()
+            self.output = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
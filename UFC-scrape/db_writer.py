@@ -0,0 +1,209 @@
+"""Batched, idempotent writes of scraped fighters to the database.
+
+:class:`BatchWriter` buffers rows and writes each batch with a single
+``executemany`` and one commit, instead of a round trip and a commit per
+fighter.  Rows are upserted on ``ufcstats_id`` (the id at the end of the
+fighter's ufcstats profile URL), so a re-crawl updates fighters in place
+rather than duplicating them.  :func:`fight_writer` does the same for the
+``fights`` history table, keyed on ``(fighter_id, fight_url)``.
+
+Connections come from a ``mysql.connector`` pool configured through the
+``UFC_DB_*`` environment variables; the settings are shared with the
+backend and live in ``webapp/backend/db_settings.py``.
+
+The ``sqlite`` dialect writes the same statements to a SQLite connection
+for local runs and tests.
+"""
+
+import os
+import sys
+import threading
+import traceback
+from urllib.parse import urlsplit
+
+from dateutil.parser import parse as parse_date
+
+# The backend owns the connection settings; reuse them rather than a copy
+_BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "webapp", "backend")
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
+
+from db_settings import db_config, pool_size as default_pool_size  # noqa: E402
+
+FIGHTER_COLUMNS = [
+    "ufcstats_id", "name", "nickname", "dob", "age", "height", "weight", "reach", "stance",
+    "winstreak", "wins", "losses", "draws", "belt",
+    "SLpM", "Str_Acc", "SApM", "Str_Def", "TD_Avg", "TD_Acc", "TD_Def", "Sub_Avg",
+]
+# opponent_rank and title_bout need the fight-detail page, which the stats
+# crawls never open; they keep their defaults
+FIGHT_COLUMNS = [
+    "fighter_id", "opponent", "result", "method", "round", "time", "event", "event_date", "event_url", "fight_url",
+]
+# Fight rows carry the fighter's ufcstats id; the insert resolves the row id
+FIGHTER_ID_SQL = "(SELECT id FROM ufc_fighters WHERE ufcstats_id = {})"
+
+
+def connection_pool(config=None, pool_size=None):
+    """Return a ``MySQLConnectionPool`` for ``config`` (default: :func:`db_config`).
+
+    ``pool_size`` defaults to ``UFC_DB_POOL_SIZE``.
+    """
+    from mysql.connector import pooling
+
+    return pooling.MySQLConnectionPool(
+        pool_name="ufc_scrape",
+        pool_size=pool_size or default_pool_size(),
+        **(config or db_config()),
+    )
+
+
+def ufcstats_id(profile_url):
+    """Return the fighter id at the end of a ufcstats profile URL."""
+    if not profile_url:
+        return None
+    return urlsplit(profile_url).path.rstrip("/").rsplit("/", 1)[-1] or None
+
+
+def upsert_sql(table, columns, key, dialect="mysql", values=None):
+    """Return an ``INSERT`` that updates the existing row on a ``key`` clash.
+
+    ``key`` is a column or a tuple of columns.  ``values`` maps a column to
+    an SQL expression used instead of its bare placeholder (``{}``).
+    """
+    placeholder = "%s" if dialect == "mysql" else "?"
+    keys = (key,) if isinstance(key, str) else tuple(key)
+    updates = [c for c in columns if c not in keys]
+    exprs = [(values or {}).get(c, "{}").format(placeholder) for c in columns]
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(exprs)})"
+    if dialect == "mysql":
+        return sql + " ON DUPLICATE KEY UPDATE " + ", ".join(f"{c} = VALUES({c})" for c in updates)
+    return sql + f" ON CONFLICT({', '.join(keys)}) DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in updates)
+
+
+def fight_record(profile_url, fight):
+    """Return the ``fights`` row for one parsed fight-history row of a profile.
+
+    ``fight`` has the keys of :func:`ufc_scrape_http.parse_profile`'s
+    ``fight_rows``.  Returns ``None`` for bouts without a fight-detail link,
+    which could not be upserted.
+    """
+    if not fight.get("fight_url"):
+        return None
+    try:
+        event_date = parse_date(fight["event_text"], fuzzy=True).date().isoformat()
+    except (KeyError, TypeError, ValueError, OverflowError):
+        event_date = None
+    return {
+        "fighter_id": ufcstats_id(profile_url),
+        "opponent": fight.get("opponent") or "",
+        "result": fight["result"],
+        "method": fight.get("method") or None,
+        "round": fight.get("round"),
+        "time": fight.get("time") or None,
+        "event": fight.get("event") or None,
+        "event_date": event_date,
+        "event_url": fight.get("event_url"),
+        "fight_url": fight["fight_url"],
+    }
+
+
+def refresh_clean_table(conn):
+    """Rebuild the materialized ``clean_ufc_fights`` table after a crawl."""
+    cursor = conn.cursor()
+    try:
+        cursor.callproc("refresh_clean_ufc_fights")
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+class BatchWriter:
+    """Buffer rows and upsert them ``batch_size`` at a time in one transaction.
+
+    ``on_commit`` is called with the ``token`` of every row once its batch
+    is committed, e.g. to checkpoint the profiles that are safely stored.
+    A batch that fails is rolled back and retried row by row, so one bad
+    row does not drop the rest.  ``depends_on`` is another writer flushed
+    before every batch, e.g. the fighters a batch of fights refers to.
+    Safe to share between threads.
+    """
+
+    def __init__(self, conn, table="ufc_fighters", columns=FIGHTER_COLUMNS, key="ufcstats_id",
+                 batch_size=500, dialect="mysql", on_commit=None, values=None, depends_on=None):
+        self.conn = conn
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.on_commit = on_commit
+        self.depends_on = depends_on
+        self.sql = upsert_sql(table, self.columns, key, dialect, values)
+        self.written = 0
+        self.failed = 0
+        self._rows = []
+        self._tokens = []
+        self._lock = threading.Lock()
+
+    def add(self, row, token=None):
+        """Queue ``row`` (a dict keyed by column) and flush when the batch is full."""
+        if isinstance(row.get("name"), str):
+            # Single-spaced, so the generated name_normalized matches the backend's normalize_name()
+            row = {**row, "name": " ".join(row["name"].split())}
+        with self._lock:
+            self._rows.append(tuple(row.get(c) for c in self.columns))
+            self._tokens.append(token)
+            if len(self._rows) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        if self.depends_on is not None:
+            self.depends_on.flush()
+        rows, tokens = self._rows, self._tokens
+        self._rows, self._tokens = [], []
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(self.sql, rows)
+            self.conn.commit()
+            committed = tokens
+        except Exception:
+            self.conn.rollback()
+            committed = []
+            for row, token in zip(rows, tokens):
+                try:
+                    cursor.execute(self.sql, row)
+                    self.conn.commit()
+                    committed.append(token)
+                except Exception:
+                    self.conn.rollback()
+                    self.failed += 1
+                    print(f"❌ Could not write row {row[:2]}")
+                    traceback.print_exc()
+        finally:
+            cursor.close()
+        self.written += len(committed)
+        if self.on_commit is not None:
+            self.on_commit([t for t in committed if t is not None])
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def fight_writer(conn, fighters, batch_size=500, dialect="mysql"):
+    """Return a :class:`BatchWriter` for ``fights`` that flushes ``fighters`` first.
+
+    Add :func:`fight_record` rows to it after their fighter's row.
+    """
+    return BatchWriter(conn, table="fights", columns=FIGHT_COLUMNS, key=("fighter_id", "fight_url"),
+                       batch_size=batch_size, dialect=dialect, values={"fighter_id": FIGHTER_ID_SQL},
+                       depends_on=fighters)
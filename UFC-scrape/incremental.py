@@ -0,0 +1,115 @@
+"""Incremental scraping: only revisit fighters whose record changed.
+
+The listing pages the scrapers already walk show every fighter's
+wins/losses/draws and belt.  After a typical event only a couple dozen of
+those change, so an incremental run compares each listing row with the
+previous output (a CSV written by ``ufc_scrape2.py`` /
+``ufc_scrape_http.py`` or the ``ufc_fighters`` MySQL table) and opens the
+profile and recent fights only for fighters who are new or whose record
+moved.  Everyone else keeps their previous row.
+
+Fighters are matched on ``(name, nickname)``, since the outputs carry no
+ufcstats id.
+"""
+
+import csv
+import os
+
+RECORD_FIELDS = ("wins", "losses", "draws")
+
+# Types of the scraped columns, so rows read back from a CSV match the ones
+# the scrapers build (and fit the typed ``ufc_fighters`` columns)
+INT_COLUMNS = {"age", "weight", "winstreak", "wins", "losses", "draws", "Str_Acc", "Str_Def", "TD_Acc", "TD_Def"}
+FLOAT_COLUMNS = {"reach", "SLpM", "SApM", "TD_Avg", "Sub_Avg"}
+BOOL_COLUMNS = {"belt"}
+
+
+def fighter_key(name, nickname=None):
+    return (" ".join((name or "").split()).lower(), (nickname or "").strip().lower())
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes"}
+    return bool(value)
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def typed_row(row):
+    """Return a CSV row with empty cells as ``None`` and scraped columns retyped."""
+    typed = {}
+    for column, value in row.items():
+        if value in {"", "--", None}:
+            typed[column] = None
+        elif column in INT_COLUMNS:
+            number = _as_float(value)
+            typed[column] = int(number) if number is not None else None
+        elif column in FLOAT_COLUMNS:
+            typed[column] = _as_float(value)
+        elif column in BOOL_COLUMNS:
+            typed[column] = _as_bool(value)
+        else:
+            typed[column] = value
+    return typed
+
+
+def load_csv_snapshot(path):
+    """Return ``{fighter_key: row}`` from a previous CSV (empty if missing).
+
+    Rows are typed like freshly scraped ones (see :func:`typed_row`).
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, newline="", encoding="utf-8") as f:
+        return {fighter_key(row["name"], row.get("nickname")): typed_row(row) for row in csv.DictReader(f)}
+
+
+def load_db_snapshot(cursor, table="ufc_fighters"):
+    """Return ``{fighter_key: row}`` for every row of ``table``.
+
+    Works with any DB-API cursor (mysql.connector, sqlite3).
+    """
+    cursor.execute(f"SELECT * FROM {table}")
+    columns = [d[0] for d in cursor.description]
+    snapshot = {}
+    for values in cursor.fetchall():
+        row = dict(zip(columns, values))
+        snapshot[fighter_key(row["name"], row.get("nickname"))] = row
+    return snapshot
+
+
+def record_changed(fighter, previous):
+    """Return ``True`` if ``fighter`` (a listing row) needs a fresh scrape.
+
+    ``belt`` is only compared when the previous output stored it (the
+    MMA-score CSV does not).
+    """
+    if previous is None:
+        return True
+    for field in RECORD_FIELDS:
+        if _as_int(fighter.get(field)) != _as_int(previous.get(field)):
+            return True
+    if "belt" in previous and "belt" in fighter:
+        return _as_bool(fighter["belt"]) != _as_bool(previous["belt"])
+    return False
+
+
+def previous_row(fighter, snapshot):
+    """Return the row to reuse for ``fighter``, or ``None`` if it must be scraped."""
+    if snapshot is None:
+        return None
+    previous = snapshot.get(fighter_key(fighter["name"], fighter.get("nickname")))
+    return None if record_changed(fighter, previous) else previous
@@ -0,0 +1,109 @@
+"""Persistent cache of parsed event and fight-detail pages.
+
+Every fighter's last five bouts point at an event page (read for the
+location country) and a fight-detail page (read for title/rank keywords).
+Both fighters of a bout, and every fighter on the same card, link to the
+same pages, so without a cache a crawl fetches each event page 20+ times.
+
+:class:`PageCache` stores the *parsed* result of a page in SQLite, keyed
+by URL, and treats entries older than ``ttl`` seconds as missing.  The
+file survives between crawls, so a re-run only fetches pages it has not
+seen recently.  It is safe to share between threads.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "page_cache.sqlite")
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Returned by :meth:`PageCache.get` for absent or expired URLs, since
+# ``None`` is a valid cached value (an event without a location)
+MISSING = object()
+
+
+class PageCache:
+    """URL -> JSON value store with a time-to-live."""
+
+    def __init__(self, path=DEFAULT_PATH, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._url_locks = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _read(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return MISSING
+        return json.loads(row[0])
+
+    def get(self, url):
+        """Return the cached value for ``url`` or :data:`MISSING`."""
+        value = self._read(url)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, url, value):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, value, fetched_at) VALUES (?, ?, ?)",
+                (url, json.dumps(value), time.time()),
+            )
+            self._conn.commit()
+
+    def cached(self, url, compute):
+        """Return the value for ``url``, calling ``compute()`` on a miss.
+
+        Threads asking for the same URL at once wait for the first one
+        instead of fetching the page again.
+        """
+        value = self.get(url)
+        if value is not MISSING:
+            return value
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+        with url_lock:
+            value = self._read(url)
+            if value is MISSING:
+                value = compute()
+                self.put(url, value)
+        return value
+
+    def purge_expired(self):
+        """Delete expired entries and return how many were removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+        return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -4,7 +4,13 @@ import re
 import traceback
 from datetime import datetime
 from dateutil.parser import parse as parse_date
-import mysql.connector
+import argparse
+
+from checkpoint import CrawlCheckpoint, page_url
+from db_writer import BatchWriter, connection_pool, fight_record, fight_writer, refresh_clean_table, ufcstats_id
+from incremental import fighter_key, load_db_snapshot, previous_row
+
+CHECKPOINT_PATH = "ufc_scrape.checkpoint.json"
 
 def sanitize(value, convert_func=None):
     """Converts '--' to None. If convert_func is provided, applies it to the sanitized value."""
@@ -12,7 +18,18 @@ def sanitize(value, convert_func=None):
         return None
     return convert_func(value) if convert_func else value
 
-def scrape_ufc_events():
+def scrape_ufc_events(incremental=False, resume=False, batch_size=100):
+    """Scrape every fighter into ``ufc_fighters`` and their last five bouts into ``fights``.
+
+    Rows are upserted on ``ufcstats_id`` in batches of ``batch_size`` over
+    a pooled connection configured by the ``UFC_DB_*`` environment
+    variables (see :mod:`db_writer`).  With ``incremental`` the listing
+    records are compared with the rows already in the table and only new
+    or changed fighters are scraped.  Every scraped fighter is
+    checkpointed once its rows are committed, so ``resume`` continues a
+    crawl that stopped part way.
+    """
+    checkpoint = CrawlCheckpoint.load(CHECKPOINT_PATH, resume, save_every=batch_size)
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         context = browser.new_context()
@@ -24,13 +41,13 @@ def scrape_ufc_events():
         letter_urls = []
 
         # MYSQL Connection
-        conn = mysql.connector.connect(
-            host='localhost',
-            user='root',
-            password='7b8f9m2e',
-            database='ufc_data'
-        )
+        conn = connection_pool().get_connection()
         cursor = conn.cursor()
+        snapshot = load_db_snapshot(cursor) if incremental else None
+        writer = BatchWriter(conn, batch_size=batch_size)
+        fights_writer = fight_writer(conn, writer, batch_size=batch_size)
+        # Saving the checkpoint commits the fighters first, then their fights
+        checkpoint.before_save = fights_writer.flush
 
         for link in letter_links:
             href = link.get_attribute("href")
@@ -39,8 +56,10 @@ def scrape_ufc_events():
                 letter_urls.append(full_url)
 
         for letter_url in letter_urls:
-            current_page = 1
-            page.goto(letter_url)
+            if checkpoint.letter_done(letter_url):
+                continue
+            current_page = checkpoint.next_page(letter_url)
+            page.goto(page_url(letter_url, current_page))
             print(f"\n Scraping letter tab: {letter_url}")
 
             while True:
@@ -59,6 +78,8 @@ def scrape_ufc_events():
                         lname = lname_el.inner_text().strip()
                         name = fname + " " + lname
                         profile_url = fname_el.get_attribute("href")
+                        if checkpoint.profile_done(profile_url):
+                            continue
 
                         nickname = cols[2].query_selector("a").inner_text().strip()
                         height = sanitize(cols[3].inner_text().strip())
@@ -70,6 +91,11 @@ def scrape_ufc_events():
                         draws = int(cols[9].inner_text().strip())
                         belt = bool(cols[10].query_selector("img") is not None)
 
+                        listing = {"name": name, "nickname": nickname, "wins": wins, "losses": losses, "draws": draws, "belt": belt}
+                        if previous_row(listing, snapshot) is not None:
+                            print(f"Unchanged: {name}")
+                            continue
+
                         SLpM = Str_Acc = SApM = Str_Def = TD_Avg = TD_Acc = TD_Def = Sub_Avg = "N/A"
                         DOB = Age = "N/A"
 
@@ -136,6 +162,8 @@ def scrape_ufc_events():
                             traceback.print_exc()
 
                         win_streak = 0
+                        streak_open = True
+                        fights = []
                         try:
                             profile_page.wait_for_selector("tbody.b-fight-details__table-body", timeout=5000)
                             fight_rows = profile_page.query_selector_all("tbody.b-fight-details__table-body tr")
@@ -148,13 +176,31 @@ def scrape_ufc_events():
                                 if not cells or len(cells) < 2:
                                     continue
 
-                                result_text = cells[0].inner_text().strip().capitalize()
+                                texts = [cell.inner_text().strip() for cell in cells[:7]]
+                                result_text = texts[0].capitalize()
 
                                 if result_text in {"", "--", "Scheduled"}:
                                     continue
-                                if result_text == "Win":
-                                    win_streak += 1
-                                elif result_text in {"Loss", "Draw", "Nc"}:
+                                if streak_open:
+                                    if result_text == "Win":
+                                        win_streak += 1
+                                    elif result_text in {"Loss", "Draw", "Nc"}:
+                                        streak_open = False
+                                if len(fights) < 5:
+                                    links = [cell.query_selector("a") for cell in cells[1:3]]
+                                    hrefs = [link.get_attribute("href") if link else None for link in links]
+                                    fights.append(fight_record(profile_url, {
+                                        "result": result_text,
+                                        "opponent": texts[1],
+                                        "event": texts[2] if len(texts) > 2 else "",
+                                        "event_text": texts[3] if len(texts) > 3 else "",
+                                        "method": sanitize(texts[4]) if len(texts) > 4 else None,
+                                        "round": sanitize(texts[5], int) if len(texts) > 5 else None,
+                                        "time": sanitize(texts[6]) if len(texts) > 6 else None,
+                                        "fight_url": hrefs[0],
+                                        "event_url": hrefs[1] if len(hrefs) > 1 else None,
+                                    }))
+                                elif not streak_open:
                                     break
                         except Exception as e:
                             print("⚠️ Could not load or parse fight history for win streak:", e)
@@ -168,41 +214,44 @@ def scrape_ufc_events():
 
                         if page.is_closed():
                             page = context.new_page()
-                            page.goto(letter_url)
-
-
-                        # MYSQL Server Pipelining
-                        insert_query = """
-                        INSERT INTO ufc_fighters (
-                            name, nickname, dob, age, height, weight, reach, stance,
-                            winstreak, wins, losses, draws, belt,
-                            SLpM, Str_Acc, SApM, Str_Def, TD_Avg, TD_Acc, TD_Def, Sub_Avg
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        cursor.execute(insert_query, (
-                            name,
-                            nickname,
-                            DOB if DOB != "N/A" else None,
-                            Age if isinstance(Age, int) and Age >= 0 else None,
-                            height,
-                            weight,
-                            reach,
-                            stance,
-                            win_streak,
-                            wins,
-                            losses,
-                            draws,
-                            belt,
-                            SLpM if SLpM != "N/A" else 0.0,
-                            Str_Acc if Str_Acc != "N/A" else 0,
-                            SApM if SApM != "N/A" else 0.0,
-                            Str_Def if Str_Def != "N/A" else 0,
-                            TD_Avg if TD_Avg != "N/A" else 0.0,
-                            TD_Acc if TD_Acc != "N/A" else 0,
-                            TD_Def if TD_Def != "N/A" else 0,
-                            Sub_Avg if Sub_Avg != "N/A" else 0.0
-                        ))
-                        conn.commit()
+                            page.goto(page_url(letter_url, current_page))
+
+
+                        # Rows scraped before ufcstats_id existed can't be upserted; replace them
+                        stale = snapshot.get(fighter_key(name, nickname)) if snapshot else None
+                        if stale is not None and not stale.get("ufcstats_id"):
+                            cursor.execute("DELETE FROM ufc_fighters WHERE id = %s", (stale["id"],))
+                            conn.commit()
+
+                        # MYSQL Server Pipelining: buffered, upserted in batches
+                        writer.add({
+                            "ufcstats_id": ufcstats_id(profile_url),
+                            "name": name,
+                            "nickname": nickname,
+                            "dob": DOB if DOB != "N/A" else None,
+                            "age": Age if isinstance(Age, int) and Age >= 0 else None,
+                            "height": height,
+                            "weight": weight,
+                            "reach": reach,
+                            "stance": stance,
+                            "winstreak": win_streak,
+                            "wins": wins,
+                            "losses": losses,
+                            "draws": draws,
+                            "belt": belt,
+                            "SLpM": SLpM if SLpM != "N/A" else 0.0,
+                            "Str_Acc": Str_Acc if Str_Acc != "N/A" else 0,
+                            "SApM": SApM if SApM != "N/A" else 0.0,
+                            "Str_Def": Str_Def if Str_Def != "N/A" else 0,
+                            "TD_Avg": TD_Avg if TD_Avg != "N/A" else 0.0,
+                            "TD_Acc": TD_Acc if TD_Acc != "N/A" else 0,
+                            "TD_Def": TD_Def if TD_Def != "N/A" else 0,
+                            "Sub_Avg": Sub_Avg if Sub_Avg != "N/A" else 0.0,
+                        })
+                        for fight in fights:
+                            if fight is not None:
+                                fights_writer.add(fight)
+                        checkpoint.mark_profile(profile_url)
 
                         print(f"Full Name: {name} | DOB: {DOB} | Age: {Age} | Nickname: {nickname} | Height: {height} | Weight: {weight} | Reach: {reach} | Stance: {stance} | Winstreak: {win_streak} | Wins: {wins} | Losses: {losses} | Draws: {draws} | Belt: {belt} | SLpM: {SLpM} | Str. Acc: {Str_Acc} | SApM: {SApM} | Str. Def: {Str_Def} | TD Avg: {TD_Avg} | TD Acc: {TD_Acc} | TD Def: {TD_Def} | Sub. Avg: {Sub_Avg}")
 
@@ -211,6 +260,9 @@ def scrape_ufc_events():
                         traceback.print_exc()
                         continue
 
+                # A page only counts as done once its rows are committed
+                # (saving the checkpoint flushes both writers)
+                checkpoint.mark_page(letter_url, current_page)
                 page_links = page.query_selector_all("li.b-statistics__paginate-item")
                 next_link = None
 
@@ -229,8 +281,20 @@ def scrape_ufc_events():
                     page.wait_for_timeout(1500)
                 else:
                     print(F"ALL PAGES SCRAPED FOR LETTER: {letter_url.split('=')[-1].upper()}")
+                    checkpoint.mark_letter(letter_url)
                     break
 
+        fights_writer.close()
+        refresh_clean_table(conn)
+        conn.close()
+        checkpoint.finish()
         browser.close()
 
-scrape_ufc_events()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape ufcstats.com into the ufc_fighters MySQL table.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only re-scrape fighters whose record changed since the last run")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted crawl")
+    parser.add_argument("--batch-size", type=int, default=100, help="rows per INSERT batch")
+    args = parser.parse_args()
+    scrape_ufc_events(incremental=args.incremental, resume=args.resume, batch_size=args.batch_size)
@@ -14,12 +14,18 @@ Internet access to ``ufcstats.com`` and an installed Playwright runtime
 
 from playwright.sync_api import sync_playwright
 from urllib.parse import urljoin
+from contextlib import closing
+import argparse
 from datetime import datetime
 from dateutil.parser import parse as parse_date
-import csv
 import re
 import traceback
 
+from checkpoint import CrawlCheckpoint, page_url
+from incremental import load_csv_snapshot, previous_row
+from page_cache import DEFAULT_PATH as CACHE_PATH
+from page_cache import PageCache
+
 # --- Model scoring helpers --------------------------------------------------
 # Base values taken from the user's MMA math model description.
 
@@ -121,11 +127,64 @@ def compute_mma_score(fights, age, total_losses, country=None):
     return score
 
 
-def parse_recent_fights(profile_page):
+CHAMP_KEYWORDS = [
+    "title fight",
+    "title bout",
+    "championship bout",
+    "championship",
+    "world championship",
+    "ufc title",
+]
+RANK_RE = re.compile(r"(?:rank|ranked)\s*#?\s*(\d+)")
+BARE_RANK_RE = re.compile(r"#(\d+)")
+
+
+def parse_rank_text(body_text):
+    """Return ``(opponent_rank, opponent_is_champ)`` from a fight page's lowercased text.
+
+    Shared by every scraper engine so they read ranks the same way.
+    """
+    opponent_is_champ = any(k in body_text for k in CHAMP_KEYWORDS)
+    rank_match = RANK_RE.search(body_text) or BARE_RANK_RE.search(body_text)
+    opponent_rank = int(rank_match.group(1)) if rank_match else None
+    return opponent_rank, opponent_is_champ
+
+
+def event_country(context, event_link):
+    """Open an event page and return the country of its location."""
+    event_page = context.new_page()
+    try:
+        event_page.goto(event_link, timeout=10000)
+        event_page.wait_for_selector("li.b-list__box-list-item", timeout=5000)
+        for item in event_page.query_selector_all("li.b-list__box-list-item"):
+            label = (item.query_selector("strong") or item.query_selector("i"))
+            if label and "location" in label.inner_text().lower():
+                loc = item.inner_text().split(":")[-1].strip()
+                return loc.split(",")[-1].strip()
+    finally:
+        event_page.close()
+    return None
+
+
+def fight_rank(context, fight_link):
+    """Open a fight-detail page and return ``(opponent_rank, opponent_is_champ)``."""
+    fight_page = context.new_page()
+    try:
+        fight_page.goto(fight_link, timeout=10000)
+        fight_page.wait_for_selector("body", timeout=5000)
+        body_text = fight_page.inner_text("body").lower()
+    finally:
+        fight_page.close()
+    return parse_rank_text(body_text)
+
+
+def parse_recent_fights(profile_page, cache=None):
     """Return dictionaries describing the fighter's last five bouts.
 
     The logic mirrors the win-streak scraping in ``ufc_scrape.py`` but also
-    extracts additional details used by :func:`compute_mma_score`.
+    extracts additional details used by :func:`compute_mma_score`.  With a
+    :class:`page_cache.PageCache` the event and fight-detail pages are only
+    opened when their parsed values are not cached yet.
     """
 
     fights = []
@@ -169,16 +228,12 @@ def parse_recent_fights(profile_page):
                 event_link_el = cells[2].query_selector("a") if len(cells) > 2 else None
                 event_link = event_link_el.get_attribute("href") if event_link_el else None
                 if event_link:
-                    event_page = profile_page.context.new_page()
-                    event_page.goto(event_link, timeout=10000)
-                    event_page.wait_for_selector("li.b-list__box-list-item", timeout=5000)
-                    for item in event_page.query_selector_all("li.b-list__box-list-item"):
-                        label = (item.query_selector("strong") or item.query_selector("i"))
-                        if label and "location" in label.inner_text().lower():
-                            loc = item.inner_text().split(":")[-1].strip()
-                            location_country = loc.split(",")[-1].strip()
-                            break
-                    event_page.close()
+                    if cache is None:
+                        location_country = event_country(profile_page.context, event_link)
+                    else:
+                        location_country = cache.cached(
+                            event_link, lambda: event_country(profile_page.context, event_link)
+                        )
             except Exception:
                 traceback.print_exc()
 
@@ -189,28 +244,12 @@ def parse_recent_fights(profile_page):
                 fight_link_el = cells[1].query_selector("a")
                 fight_link = fight_link_el.get_attribute("href") if fight_link_el else None
                 if fight_link:
-                    fight_page = profile_page.context.new_page()
-                    fight_page.goto(fight_link, timeout=10000)
-                    fight_page.wait_for_selector("body", timeout=5000)
-                    body_text = fight_page.inner_text("body").lower()
-
-                    champ_keywords = [
-                        "title fight",
-                        "title bout",
-                        "championship bout",
-                        "championship",
-                        "world championship",
-                        "ufc title",
-                    ]
-                    if any(k in body_text for k in champ_keywords):
-                        opponent_is_champ = True
-
-                    rank_match = re.search(r"(?:rank|ranked)\s*#?\s*(\d+)", body_text)
-                    if not rank_match:
-                        rank_match = re.search(r"#(\d+)", body_text)
-                    if rank_match:
-                        opponent_rank = int(rank_match.group(1))
-                    fight_page.close()
+                    if cache is None:
+                        opponent_rank, opponent_is_champ = fight_rank(profile_page.context, fight_link)
+                    else:
+                        opponent_rank, opponent_is_champ = cache.cached(
+                            fight_link, lambda: fight_rank(profile_page.context, fight_link)
+                        )
             except Exception:
                 traceback.print_exc()
 
@@ -235,8 +274,19 @@ def parse_recent_fights(profile_page):
     return fights
 
 
-def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
-    """Main entry: scrape stats and MMA math score for every fighter."""
+def scrape_ufc_events(output_csv="fighter_mma_scores.csv", cache_path=CACHE_PATH, previous_csv=None, resume=False):
+    """Main entry: scrape stats and MMA math score for every fighter.
+
+    Parsed event and fight-detail pages are kept in the SQLite cache at
+    ``cache_path`` (``None`` disables it).  With ``previous_csv`` only
+    fighters whose listing record changed since that file are scraped
+    again; the others keep their previous row.  Progress is checkpointed
+    next to ``output_csv`` and ``resume=True`` continues a crawl that
+    stopped part way.
+    """
+    snapshot = load_csv_snapshot(previous_csv) if previous_csv else None
+    cache = PageCache(cache_path) if cache_path else None
+    checkpoint = CrawlCheckpoint.for_output(output_csv, resume)
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         context = browser.new_context()
@@ -252,7 +302,7 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
             if href and "char=" in href:
                 letter_urls.append(urljoin(base_url, href))
 
-        with open(output_csv, "w", newline="", encoding="utf-8") as csvfile:
+        with closing(checkpoint):
             fieldnames = [
                 "name",
                 "nickname",
@@ -262,12 +312,13 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
                 "draws",
                 "mma_score",
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            _, writer = checkpoint.open_csv(output_csv, fieldnames)
 
             for letter_url in letter_urls:
-                current_page = 1
-                page.goto(letter_url)
+                if checkpoint.letter_done(letter_url):
+                    continue
+                current_page = checkpoint.next_page(letter_url)
+                page.goto(page_url(letter_url, current_page))
                 print(f"\nScraping letter tab: {letter_url}")
                 while True:
                     print(f"Scraping page: {page.url}")
@@ -284,12 +335,23 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
                             lname = lname_el.inner_text().strip()
                             name = f"{fname} {lname}"
                             profile_url = fname_el.get_attribute("href")
+                            if checkpoint.profile_done(profile_url):
+                                continue
 
                             nickname = sanitize(cols[2].inner_text().strip())
                             wins = int(cols[7].inner_text().strip())
                             losses = int(cols[8].inner_text().strip())
                             draws = int(cols[9].inner_text().strip())
 
+                            previous = previous_row(
+                                {"name": name, "nickname": nickname, "wins": wins, "losses": losses, "draws": draws},
+                                snapshot,
+                            )
+                            if previous is not None:
+                                writer.writerow(previous)
+                                checkpoint.mark_profile(profile_url)
+                                continue
+
                             # --- scrape profile for age and recent fights ---
                             age = None
                             country = None
@@ -314,7 +376,7 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
                                         )
                                     elif "fighting out of" in label or "country" in label or "birth place" in label:
                                         country = value.split(",")[-1].strip()
-                                fights = parse_recent_fights(prof)
+                                fights = parse_recent_fights(prof, cache)
                             except Exception:
                                 traceback.print_exc()
                             finally:
@@ -326,7 +388,7 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
 
                             if page.is_closed():
                                 page = context.new_page()
-                                page.goto(letter_url)
+                                page.goto(page_url(letter_url, current_page))
 
                             mma_score = compute_mma_score(fights, age, losses, country)
                             writer.writerow({
@@ -338,11 +400,13 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
                                 "draws": draws,
                                 "mma_score": mma_score,
                             })
+                            checkpoint.mark_profile(profile_url)
                             print(f"{name} | Age: {age} | Record: {wins}-{losses}-{draws} | Rating: {mma_score}")
                         except Exception:
                             traceback.print_exc()
                             continue
 
+                    checkpoint.mark_page(letter_url, current_page)
                     page_links = page.query_selector_all("li.b-statistics__paginate-item")
                     next_link = None
                     for link in page_links:
@@ -360,10 +424,26 @@ def scrape_ufc_events(output_csv="fighter_mma_scores.csv"):
                         page.wait_for_timeout(1500)
                     else:
                         print(f"ALL PAGES SCRAPED FOR LETTER: {letter_url.split('=')[-1].upper()}")
+                        checkpoint.mark_letter(letter_url)
                         break
 
+        checkpoint.finish()
         browser.close()
+    if cache is not None:
+        cache.close()
 
 
 if __name__ == "__main__":
-    scrape_ufc_events()
+    parser = argparse.ArgumentParser(description="Scrape ufcstats.com and compute MMA math scores.")
+    parser.add_argument("--output", default="fighter_mma_scores.csv")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the event/fight page cache")
+    parser.add_argument("--incremental", nargs="?", const=True, metavar="PREVIOUS_CSV",
+                        help="only re-scrape fighters whose record changed since PREVIOUS_CSV (default: --output)")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted crawl into --output")
+    args = parser.parse_args()
+    scrape_ufc_events(
+        args.output,
+        cache_path=None if args.no_cache else CACHE_PATH,
+        previous_csv=args.output if args.incremental is True else args.incremental,
+        resume=args.resume,
+    )
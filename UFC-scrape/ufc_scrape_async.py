@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""Concurrent asyncio version of :func:`ufc_scrape2.scrape_ufc_events`.
+
+The synchronous scraper walks every letter, page and fighter one at a time
+on a single Playwright page.  This engine first collects the roster from
+the listing pages into a work queue of profile URLs, then drains the
+queue with ``--concurrency`` workers, each owning its own browser context.
+The listing walk runs ahead of the workers; a listing page is checkpointed
+once its last profile is written, so ``--resume`` skips finished letters
+and pages like the sync scrapers.  A page with a profile that could not be
+scraped is left unfinished, and ``--resume`` retries that profile.
+Every navigation goes through a per-host rate limiter, so throughput grows
+with the concurrency setting without hammering ``ufcstats.com``.
+
+The parsed fights go through the same :func:`ufc_scrape2.sanitize` and
+:func:`ufc_scrape2.compute_mma_score` helpers and the output CSV has the
+same columns as ``ufc_scrape2.py`` (rows are written in completion order).
+Parsed event and fight-detail pages go through the shared
+:class:`page_cache.PageCache`, so each is fetched once per crawl.
+
+Usage::
+
+    python ufc_scrape_async.py --concurrency 8 --rate 4 --output fighter_mma_scores.csv
+"""
+
+import argparse
+import asyncio
+import re
+import time
+import traceback
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+
+from dateutil.parser import parse as parse_date
+from playwright.async_api import async_playwright
+
+from checkpoint import CrawlCheckpoint, page_url
+from incremental import load_csv_snapshot, previous_row
+from page_cache import DEFAULT_PATH as CACHE_PATH
+from page_cache import MISSING, PageCache
+from ufc_scrape2 import compute_mma_score, parse_rank_text, sanitize
+
+BASE_URL = "http://www.ufcstats.com"
+FIELDNAMES = ["name", "nickname", "age", "wins", "losses", "draws", "mma_score"]
+
+
+class HostRateLimiter:
+    """Allow at most ``rate`` requests per second to each host."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = {}
+        self._locks = {}
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncPageCache:
+    """Coroutine front end for :class:`page_cache.PageCache`.
+
+    Workers asking for the same URL at once share one fetch.  The SQLite
+    reads and writes run in a thread so they never block the event loop.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._locks = {}
+
+    async def cached(self, url, compute):
+        if self.cache is None:
+            return await compute()
+        value = await asyncio.to_thread(self.cache.get, url)
+        if value is not MISSING:
+            return value
+        async with self._locks.setdefault(url, asyncio.Lock()):
+            value = await asyncio.to_thread(self.cache.get, url)
+            if value is MISSING:
+                value = await compute()
+                await asyncio.to_thread(self.cache.put, url, value)
+        return value
+
+
+async def goto(page, url, limiter, timeout=10000):
+    await limiter.wait(url)
+    await page.goto(url, timeout=timeout)
+
+
+async def collect_letter_urls(page, limiter):
+    await goto(page, urljoin(BASE_URL, "/statistics/fighters"), limiter)
+    letter_urls = []
+    for link in await page.query_selector_all("ul.b-statistics__nav-items li a"):
+        href = await link.get_attribute("href")
+        if href and "char=" in href:
+            letter_urls.append(urljoin(BASE_URL, href))
+    return letter_urls
+
+
+async def listing_pages(page, letter_url, limiter, start_page=1):
+    """Yield ``(page_number, fighters)`` for each page of one letter tab."""
+    current_page = start_page
+    url = page_url(letter_url, start_page)
+    while url:
+        await goto(page, url, limiter)
+        print(f"Listing page: {url}")
+        fighters = []
+        for row in await page.query_selector_all("tr.b-statistics__table-row"):
+            try:
+                cols = await row.query_selector_all("td")
+                if len(cols) < 11:
+                    continue
+                fname_el = await cols[0].query_selector("a")
+                lname_el = await cols[1].query_selector("a")
+                fname = (await fname_el.inner_text()).strip()
+                lname = (await lname_el.inner_text()).strip()
+                fighters.append({
+                    "name": f"{fname} {lname}",
+                    "profile_url": await fname_el.get_attribute("href"),
+                    "nickname": sanitize((await cols[2].inner_text()).strip()),
+                    "wins": int((await cols[7].inner_text()).strip()),
+                    "losses": int((await cols[8].inner_text()).strip()),
+                    "draws": int((await cols[9].inner_text()).strip()),
+                })
+            except Exception:
+                traceback.print_exc()
+        yield current_page, fighters
+
+        # Follow the link for the next page number, like the sync scraper
+        url = None
+        for item in await page.query_selector_all("li.b-statistics__paginate-item"):
+            text = (await item.inner_text()).strip()
+            if text.isdigit() and int(text) == current_page + 1:
+                link = await item.query_selector("a")
+                href = await link.get_attribute("href") if link else None
+                if href:
+                    url = urljoin(page.url, href)
+                    current_page += 1
+                break
+
+
+async def event_country(context, event_link, limiter):
+    page = await context.new_page()
+    try:
+        await goto(page, event_link, limiter)
+        await page.wait_for_selector("li.b-list__box-list-item", timeout=5000)
+        for item in await page.query_selector_all("li.b-list__box-list-item"):
+            label = await item.query_selector("strong") or await item.query_selector("i")
+            if label and "location" in (await label.inner_text()).lower():
+                loc = (await item.inner_text()).split(":")[-1].strip()
+                return loc.split(",")[-1].strip()
+    finally:
+        await page.close()
+    return None
+
+
+async def fight_rank(context, fight_link, limiter):
+    """Return ``(opponent_rank, opponent_is_champ)`` from a fight-detail page."""
+    page = await context.new_page()
+    try:
+        await goto(page, fight_link, limiter)
+        await page.wait_for_selector("body", timeout=5000)
+        body_text = (await page.inner_text("body")).lower()
+    finally:
+        await page.close()
+    return parse_rank_text(body_text)
+
+
+async def parse_recent_fights(context, profile_page, limiter, cache):
+    """Async counterpart of :func:`ufc_scrape2.parse_recent_fights`."""
+    fights = []
+    try:
+        await profile_page.wait_for_selector("tbody.b-fight-details__table-body", timeout=5000)
+        rows = await profile_page.query_selector_all("tbody.b-fight-details__table-body tr")
+        for row in rows:
+            cells = await row.query_selector_all("td")
+            if not cells or len(cells) < 2:
+                continue
+
+            texts = [(await cell.inner_text()).strip() for cell in cells[:7]]
+            result_text = texts[0].capitalize()
+            if result_text in {"", "--", "Scheduled"}:
+                continue
+
+            opponent_name = texts[1] if len(texts) > 1 else ""
+            event_text = texts[3] if len(texts) > 3 else ""
+            fight_date = None
+            if event_text:
+                try:
+                    fight_date = parse_date(event_text, fuzzy=True).date()
+                except Exception:
+                    fight_date = None
+
+            method = sanitize(texts[4]) if len(texts) > 4 else ""
+            round_val = sanitize(texts[5], int) if len(texts) > 5 else None
+            time_val = sanitize(texts[6]) if len(texts) > 6 else ""
+
+            all_rounds = (
+                bool(method and "decision" in method.lower())
+                and time_val == "5:00"
+                and round_val in {3, 5}
+            )
+
+            location_country = None
+            try:
+                event_link_el = await cells[2].query_selector("a") if len(cells) > 2 else None
+                event_link = await event_link_el.get_attribute("href") if event_link_el else None
+                if event_link:
+                    location_country = await cache.cached(
+                        event_link, lambda: event_country(context, event_link, limiter)
+                    )
+            except Exception:
+                traceback.print_exc()
+
+            opponent_rank = None
+            opponent_is_champ = False
+            try:
+                fight_link_el = await cells[1].query_selector("a")
+                fight_link = await fight_link_el.get_attribute("href") if fight_link_el else None
+                if fight_link:
+                    opponent_rank, opponent_is_champ = await cache.cached(
+                        fight_link, lambda: fight_rank(context, fight_link, limiter)
+                    )
+            except Exception:
+                traceback.print_exc()
+
+            fights.append(
+                {
+                    "result": result_text,
+                    "method": method,
+                    "opponent": opponent_name,
+                    "opponent_rank": opponent_rank,
+                    "opponent_is_champ": opponent_is_champ,
+                    "all_rounds_judges": all_rounds,
+                    "location_country": location_country,
+                    "date": fight_date,
+                }
+            )
+
+            if len(fights) == 5:
+                break
+    except Exception:
+        traceback.print_exc()
+
+    return fights
+
+
+async def scrape_profile(context, fighter, limiter, cache):
+    """Visit one fighter profile and return the output CSV row.
+
+    Raises if the profile page itself cannot be loaded.
+    """
+    age = None
+    country = None
+    fights = []
+    prof = await context.new_page()
+    try:
+        await goto(prof, fighter["profile_url"], limiter)
+        await prof.wait_for_selector("div.b-list__info-box")
+    except Exception:
+        await prof.close()
+        raise
+    try:
+        info_box = (await prof.query_selector_all("div.b-list__info-box"))[0]
+        for item in await info_box.query_selector_all("li"):
+            label_el = await item.query_selector("i")
+            if not label_el:
+                continue
+            label_text = await label_el.inner_text()
+            label = label_text.strip().lower()
+            value = (await item.inner_text()).replace(label_text, "").strip()
+            if "date of birth" in label or "dob" in label:
+                dob_clean = re.sub(r"\(.*?\)", "", value).strip()
+                dob_date = parse_date(dob_clean, fuzzy=True).date()
+                today = datetime.today().date()
+                age = today.year - dob_date.year - (
+                    (today.month, today.day) < (dob_date.month, dob_date.day)
+                )
+            elif "fighting out of" in label or "country" in label or "birth place" in label:
+                country = value.split(",")[-1].strip()
+        fights = await parse_recent_fights(context, prof, limiter, cache)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        await prof.close()
+
+    return {
+        "name": fighter["name"],
+        "nickname": fighter["nickname"],
+        "age": age,
+        "wins": fighter["wins"],
+        "losses": fighter["losses"],
+        "draws": fighter["draws"],
+        "mma_score": compute_mma_score(fights, age, fighter["losses"], country),
+    }
+
+
+class ListingProgress:
+    """Profiles still outstanding per listing page.
+
+    Pages are checkpointed in order as their last profile finishes, and a
+    letter once all of its pages are.  A page with a failed profile is
+    never marked, so ``--resume`` walks it again and retries that profile
+    (the profiles that did finish are skipped).
+    """
+
+    def __init__(self, checkpoint):
+        self.checkpoint = checkpoint
+        self._pages = {}
+        self._listed = set()
+
+    def add_page(self, letter_url, page_number, profiles):
+        self._pages.setdefault(letter_url, {})[page_number] = {"left": profiles, "failed": 0}
+        self._advance(letter_url)
+
+    def letter_listed(self, letter_url):
+        self._listed.add(letter_url)
+        self._pages.setdefault(letter_url, {})
+        self._advance(letter_url)
+
+    def profile_finished(self, letter_url, page_number, ok=True):
+        state = self._pages[letter_url][page_number]
+        state["left"] -= 1
+        if not ok:
+            state["failed"] += 1
+        self._advance(letter_url)
+
+    def failed(self):
+        return sum(state["failed"] for pages in self._pages.values() for state in pages.values())
+
+    def _advance(self, letter_url):
+        pages = self._pages[letter_url]
+        for page_number in sorted(pages):
+            state = pages[page_number]
+            if state["left"] or state["failed"]:
+                return
+            self.checkpoint.mark_page(letter_url, page_number)
+            del pages[page_number]
+        if letter_url in self._listed:
+            self.checkpoint.mark_letter(letter_url)
+
+
+async def worker(context, queue, limiter, cache, writer, checkpoint, progress):
+    while True:
+        fighter, letter_url, page_number = await queue.get()
+        ok = False
+        try:
+            row = await scrape_profile(context, fighter, limiter, cache)
+            writer.writerow(row)
+            checkpoint.mark_profile(fighter["profile_url"])
+            ok = True
+            print(f"{row['name']} | Age: {row['age']} | Record: {row['wins']}-{row['losses']}-{row['draws']} | Rating: {row['mma_score']}")
+        except Exception:
+            print(f"Failed: {fighter['profile_url']} (retried on --resume)")
+            traceback.print_exc()
+        finally:
+            progress.profile_finished(letter_url, page_number, ok)
+            queue.task_done()
+
+
+async def crawl(browser, writer, checkpoint, limiter, cache, snapshot=None, concurrency=4):
+    """Write a row for every fighter not yet in ``checkpoint``; return ``(scraped, unchanged, failed)``.
+
+    The listing is walked on its own context and queues profiles as it
+    goes, while ``concurrency`` workers drain the queue; see
+    :class:`ListingProgress` for how pages and letters are checkpointed.
+    """
+    listing_context = await browser.new_context()
+    page = await listing_context.new_page()
+    contexts = [await browser.new_context() for _ in range(concurrency)]
+    queue = asyncio.Queue()
+    progress = ListingProgress(checkpoint)
+    workers = [asyncio.create_task(worker(ctx, queue, limiter, cache, writer, checkpoint, progress))
+               for ctx in contexts]
+    scraped = unchanged = 0
+    try:
+        for letter_url in await collect_letter_urls(page, limiter):
+            if checkpoint.letter_done(letter_url):
+                continue
+            start_page = checkpoint.next_page(letter_url)
+            async for page_number, fighters in listing_pages(page, letter_url, limiter, start_page):
+                queued = []
+                for fighter in fighters:
+                    if checkpoint.profile_done(fighter["profile_url"]):
+                        continue
+                    previous = previous_row(fighter, snapshot)
+                    if previous is None:
+                        queued.append(fighter)
+                    else:
+                        writer.writerow(previous)
+                        checkpoint.mark_profile(fighter["profile_url"])
+                        unchanged += 1
+                progress.add_page(letter_url, page_number, len(queued))
+                for fighter in queued:
+                    queue.put_nowait((fighter, letter_url, page_number))
+                scraped += len(queued)
+            progress.letter_listed(letter_url)
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for ctx in [listing_context, *contexts]:
+            await ctx.close()
+    failed = progress.failed()
+    return scraped - failed, unchanged, failed
+
+
+async def scrape_ufc_events_async(output_csv="fighter_mma_scores.csv", concurrency=4, rate=4.0, cache_path=CACHE_PATH,
+                                  previous_csv=None, resume=False):
+    """Scrape every fighter with ``concurrency`` browser contexts in parallel.
+
+    With ``previous_csv`` only fighters whose record changed are scraped.
+    Finished letters, pages and profiles are checkpointed next to
+    ``output_csv``; with ``resume=True`` they are skipped and the CSV is
+    appended to.
+    """
+    snapshot = load_csv_snapshot(previous_csv) if previous_csv else None
+    checkpoint = CrawlCheckpoint.for_output(output_csv, resume)
+    if checkpoint.resumed:
+        print(f"Resuming: {len(checkpoint.letters_done)} letters and {len(checkpoint.profiles_done)} profiles done")
+    limiter = HostRateLimiter(rate)
+    page_cache = PageCache(cache_path) if cache_path else None
+    cache = AsyncPageCache(page_cache)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            _, writer = checkpoint.open_csv(output_csv, FIELDNAMES)
+            scraped, unchanged, failed = await crawl(browser, writer, checkpoint, limiter, cache, snapshot,
+                                                     concurrency)
+            print(f"Scraped {scraped} fighter profiles ({unchanged} unchanged, {failed} failed)")
+            if not failed:
+                checkpoint.finish()
+        finally:
+            checkpoint.close()
+            await browser.close()
+            if page_cache is not None:
+                page_cache.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent UFC stats + MMA math scraper.")
+    parser.add_argument("--output", default="fighter_mma_scores.csv")
+    parser.add_argument("--concurrency", type=int, default=4, help="browser contexts working in parallel")
+    parser.add_argument("--rate", type=float, default=4.0, help="max requests per second per host")
+    parser.add_argument("--cache", default=CACHE_PATH, help="SQLite file caching parsed event/fight pages")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--incremental", nargs="?", const=True, metavar="PREVIOUS_CSV",
+                        help="only re-scrape fighters whose record changed since PREVIOUS_CSV (default: --output)")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted crawl into --output")
+    args = parser.parse_args()
+    asyncio.run(scrape_ufc_events_async(
+        args.output, args.concurrency, args.rate,
+        cache_path=None if args.no_cache else args.cache,
+        previous_csv=args.output if args.incremental is True else args.incremental,
+        resume=args.resume,
+    ))
+
+
+if __name__ == "__main__":
+    main()
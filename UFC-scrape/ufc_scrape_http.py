@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""Scrape ufcstats.com over plain HTTP instead of a headless browser.
+
+``ufcstats.com`` serves static HTML, so the pages ``ufc_scrape.py`` and
+``ufc_scrape2.py`` render in Chromium can be fetched with a keep-alive
+``requests`` session and parsed with BeautifulSoup (``lxml`` when it is
+installed, otherwise the stdlib ``html.parser``).  This uses a fraction
+of the CPU, memory and wall time of the Playwright scrapers.
+
+The page parsers below are pure functions of the HTML, and the scores go
+through the same :func:`ufc_scrape2.sanitize` and
+:func:`ufc_scrape2.compute_mma_score` helpers, so the default output has
+the same columns as ``ufc_scrape2.py``.  ``--mode stats`` writes the
+career-stat columns that ``ufc_scrape.py`` inserts into ``ufc_fighters``
+instead.
+
+Usage::
+
+    python ufc_scrape_http.py --output fighter_mma_scores.csv --workers 8
+    python ufc_scrape_http.py --mode stats --output ufc_fighters.csv
+    python ufc_scrape_http.py --incremental   # only re-scrape changed records
+    python ufc_scrape_http.py --resume        # continue a crawl that stopped
+    python ufc_scrape_http.py --mode stats --db   # also upsert into MySQL ufc_fighters
+"""
+
+import argparse
+import csv
+import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from dateutil.parser import parse as parse_date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from checkpoint import CrawlCheckpoint, page_url
+from db_writer import BatchWriter, connection_pool, fight_record, fight_writer, refresh_clean_table, ufcstats_id
+from incremental import load_csv_snapshot, previous_row
+from page_cache import DEFAULT_PATH as CACHE_PATH
+from page_cache import PageCache
+from ufc_scrape2 import compute_mma_score, parse_rank_text, sanitize
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+BASE_URL = "http://www.ufcstats.com"
+SCORE_FIELDNAMES = ["name", "nickname", "age", "wins", "losses", "draws", "mma_score"]
+STATS_FIELDNAMES = [
+    "name", "nickname", "dob", "age", "height", "weight", "reach", "stance",
+    "winstreak", "wins", "losses", "draws", "belt",
+    "SLpM", "Str_Acc", "SApM", "Str_Def", "TD_Avg", "TD_Acc", "TD_Def", "Sub_Avg",
+]
+
+# Career-stat labels on the profile page -> (column, converter)
+CAREER_STATS = [
+    ("slpm", "SLpM", float),
+    ("str. acc.", "Str_Acc", int),
+    ("sapm", "SApM", float),
+    ("str. def", "Str_Def", int),
+    ("td avg", "TD_Avg", float),
+    ("td acc", "TD_Acc", int),
+    ("td def", "TD_Def", int),
+    ("sub. avg", "Sub_Avg", float),
+]
+
+
+def make_session(pool_size=8, retries=3):
+    """Return a keep-alive session with a connection pool of ``pool_size``."""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "Mozilla/5.0 (compatible; FightMetricsAI scraper)"
+    return session
+
+
+def _soup(html):
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _text(el):
+    return el.get_text(" ", strip=True) if el is not None else ""
+
+
+def _href(el):
+    link = el.find("a") if el is not None else None
+    return link.get("href") if link is not None else None
+
+
+def _age_from_dob(dob):
+    dob_clean = re.sub(r"\(.*?\)", "", dob).strip()
+    dob_date = parse_date(dob_clean, fuzzy=True).date()
+    today = datetime.today().date()
+    return today.year - dob_date.year - ((today.month, today.day) < (dob_date.month, dob_date.day))
+
+
+# --- Page parsers -------------------------------------------------------------
+
+def parse_letter_urls(html, page_url=BASE_URL):
+    """Return the absolute URLs of the alphabet tabs on the fighters page."""
+    letter_urls = []
+    for link in _soup(html).select("ul.b-statistics__nav-items li a"):
+        href = link.get("href")
+        if href and "char=" in href:
+            letter_urls.append(urljoin(page_url, href))
+    return letter_urls
+
+
+def parse_listing(html, page_url=BASE_URL):
+    """Return one dict per fighter row of a listing page."""
+    fighters = []
+    for row in _soup(html).select("tr.b-statistics__table-row"):
+        try:
+            cols = row.find_all("td")
+            if len(cols) < 11:
+                continue
+            fname = _text(cols[0].find("a"))
+            lname = _text(cols[1].find("a"))
+            fighters.append({
+                "name": f"{fname} {lname}",
+                "profile_url": urljoin(page_url, _href(cols[0])),
+                "nickname": sanitize(_text(cols[2])),
+                "height": sanitize(_text(cols[3])),
+                "weight": sanitize(_text(cols[4]), lambda x: int(x[:3])),
+                "reach": sanitize(_text(cols[5]), lambda x: float(x[:4])),
+                "stance": sanitize(_text(cols[6])),
+                "wins": int(_text(cols[7])),
+                "losses": int(_text(cols[8])),
+                "draws": int(_text(cols[9])),
+                "belt": cols[10].find("img") is not None,
+            })
+        except Exception:
+            traceback.print_exc()
+    return fighters
+
+
+def next_page_url(html, current_page, page_url):
+    """Return the URL of page ``current_page + 1`` of a listing, if any."""
+    for item in _soup(html).select("li.b-statistics__paginate-item"):
+        text = _text(item)
+        if text.isdigit() and int(text) == current_page + 1:
+            href = _href(item)
+            return urljoin(page_url, href) if href else None
+    return None
+
+
+def parse_profile(html, page_url=BASE_URL):
+    """Return the bio, career stats and raw fight-history rows of a profile."""
+    soup = _soup(html)
+    profile = {"dob": None, "age": None, "country": None, "stats": {}, "fight_rows": []}
+
+    info_boxes = soup.select("div.b-list__info-box")
+    if info_boxes:
+        for item in info_boxes[0].find_all("li"):
+            label_el = item.find("i")
+            if label_el is None:
+                continue
+            label = _text(label_el).lower()
+            value = _text(item).replace(_text(label_el), "").strip()
+            if "date of birth" in label or "dob" in label:
+                profile["dob"] = sanitize(value)
+                if profile["dob"]:
+                    try:
+                        profile["age"] = _age_from_dob(profile["dob"])
+                    except Exception:
+                        pass
+            elif "fighting out of" in label or "country" in label or "birth place" in label:
+                profile["country"] = value.split(",")[-1].strip()
+
+    if len(info_boxes) >= 2:
+        for item in info_boxes[1].find_all("li"):
+            label_el = item.find("i")
+            if label_el is None:
+                continue
+            label = _text(label_el).lower()
+            value = _text(item).replace(_text(label_el), "").strip()
+            for prefix, column, convert in CAREER_STATS:
+                if prefix in label:
+                    profile["stats"][column] = sanitize(value.replace("%", "").strip(), convert)
+                    break
+
+    for row in soup.select("tbody.b-fight-details__table-body tr"):
+        cells = row.find_all("td")
+        if not cells or len(cells) < 2:
+            continue
+        texts = [_text(cell) for cell in cells[:7]]
+        result_text = texts[0].capitalize()
+        if result_text in {"", "--", "Scheduled"}:
+            continue
+        event_href = _href(cells[2]) if len(cells) > 2 else None
+        fight_href = _href(cells[1])
+        profile["fight_rows"].append({
+            "result": result_text,
+            "opponent": texts[1] if len(texts) > 1 else "",
+            "event": texts[2] if len(texts) > 2 else "",
+            "event_text": texts[3] if len(texts) > 3 else "",
+            "method": sanitize(texts[4]) if len(texts) > 4 else "",
+            "round": sanitize(texts[5], int) if len(texts) > 5 else None,
+            "time": sanitize(texts[6]) if len(texts) > 6 else "",
+            "event_url": urljoin(page_url, event_href) if event_href else None,
+            "fight_url": urljoin(page_url, fight_href) if fight_href else None,
+        })
+    return profile
+
+
+def parse_event_country(html):
+    """Return the country from an event page's ``Location:`` line."""
+    for item in _soup(html).select("li.b-list__box-list-item"):
+        label = item.find("strong") or item.find("i")
+        if label is not None and "location" in _text(label).lower():
+            loc = _text(item).split(":")[-1].strip()
+            return loc.split(",")[-1].strip()
+    return None
+
+
+def parse_fight_rank(html):
+    """Return ``(opponent_rank, opponent_is_champ)`` from a fight-detail page."""
+    soup = _soup(html)
+    return parse_rank_text(_text(soup.body or soup).lower())
+
+
+def win_streak(fight_rows):
+    """Count leading wins the way ``ufc_scrape.py`` does."""
+    streak = 0
+    for fight in fight_rows:
+        if fight["result"] == "Win":
+            streak += 1
+        elif fight["result"] in {"Loss", "Draw", "Nc"}:
+            break
+    return streak
+
+
+# --- Crawler ------------------------------------------------------------------
+
+class HttpScraper:
+    """Fetch and parse ufcstats pages through one pooled session.
+
+    With a :class:`page_cache.PageCache`, event and fight-detail pages are
+    fetched once and their parsed values reused across fighters and runs.
+    :meth:`stats_row` leaves each profile's ``fights`` rows (see
+    :func:`db_writer.fight_record`) in ``fights`` keyed by profile URL.
+    """
+
+    def __init__(self, base_url=BASE_URL, session=None, workers=8, timeout=10, cache=None):
+        self.base_url = base_url
+        self.workers = workers
+        self.timeout = timeout
+        self.cache = cache
+        self.reused = 0
+        self.fights = {}
+        self.session = session or make_session(pool_size=workers)
+
+    def fetch(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def event_country(self, url):
+        if self.cache is None:
+            return parse_event_country(self.fetch(url))
+        return self.cache.cached(url, lambda: parse_event_country(self.fetch(url)))
+
+    def fight_rank(self, url):
+        if self.cache is None:
+            return parse_fight_rank(self.fetch(url))
+        rank, champ = self.cache.cached(url, lambda: parse_fight_rank(self.fetch(url)))
+        return rank, champ
+
+    def recent_fights(self, fight_rows):
+        """Build the :func:`compute_mma_score` input for the last five bouts."""
+        fights = []
+        for row in fight_rows[:5]:
+            fight_date = None
+            if row["event_text"]:
+                try:
+                    fight_date = parse_date(row["event_text"], fuzzy=True).date()
+                except Exception:
+                    fight_date = None
+
+            method = row["method"]
+            all_rounds = (
+                bool(method and "decision" in method.lower())
+                and row["time"] == "5:00"
+                and row["round"] in {3, 5}
+            )
+
+            location_country = None
+            if row["event_url"]:
+                try:
+                    location_country = self.event_country(row["event_url"])
+                except Exception:
+                    traceback.print_exc()
+
+            opponent_rank = None
+            opponent_is_champ = False
+            if row["fight_url"]:
+                try:
+                    opponent_rank, opponent_is_champ = self.fight_rank(row["fight_url"])
+                except Exception:
+                    traceback.print_exc()
+
+            fights.append({
+                "result": row["result"],
+                "method": method,
+                "opponent": row["opponent"],
+                "opponent_rank": opponent_rank,
+                "opponent_is_champ": opponent_is_champ,
+                "all_rounds_judges": all_rounds,
+                "location_country": location_country,
+                "date": fight_date,
+            })
+        return fights
+
+    def letter_urls(self):
+        url = urljoin(self.base_url, "/statistics/fighters")
+        return parse_letter_urls(self.fetch(url), url)
+
+    def listing(self, letter_url, start_page=1):
+        """Yield ``(page_number, fighters)`` for each page of one letter tab."""
+        current_page = start_page
+        url = page_url(letter_url, start_page)
+        while url:
+            print(f"Scraping page: {url}")
+            html = self.fetch(url)
+            yield current_page, parse_listing(html, url)
+            url = next_page_url(html, current_page, url)
+            current_page += 1
+
+    def score_row(self, fighter):
+        """Return the ``ufc_scrape2.py`` CSV row for one listing entry."""
+        age = None
+        country = None
+        fights = []
+        try:
+            profile = parse_profile(self.fetch(fighter["profile_url"]), fighter["profile_url"])
+            age = profile["age"]
+            country = profile["country"]
+            fights = self.recent_fights(profile["fight_rows"])
+        except Exception:
+            traceback.print_exc()
+        return {
+            "name": fighter["name"],
+            "nickname": fighter["nickname"],
+            "age": age,
+            "wins": fighter["wins"],
+            "losses": fighter["losses"],
+            "draws": fighter["draws"],
+            "mma_score": compute_mma_score(fights, age, fighter["losses"], country),
+        }
+
+    def stats_row(self, fighter):
+        """Return the ``ufc_fighters`` columns ``ufc_scrape.py`` stores."""
+        profile = {"dob": None, "age": None, "stats": {}, "fight_rows": []}
+        try:
+            profile = parse_profile(self.fetch(fighter["profile_url"]), fighter["profile_url"])
+        except Exception:
+            traceback.print_exc()
+        row = {column: fighter.get(column) for column in STATS_FIELDNAMES}
+        row["dob"] = profile["dob"]
+        row["age"] = profile["age"]
+        row["winstreak"] = win_streak(profile["fight_rows"])
+        records = (fight_record(fighter["profile_url"], fight) for fight in profile["fight_rows"])
+        self.fights[fighter["profile_url"]] = [record for record in records if record is not None]
+        for _, column, convert in CAREER_STATS:
+            value = profile["stats"].get(column)
+            row[column] = value if value is not None else convert(0)
+        return row
+
+    def rows(self, mode="score", snapshot=None, checkpoint=None):
+        """Yield ``(fighter, row)`` for every fighter, in listing order.
+
+        With a ``snapshot`` from :mod:`incremental`, fighters whose record
+        is unchanged keep their previous row and their profile is skipped.
+        With a :class:`checkpoint.CrawlCheckpoint`, finished letters, pages
+        and profiles are skipped; a page is marked done once the caller has
+        taken all of its rows.
+        """
+        build_row = self.score_row if mode == "score" else self.stats_row
+
+        def row_for(fighter):
+            previous = previous_row(fighter, snapshot)
+            if previous is None:
+                return build_row(fighter)
+            self.reused += 1
+            return previous
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for letter_url in self.letter_urls():
+                if checkpoint is None:
+                    print(f"\nScraping letter tab: {letter_url}")
+                    for _, fighters in self.listing(letter_url):
+                        yield from zip(fighters, executor.map(row_for, fighters))
+                    continue
+
+                if checkpoint.letter_done(letter_url):
+                    continue
+                print(f"\nScraping letter tab: {letter_url}")
+                for page, fighters in self.listing(letter_url, checkpoint.next_page(letter_url)):
+                    fighters = [f for f in fighters if not checkpoint.profile_done(f["profile_url"])]
+                    yield from zip(fighters, executor.map(row_for, fighters))
+                    checkpoint.mark_page(letter_url, page)
+                checkpoint.mark_letter(letter_url)
+
+
+def scrape_ufc_events(output_csv="fighter_mma_scores.csv", base_url=BASE_URL, mode="score", workers=8,
+                      session=None, cache_path=CACHE_PATH, previous_csv=None, resume=False, db_writer=None,
+                      fights_writer=None):
+    """Main entry: write one CSV row per fighter and return the row count.
+
+    ``cache_path=None`` disables the event/fight page cache.  With
+    ``previous_csv`` only fighters whose record changed since that file
+    are scraped again (it may be ``output_csv`` itself).  Progress is
+    checkpointed next to ``output_csv``; ``resume=True`` continues an
+    interrupted crawl instead of starting over.  In stats mode a
+    :class:`db_writer.BatchWriter` also upserts every row into
+    ``ufc_fighters``, and ``fights_writer`` (:func:`db_writer.fight_writer`)
+    the fight history of every scraped profile into ``fights``.
+    """
+    if db_writer is not None and mode != "stats":
+        raise ValueError("database output needs --mode stats")
+    fieldnames = SCORE_FIELDNAMES if mode == "score" else STATS_FIELDNAMES
+    snapshot = None
+    if previous_csv:
+        snapshot = load_csv_snapshot(previous_csv)
+        if snapshot and not set(fieldnames) <= set(next(iter(snapshot.values()))):
+            raise ValueError(f"{previous_csv} was not written in {mode} mode")
+
+    cache = PageCache(cache_path) if cache_path else None
+    scraper = HttpScraper(base_url, session=session, workers=workers, cache=cache)
+    if db_writer is None:
+        checkpoint = CrawlCheckpoint.for_output(output_csv, resume)
+    else:
+        checkpoint = CrawlCheckpoint.for_output(output_csv, resume, save_every=db_writer.batch_size)
+        checkpoint.before_save = (fights_writer or db_writer).flush
+    if checkpoint.resumed:
+        print(f"Resuming: {len(checkpoint.letters_done)} letters and {len(checkpoint.profiles_done)} profiles done")
+    count = 0
+    try:
+        _, writer = checkpoint.open_csv(output_csv, fieldnames)
+        for fighter, row in scraper.rows(mode, snapshot, checkpoint):
+            writer.writerow(row)
+            if db_writer is not None:
+                db_writer.add(dict(row, ufcstats_id=ufcstats_id(fighter["profile_url"])))
+            fights = scraper.fights.pop(fighter["profile_url"], [])
+            if fights_writer is not None:
+                for fight in fights:
+                    fights_writer.add(fight)
+            checkpoint.mark_profile(fighter["profile_url"])
+            count += 1
+            print(f"{row['name']} | Age: {row['age']} | Record: {row['wins']}-{row['losses']}-{row['draws']}")
+        if db_writer is not None:
+            (fights_writer or db_writer).flush()
+        checkpoint.finish()
+        if snapshot is not None:
+            print(f"Incremental: {count - scraper.reused} scraped, {scraper.reused} unchanged")
+    finally:
+        checkpoint.close()
+        if cache is not None:
+            print(f"Page cache: {cache.hits} hits, {cache.misses} misses")
+            cache.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape ufcstats.com over HTTP without a browser.")
+    parser.add_argument("--output", default="fighter_mma_scores.csv")
+    parser.add_argument("--mode", choices=("score", "stats"), default="score",
+                        help="score: ufc_scrape2.py MMA score columns; stats: ufc_scrape.py career stats")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--workers", type=int, default=8, help="profiles fetched in parallel")
+    parser.add_argument("--cache", default=CACHE_PATH, help="SQLite file caching parsed event/fight pages")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--incremental", nargs="?", const=True, metavar="PREVIOUS_CSV",
+                        help="only re-scrape fighters whose record changed since PREVIOUS_CSV (default: --output)")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted crawl into --output")
+    parser.add_argument("--db", action="store_true",
+                        help="stats mode: also upsert rows into ufc_fighters and fights (UFC_DB_* environment variables)")
+    parser.add_argument("--batch-size", type=int, default=500, help="rows per database batch")
+    args = parser.parse_args()
+    previous_csv = args.output if args.incremental is True else args.incremental
+
+    conn = db_writer = fights_writer = None
+    if args.db:
+        conn = connection_pool().get_connection()
+        db_writer = BatchWriter(conn, batch_size=args.batch_size)
+        fights_writer = fight_writer(conn, db_writer, batch_size=args.batch_size)
+    try:
+        scrape_ufc_events(args.output, args.base_url, args.mode, args.workers,
+                          cache_path=None if args.no_cache else args.cache, previous_csv=previous_csv,
+                          resume=args.resume, db_writer=db_writer, fights_writer=fights_writer)
+        if conn is not None:
+            refresh_clean_table(conn)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""MMA math scorer over synthetic rosters of 1k-50k fights."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import synthetic_fights
+from Prediction.ufc_predict_math import FightHistory, adjusted_scores, mathmodel, score_all
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}_fights")
+def fights(request):
+    return synthetic_fights(request.param)
+
+
+def bench_mathmodel(benchmark, fights):
+    benchmark(mathmodel, fights, 0)
+
+
+def bench_adjusted_scores(benchmark, fights):
+    benchmark(adjusted_scores, fights, 0, 1)
+
+
+def bench_adjusted_scores_with_history(benchmark, fights):
+    history = FightHistory(fights)
+    benchmark(adjusted_scores, fights, 0, 1, history=history)
+
+
+def bench_score_all(benchmark, fights):
+    benchmark(score_all, fights)
+
+
+def bench_bonus_matrix(benchmark, fights):
+    benchmark(lambda: FightHistory(fights).bonus_matrix())
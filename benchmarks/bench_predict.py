@@ -0,0 +1,66 @@
+"""Prediction hot path: fighter lookups, model calls and the /predict endpoint."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from custom_inputs import getCustomPredict, getCustomPredictBatch, prediction_cache
+from predictions import get_fighter_id
+from registry import get_snapshot
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    return get_snapshot()
+
+
+@pytest.fixture(scope="module")
+def fighter_ids(snapshot):
+    return list(snapshot.index.names_by_id)
+
+
+def bench_get_fighter_id(benchmark, snapshot, fighter_ids):
+    names = [snapshot.index.get_name(fid) for fid in fighter_ids[:100]]
+
+    def lookup():
+        for name in names:
+            get_fighter_id(name, snapshot.index)
+
+    benchmark(lookup)
+
+
+def bench_get_custom_predict_uncached(benchmark, snapshot, fighter_ids):
+    a, b = fighter_ids[0], fighter_ids[1]
+    benchmark.pedantic(getCustomPredict, args=(a, b, snapshot), setup=prediction_cache.clear,
+                       rounds=2000, warmup_rounds=10)
+
+
+def bench_get_custom_predict_cached(benchmark, snapshot, fighter_ids):
+    a, b = fighter_ids[0], fighter_ids[1]
+    getCustomPredict(a, b, snapshot)
+    benchmark(getCustomPredict, a, b, snapshot)
+
+
+@pytest.mark.parametrize("bouts", [12, 500])
+def bench_get_custom_predict_batch(benchmark, snapshot, fighter_ids, bouts):
+    pairs = [(fighter_ids[2 * i % len(fighter_ids)], fighter_ids[(2 * i + 1) % len(fighter_ids)])
+             for i in range(bouts)]
+    benchmark(getCustomPredictBatch, pairs, snapshot)
+
+
+def bench_predict_endpoint(benchmark, snapshot, fighter_ids):
+    import app
+
+    client = app.app.test_client()
+    body = {"fighterOne": snapshot.index.get_name(fighter_ids[0]),
+            "fighterTwo": snapshot.index.get_name(fighter_ids[1])}
+
+    def post():
+        assert client.post("/predict", json=body).status_code == 200
+
+    benchmark(post)
+
+
+@pytest.mark.parametrize("query", ["jon", "conor mcgreggor"], ids=["prefix", "typo"])
+def bench_search(benchmark, snapshot, query):
+    benchmark(snapshot.search.search, query, 8)
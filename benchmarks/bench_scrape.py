@@ -0,0 +1,70 @@
+"""Scraper parsing and scoring on the recorded ufcstats HTML fixtures."""
+
+import os
+from urllib.parse import urlsplit
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")  # ufc_scrape2 imports it at module level
+
+from conftest import ROOT
+from ufc_scrape2 import compute_mma_score, sanitize
+from ufc_scrape_http import HttpScraper, parse_listing, parse_profile
+
+FIXTURE_DIR = os.path.join(ROOT, "UFC-scrape", "fixtures")
+BASE_URL = "http://ufcstats.test"
+# URL path -> fixture, as in test_ufc_scrape_http.py
+FIXTURE_PAGES = {
+    "/event-details/ufc-rio": "event_ufc_rio.html",
+    "/event-details/ufc-vegas": "event_ufc_vegas.html",
+    "/fight-details/title-bout": "fight_title_bout.html",
+    "/fight-details/main-card": "fight_main_card.html",
+}
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def profile_html():
+    return _fixture("fighter_alpha.html")
+
+
+def bench_parse_listing(benchmark):
+    html = _fixture("listing_a.html")
+    benchmark(parse_listing, html, BASE_URL + "/statistics/fighters?char=a")
+
+
+def bench_parse_profile(benchmark, profile_html):
+    benchmark(parse_profile, profile_html, BASE_URL + "/fighter-details/alpha")
+
+
+def bench_sanitize(benchmark, profile_html):
+    # Every cell text of the recorded profile, converted like the scrapers do
+    from bs4 import BeautifulSoup
+
+    cells = [td.get_text(" ", strip=True) for td in BeautifulSoup(profile_html, "html.parser").find_all(["td", "li"])]
+    cells += ["--", "", "0\n\n1", "5:00", "44%", "6' 3\""]
+
+    def run():
+        for cell in cells:
+            sanitize(cell)
+            sanitize(cell, int)
+            sanitize(cell.replace("%", ""), float)
+
+    benchmark(run)
+
+
+def bench_compute_mma_score(benchmark, profile_html):
+    pages = {path: _fixture(name) for path, name in FIXTURE_PAGES.items()}
+    scraper = HttpScraper(base_url=BASE_URL, workers=1)
+    scraper.fetch = lambda url: pages[urlsplit(url).path]
+    profile = parse_profile(profile_html, BASE_URL + "/fighter-details/alpha")
+    fights = scraper.recent_fights(profile["fight_rows"])
+    assert fights
+
+    benchmark(compute_mma_score, fights, profile["age"], 2, profile["country"])
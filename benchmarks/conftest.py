@@ -0,0 +1,53 @@
+"""Shared setup for the benchmark suite.
+
+Run from the repository root::
+
+    pytest benchmarks                                   # just measure
+    pytest benchmarks --benchmark-autosave              # record a new baseline
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:25%
+
+Baselines are stored in ``benchmarks/baselines`` so they are versioned
+with the code they measure.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DIR = os.path.join(ROOT, "benchmarks", "baselines")
+
+for path in (ROOT, os.path.join(ROOT, "webapp", "backend"), os.path.join(ROOT, "UFC-scrape")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Keep baselines next to the suite whatever the working directory
+    if hasattr(config.option, "benchmark_storage") and config.option.benchmark_storage == "file://./.benchmarks":
+        config.option.benchmark_storage = "file://" + BASELINE_DIR
+
+
+def synthetic_fights(n_fights, seed=0):
+    """Return ``n_fights`` rows in ``mathmodel``'s format, ten fights per fighter on average."""
+    rng = np.random.default_rng(seed)
+    n_fighters = max(n_fights // 10, 2)
+    fighter_id = rng.integers(0, n_fighters, n_fights)
+    return pd.DataFrame({
+        "fighter_id": fighter_id,
+        "opponent_id": (fighter_id + rng.integers(1, n_fighters, n_fights)) % n_fighters,
+        "result": rng.choice(["Win", "Loss", "Draw"], n_fights, p=[0.55, 0.4, 0.05]),
+        "method": rng.choice(["KO/TKO", "Submission", "Decision - Unanimous", "Decision - Split"], n_fights),
+        "date": pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 9000, n_fights), unit="D"),
+        "opponent_rank": rng.choice([np.nan, 0, 1, 5, 10, 15], n_fights),
+        "opponent_is_champ": rng.random(n_fights) < 0.03,
+        "two_judges_all_rounds": rng.random(n_fights) < 0.5,
+        "fighter_age": rng.integers(21, 42, n_fights),
+        "fighter_total_losses": rng.integers(0, 8, n_fights),
+        "fighter_country": rng.choice(["USA", "Brazil", "Russia"], n_fights),
+        "fight_country": rng.choice(["USA", "Brazil", "Russia"], n_fights),
+    })
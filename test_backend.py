@@ -0,0 +1,464 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "webapp", "backend"))
+
+from fighter_index import FighterIndex
+from fighter_store import build_store, load_store, store_is_current
+from registry import ModelRegistry, get_snapshot
+
+
+def _roster():
+    return pd.DataFrame([
+        {"id": 7, "name": "Shamil Abdurakhimov", "nickname": "Abrek", "height": "6' 3\"", "SLpM": 2.41, "SApM": 3.02, "Str_Acc": 44,
+         "TD_Acc": 23, "Str_Def": 55, "TD_Def": 45, "Sub_Avg": 0.1, "TD_Avg": 1.01, "age": 43, "weight": 235,
+         "reach": 76.0, "wins": 20, "losses": 8},
+        {"id": 9, "name": "Papy Abedi", "nickname": None, "height": "--", "SLpM": 2.8, "SApM": 3.15, "Str_Acc": 55,
+         "TD_Acc": 57, "Str_Def": 48, "TD_Def": 50, "Sub_Avg": 1.3, "TD_Avg": 3.47, "age": 46, "weight": 185,
+         "reach": 0.0, "wins": 10, "losses": 4},
+    ])
+
+
+def test_fighter_index_lookups():
+    index = FighterIndex.from_frame(_roster())
+    assert index.get_id("  shamil   ABDURAKHIMOV ") == 7
+    assert index.get_id("Nobody") is None
+    assert index.get_name(9) == "Papy Abedi"
+    row = index.feature_row(7)
+    assert row[9] == 190  # height converted to cm
+    assert pd.isna(index.feature_row(9)[9])
+
+
+def test_fighter_store_roundtrip(tmp_path):
+    csv_path = tmp_path / "roster.csv"
+    _roster().to_csv(csv_path, sep=";", index=False)
+    out_dir = str(tmp_path / "store")
+
+    assert not store_is_current(str(csv_path), out_dir)
+    build_store(str(csv_path), out_dir)
+    assert store_is_current(str(csv_path), out_dir)
+
+    store = load_store(out_dir)
+    assert store["ids"].dtype == "int32"
+    assert store["names"].tolist() == ["Shamil Abdurakhimov", "Papy Abedi"]
+    assert FighterIndex(store).feature_row(7)[9] == 190
+
+
+def test_asgi_app_matches_flask():
+    import pytest
+
+    pytest.importorskip("starlette")
+    pytest.importorskip("httpx")
+    from starlette.testclient import TestClient
+
+    import app
+    import asgi
+
+    index = get_snapshot().index
+    body = {"fighterOne": index.get_name(list(index.names_by_id)[0]), "fighterTwo": index.get_name(list(index.names_by_id)[1])}
+    with TestClient(asgi.app) as client:
+        res = client.post("/predict", json=body)
+        assert res.status_code == 200
+        assert res.json() == app.app.test_client().post("/predict", json=body).get_json()
+        assert client.post("/predict", content=b"not json").status_code == 400
+        assert client.get("/feature-importance").json()["features"]
+        assert 'fightmetrics_requests_total{route="/predict",status="400"}' in client.get("/metrics").text
+        assert client.get("/search", params={"q": body["fighterOne"]}).json() == \
+            app.app.test_client().get("/search", query_string={"q": body["fighterOne"]}).get_json()
+
+
+def test_feature_importance_is_cacheable():
+    import app
+
+    client = app.app.test_client()
+    res = client.get("/feature-importance")
+    assert res.status_code == 200
+    assert res.get_json()["features"]
+    assert "max-age" in res.headers["Cache-Control"]
+
+    again = client.get("/feature-importance", headers={"If-None-Match": res.headers["ETag"]})
+    assert again.status_code == 304
+    assert client.get("/feature-importance?type=weight").headers["ETag"] != res.headers["ETag"]
+    assert client.get("/feature-importance?type=nope").status_code == 400
+
+
+def test_native_model_export(tmp_path):
+    import shutil
+
+    import numpy as np
+    from model_store import MODEL_PATH, export_model, load_booster
+
+    model_path = str(tmp_path / "model.pkl")
+    shutil.copy(MODEL_PATH, model_path)
+    export_model(model_path, fmt="ubj")
+
+    booster = load_booster(model_path)
+    assert booster.attr("source_digest") is not None
+    X = np.zeros((2, 14), dtype=np.float32)
+    assert np.allclose(booster.inplace_predict(X), load_booster(MODEL_PATH).inplace_predict(X))
+
+
+def test_prediction_cache_lru_and_versioning():
+    from prediction_cache import PredictionCache
+
+    cache = PredictionCache(maxsize=2, ttl=60)
+    cache.put((1, 2), "v1", (0.6, 0.4))
+    cache.put((1, 3), "v1", (0.7, 0.3))
+    assert cache.get((1, 2), "v1") == (0.6, 0.4)
+    cache.put((2, 3), "v1", (0.5, 0.5))  # evicts (1, 3), the least recently used
+    assert cache.get((1, 3), "v1") is None
+    assert cache.get((1, 2), "v2") is None  # entries never leak across versions
+
+    # During a reload old and new snapshots alternate without wiping each other
+    cache.put((1, 2), "v2", (0.55, 0.45))  # evicts the least recent v1 entry
+    assert cache.get((2, 3), "v1") is not None
+    assert cache.get((1, 2), "v2") == (0.55, 0.45)
+    cache.put((1, 3), "v2", (0.5, 0.5))  # the old version's last entry ages out through the LRU
+    assert cache.get((2, 3), "v1") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 3, 3)
+    assert stats["size"] == 2 and stats["version"] == "v2"
+
+
+def test_predict_endpoint():
+    import app
+
+    client = app.app.test_client()
+    index = get_snapshot().index
+    names = [index.get_name(fid) for fid in list(index.names_by_id)[:2]]
+
+    res = client.post("/predict", json={"fighterOne": names[0], "fighterTwo": names[1]})
+    assert res.status_code == 200
+    assert res.get_json()["prediction"] in names
+
+    res = client.post("/predict", json={"fighterOne": "Not A Fighter", "fighterTwo": names[1]})
+    assert res.status_code == 404
+
+
+def test_predict_matches_names_without_accents(tmp_path, monkeypatch):
+    import app
+    import registry as registry_module
+    from model_store import MODEL_PATH
+
+    csv_path = tmp_path / "roster.csv"
+    roster = _roster()
+    roster.loc[1, "name"] = "José Aldo"
+    roster.to_csv(csv_path, sep=";", index=False)
+    snapshot = ModelRegistry(MODEL_PATH, str(csv_path)).get()
+    monkeypatch.setattr(registry_module.registry, "_current", snapshot)
+
+    client = app.app.test_client()
+    assert client.get("/search", query_string={"q": "jose aldo"}).get_json()["results"][0]["name"] == "José Aldo"
+    res = client.post("/predict", json={"fighterOne": "Jose Aldo", "fighterTwo": "Shamil Abdurakhimov"})
+    assert res.status_code == 200
+    assert res.get_json()["prediction"] in ("José Aldo", "Shamil Abdurakhimov")
+    assert snapshot.index.get_id("JOSÉ  aldo") == 9
+
+
+def test_predict_batch_matches_single():
+    import app
+    from custom_inputs import getCustomPredict, getCustomPredictBatch
+
+    snapshot = get_snapshot()
+    index = snapshot.index
+    ids = list(index.names_by_id)[:6]
+    pairs = [(ids[0], ids[1]), (ids[3], ids[2]), (ids[4], ids[5])]
+    assert getCustomPredictBatch(pairs, snapshot) == [getCustomPredict(a, b, snapshot) for a, b in pairs]
+
+    client = app.app.test_client()
+    fights = [{"fighterOne": index.get_name(a), "fighterTwo": index.get_name(b)} for a, b in pairs]
+    fights.append({"fighterOne": "Not A Fighter", "fighterTwo": index.get_name(ids[0])})
+    predictions = client.post("/predict/batch", json={"fights": fights}).get_json()["predictions"]
+    assert len(predictions) == 4
+    assert predictions[-1]["error"] == "Unknown fighter"
+
+    assert client.post("/predict/batch", json={"fights": {"fighterOne": "x"}}).status_code == 400
+    assert client.post("/predict/batch", json={"fights": ["x", 1]}).status_code == 400
+    assert client.post("/predict/batch", json=[fights[0]]).status_code == 400
+    assert client.post("/predict/batch", json={"fights": fights * 100}).status_code == 413
+
+
+def test_head_to_head_matches_model(tmp_path):
+    import head_to_head
+    from custom_inputs import getCustomPredict, pick_winner
+
+    manifest = head_to_head.build_matrices(out_dir=str(tmp_path), snapshot=get_snapshot())
+    matrices = head_to_head.HeadToHead(str(tmp_path), manifest)
+    assert matrices.version == get_snapshot().version
+
+    weight = manifest["weights"][0]
+    a, b = matrices.ids[weight][:2].tolist()
+    assert pick_winner(a, b, *matrices.lookup(a, b)) == getCustomPredict(a, b)
+
+    # Rebuilds go to a new directory, so mapped matrices stay intact
+    before = matrices.lookup(a, b)
+    second = head_to_head.build_matrices(out_dir=str(tmp_path), snapshot=get_snapshot())
+    assert second["build"] != manifest["build"]
+    assert matrices.lookup(a, b) == before
+    head_to_head.build_matrices(out_dir=str(tmp_path), snapshot=get_snapshot())
+    builds = [name for name in os.listdir(tmp_path) if name.startswith(head_to_head.BUILD_PREFIX)]
+    assert manifest["build"] not in builds and len(builds) == 2
+
+
+def test_registry_reload_swaps_snapshot(tmp_path):
+    import shutil
+
+    from model_store import MODEL_PATH
+
+    model_path = str(tmp_path / "model.pkl")
+    csv_path = tmp_path / "roster.csv"
+    shutil.copy(MODEL_PATH, model_path)
+    _roster().to_csv(csv_path, sep=";", index=False)
+
+    registry = ModelRegistry(model_path, str(csv_path))
+    old = registry.get()
+    assert not registry.is_stale()
+
+    roster = _roster()
+    roster.loc[0, "wins"] = 21
+    roster.to_csv(csv_path, sep=";", index=False)
+    os.utime(csv_path, ns=(old.stamps[1] + 10**9, old.stamps[1] + 10**9))
+    assert registry.is_stale()
+
+    new = registry.reload()
+    assert registry.get() is new
+    assert new.version != old.version
+    assert old.index.feature_row(7)[12] == 20  # in-flight requests keep the old roster
+    assert new.index.feature_row(7)[12] == 21
+
+
+def test_registry_watch_can_be_stopped(tmp_path):
+    registry = ModelRegistry(str(tmp_path / "model.pkl"), str(tmp_path / "roster.csv"))
+    stop = registry.watch(0.01)
+    assert registry.watch(0.01) is stop  # already watching
+    thread = registry._watch_thread
+    stop.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+    # A stopped watcher can be started again
+    restarted = registry.watch(0.01)
+    assert restarted is not stop and registry._watch_thread.is_alive()
+    restarted.set()
+    registry._watch_thread.join(timeout=5)
+
+
+def _roster_db():
+    import sqlite3
+
+    from fighter_db import ROSTER_COLUMNS, FighterDB
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute(f"CREATE TABLE clean_ufc_fights ({', '.join(ROSTER_COLUMNS)}, "
+                 "name_normalized TEXT GENERATED ALWAYS AS (lower(trim(name))) STORED)")
+    conn.execute("CREATE INDEX idx_name ON clean_ufc_fights (name_normalized)")
+    conn.execute("CREATE TABLE clean_ufc_fights_refresh (id INTEGER PRIMARY KEY, fighters INT)")
+    conn.execute("CREATE TABLE fights (fighter_id, opponent, opponent_id, result, method, round, time, event, "
+                 "event_date, opponent_rank, title_bout)")
+    roster = _roster().reindex(columns=ROSTER_COLUMNS).astype(object)
+    roster = roster.where(roster.notna(), None)
+    conn.executemany(f"INSERT INTO clean_ufc_fights ({', '.join(ROSTER_COLUMNS)}) VALUES "
+                     f"({', '.join('?' * len(ROSTER_COLUMNS))})", roster.values.tolist())
+    conn.execute("INSERT INTO clean_ufc_fights_refresh (fighters) VALUES (2)")
+    conn.executemany("INSERT INTO fights VALUES (7, ?, 9, ?, 'KO/TKO', 1, '2:10', 'UFC 300', ?, NULL, 0)",
+                     [("Papy Abedi", "Win", "2024-04-13"), ("Papy Abedi", "Loss", "2023-01-01")])
+    conn.commit()
+    return conn, FighterDB(conn, dialect="sqlite")
+
+
+def test_fighter_db_lookups():
+    conn, db = _roster_db()
+    assert db.get_id("  shamil   ABDURAKHIMOV ") == 7
+    assert db.find("Nobody") is None
+    assert db.get(9)["name"] == "Papy Abedi"
+    assert [row["id"] for row in db.search("abe")] == [9]
+    assert [row["id"] for row in db.search("abrek")] == [7]
+    assert [f["result"] for f in db.recent_fights(7, limit=1)] == ["Win"]
+
+    # The roster read back from the database indexes the same as the CSV
+    index = FighterIndex.from_db(db)
+    expected = FighterIndex.from_frame(_roster())
+    assert index.ids_by_name == expected.ids_by_name
+    assert (pd.isna(index.features) == pd.isna(expected.features)).all()
+    assert ((index.features == expected.features) | pd.isna(expected.features)).all()
+
+
+def test_registry_reloads_database_roster(tmp_path):
+    from model_store import MODEL_PATH
+
+    conn, db = _roster_db()
+    registry = ModelRegistry(MODEL_PATH, str(tmp_path / "unused.csv"), db=db)
+    old = registry.get()
+    assert old.index.get_id("Papy Abedi") == 9 and not registry.is_stale()
+
+    conn.execute("UPDATE clean_ufc_fights SET wins = 21 WHERE id = 7")
+    conn.execute("INSERT INTO clean_ufc_fights_refresh (fighters) VALUES (2)")
+    conn.commit()
+    assert registry.is_stale()
+    assert registry.reload().index.feature_row(7)[12] == 21
+
+
+def test_metrics_endpoint_and_sampled_logging(monkeypatch):
+    import json
+    import logging
+
+    import app
+    import metrics
+
+    client = app.app.test_client()
+    index = get_snapshot().index
+    names = [index.get_name(fid) for fid in list(index.names_by_id)[:2]]
+    before = metrics.requests_total.value("/predict", "200")
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    level = metrics.log.level
+    metrics.log.addHandler(handler)
+    metrics.log.setLevel(logging.INFO)
+    monkeypatch.setattr(metrics, "REQUEST_LOG_SAMPLE_RATE", 1.0)
+    try:
+        assert client.post("/predict", json={"fighterOne": names[0], "fighterTwo": names[1]}).status_code == 200
+    finally:
+        metrics.log.removeHandler(handler)
+        metrics.log.setLevel(level)
+
+    assert metrics.requests_total.value("/predict", "200") == before + 1
+    record = json.loads(records[-1].getMessage())
+    assert record["route"] == "/predict" and record["fighter_one"] == names[0]
+    assert {"lookup", "serialize"} <= set(record["stages_ms"])
+
+    res = client.get("/metrics")
+    assert res.status_code == 200 and res.content_type.startswith("text/plain")
+    text = res.get_data(as_text=True)
+    assert f'fightmetrics_model_info{{version="{get_snapshot().version}"}} 1' in text
+    assert 'fightmetrics_stage_duration_seconds_bucket{stage="lookup",le="+Inf"}' in text
+    assert 'fightmetrics_request_recent_seconds{route="/predict",quantile="0.99"}' in text
+    assert "fightmetrics_prediction_cache_hit_rate " in text
+    assert "# TYPE fightmetrics_prediction_cache_events_total counter" in text
+    assert 'fightmetrics_prediction_cache_events_total{event="hits"}' in text
+
+
+def test_flask_counts_unhandled_errors(monkeypatch):
+    import app
+    import metrics
+    import predictions
+
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(predictions, "predict_matchup", broken)
+    client = app.app.test_client()
+    before = metrics.requests_total.value("/predict", "500")
+
+    # Propagated errors (debug and testing mode) skip after_request entirely
+    monkeypatch.setitem(app.app.config, "PROPAGATE_EXCEPTIONS", True)
+    with pytest.raises(RuntimeError):
+        client.post("/predict", json={"fighterOne": "a", "fighterTwo": "b"})
+    assert metrics.requests_total.value("/predict", "500") == before + 1
+
+    # Handled ones are counted once, not by both hooks
+    monkeypatch.setitem(app.app.config, "PROPAGATE_EXCEPTIONS", False)
+    assert client.post("/predict", json={"fighterOne": "a", "fighterTwo": "b"}).status_code == 500
+    assert metrics.requests_total.value("/predict", "500") == before + 2
+
+
+def test_histogram_quantiles():
+    from metrics import Histogram
+
+    hist = Histogram("test_seconds", "Test.", window=100)
+    for ms in range(1, 201):
+        hist.observe(ms / 1000)
+    assert hist.count() == 200
+    assert hist.quantiles() == {0.5: 0.151, 0.95: 0.196, 0.99: 0.2}  # last 100 only
+    buckets = [value for name, _, value in hist.samples() if name.endswith("_bucket")]
+    assert buckets == sorted(buckets) and buckets[-1] == 200
+
+
+def test_search_index_prefix_and_typos():
+    from search_index import SearchIndex, fold
+
+    assert fold("  José   O'Reilly-Aldo ") == "jose oreilly aldo"
+    index = SearchIndex([1, 2, 3, 4], ["Jon Jones", "Jonathan Martinez", "José Aldo", "Conor McGregor"],
+                        ["Bones", None, "Junior", "The Notorious"])
+
+    assert [m["id"] for m in index.search("jon")] == [1, 2]
+    assert [m["id"] for m in index.search("jon jo")] == [1]
+    assert index.search("jose aldo")[0] == {"id": 3, "name": "José Aldo", "nickname": "Junior", "match": "prefix"}
+    assert [m["id"] for m in index.search("notor")] == [4]
+    assert [(m["id"], m["match"]) for m in index.search("conor mcgreggor")] == [(4, "fuzzy")]
+    assert index.search("jon", limit=1) == index.search("jon")[:1]
+    assert index.search("") == [] and index.search("zzzz") == []
+
+    # A short nickname must not inflate the score of a name-only match
+    index = SearchIndex([1, 2, 3], ["Jon Jones", "Jonathan Martinez", "Jonas Jonsson"], ["Bones", None, "JJ"])
+    assert [m["id"] for m in index.search("jonathon jons")] == [1, 3, 2]
+    assert all(score <= 1 for score, _ in index._similar("jonas jonsson jj", set()))
+
+
+def test_search_endpoint():
+    import app
+
+    client = app.app.test_client()
+    index = get_snapshot().index
+    name = index.get_name(list(index.names_by_id)[0])
+
+    res = client.get("/search", query_string={"q": name.lower()[:-1], "limit": 3})
+    assert res.status_code == 200
+    results = res.get_json()["results"]
+    assert 0 < len(results) <= 3 and results[0]["name"] == name
+    assert client.get("/search", query_string={"q": name, "limit": "x"}).status_code == 400
+    assert client.get("/search").get_json()["results"] == []
+
+
+def test_symmetric_predictions_are_complementary():
+    from custom_inputs import getCustomPredict, getCustomPredictBatch, orientation_rows, pick_winner
+
+    snapshot = get_snapshot()
+    ids = list(snapshot.index.names_by_id)[:4]
+    pairs = [(ids[0], ids[1]), (ids[1], ids[0]), (ids[2], ids[3])]
+
+    winner, p = getCustomPredict(ids[0], ids[1], snapshot, symmetric=True)
+    assert getCustomPredict(ids[1], ids[0], snapshot, symmetric=True) == (winner, p)
+    assert p >= 0.5
+    assert getCustomPredictBatch(pairs, snapshot, symmetric=True)[:2] == [(winner, p), (winner, p)]
+    assert pick_winner(1, 2, 0.75, 0.5, symmetric=True) == (1, 0.625)
+    assert pick_winner(1, 2, 0.75, 0.5, symmetric=False) == (1, 0.75)
+
+    features = snapshot.index.features
+    X = orientation_rows(features[:3], features[3:6])
+    assert X.dtype == "float32" and X.flags["C_CONTIGUOUS"]
+    assert (X[:3] == (features[:3] - features[3:6]).astype("float32")).all()
+    assert (X[3:] == -X[:3]).all()
+
+
+def test_admin_reload_requires_token(monkeypatch):
+    import app
+
+    client = app.app.test_client()
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/reload").status_code == 403
+
+    monkeypatch.setenv("ADMIN_TOKEN", "s3cret")
+    assert client.post("/admin/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    res = client.post("/admin/reload?wait=1", headers={"X-Admin-Token": "s3cret"})
+    assert res.status_code == 200 and res.get_json()["status"] == "reloaded"
+
+
+def test_concurrent_store_builds(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    csv_path = tmp_path / "roster.csv"
+    _roster().to_csv(csv_path, sep=";", index=False)
+    out_dir = str(tmp_path / "store")
+
+    # Every worker rebuilds at once after a reload; temp files must not collide
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: build_store(str(csv_path), out_dir), range(8)))
+    assert store_is_current(str(csv_path), out_dir)
+    assert not [name for name in os.listdir(out_dir) if name.endswith(".tmp")]
+    assert load_store(out_dir)["names"].tolist() == ["Shamil Abdurakhimov", "Papy Abedi"]
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from Prediction.backtest import MODELS, backtest, betting_returns, load_bouts, walk_forward_folds
+from Prediction.data_loader import MASTER_CSV
+
+
+def test_walk_forward_folds_follow_events():
+    dates = np.array(["2024-01-06"] * 4 + ["2024-01-13"] * 3 + ["2024-01-20"] * 5, dtype="datetime64[D]")
+    folds = walk_forward_folds(dates, folds=3, initial=0.3)
+    assert folds == [(4, 7), (7, 12)]  # cuts inside a card moved forward to the next card
+
+
+def test_betting_returns():
+    y = np.array([1, 0, 1])
+    p = np.array([0.7, 0.6, 0.4])
+    red_odds = np.array([-200.0, 150.0, np.nan])
+    blue_odds = np.array([170.0, -180.0, 100.0])
+    flat, bets, value, value_bets = betting_returns(y, p, red_odds, blue_odds)
+    # Red at -200 wins 0.5; red at +150 loses 1; the bout without odds is skipped
+    assert (flat, bets) == (-0.5, 2)
+    # 0.7 > 1/1.5 on the first bout; 0.6 > 1/2.5 on the second
+    assert (value, value_bets) == (-0.5, 2)
+
+
+def test_backtest_recent_history(tmp_path):
+    path = tmp_path / "master.csv"
+    pd.read_csv(MASTER_CSV).head(1500).to_csv(path, index=False)
+
+    report, predictions = backtest(str(path), folds=3, initial=0.5, jobs=2)
+    assert set(report["model"]) == set(MODELS)
+    assert list(report[report["model"] == "xgboost"]["fold"]) == [0, 1, 2, "all"]
+
+    bouts = load_bouts(str(path))
+    assert len(predictions) == len(bouts) - walk_forward_folds(bouts["Date"].to_numpy(), 3, 0.5)[0][0]
+    assert predictions["Date"].is_monotonic_increasing
+    for model in MODELS:
+        assert predictions[model].between(0, 1).all()
+    overall = report[report["fold"] == "all"]
+    assert (overall["accuracy"] > 0.5).all()
+    assert (overall["bets"] > 0).all()
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from Prediction.data_loader import MASTER_CSV, concat_chunks, iter_csv, load_csv
+
+
+def _write_fights(path):
+    pd.DataFrame({
+        "RedFighter": ["Alex Pereira", "Jon Jones", "Alex Pereira", "Islam Makhachev", "Jon Jones"],
+        "BlueFighter": ["Jiri Prochazka", "Stipe Miocic", "Magomed Ankalaev", "Dustin Poirier", "Ciryl Gane"],
+        "Date": ["2024-06-29", "2024-11-16", "2025-03-08", "2024-06-01", "2023-03-04"],
+        "Winner": ["Red", "Red", "Blue", "Red", "Red"],
+        "RedWins": [11, 27, 12, 26, 26],
+        "RedOdds": [-180.5, -600.0, -130.0, -550.0, -145.0],
+        "WeightClass": ["Light Heavyweight", "Heavyweight", "Light Heavyweight", "Lightweight", "Heavyweight"],
+        "Unused": ["x"] * 5,
+    }).to_csv(path, index=False)
+
+
+def test_load_csv_projects_columns_with_compact_dtypes(tmp_path):
+    path = tmp_path / "fights.csv"
+    _write_fights(path)
+
+    df = load_csv(str(path), ["Winner", "RedFighter", "RedWins", "Date"])
+    assert list(df.columns) == ["Winner", "RedFighter", "RedWins", "Date"]
+    assert isinstance(df["RedFighter"].dtype, pd.CategoricalDtype)
+    assert df["RedWins"].dtype == "float32"
+    assert df["Date"].dtype.kind == "M"
+
+    with pytest.raises(KeyError):
+        load_csv(str(path), ["RedFighter", "Nope"])
+
+
+def test_chunks_match_eager_load(tmp_path):
+    path = tmp_path / "fights.csv"
+    _write_fights(path)
+    columns = ["RedFighter", "WeightClass", "RedOdds"]
+
+    chunks = list(iter_csv(str(path), columns, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    combined = concat_chunks(load_csv(str(path), columns, chunksize=2))
+    assert isinstance(combined["RedFighter"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(combined.astype({"RedFighter": str, "WeightClass": str}),
+                                  load_csv(str(path), columns).astype({"RedFighter": str, "WeightClass": str}))
+
+
+def test_master_csv_uses_less_memory():
+    compact = load_csv(MASTER_CSV)
+    default = pd.read_csv(MASTER_CSV)
+    assert compact.shape == default.shape
+    assert compact.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum() / 2
@@ -21,3 +21,71 @@ def test_base_and_relative():
     df = pd.DataFrame(data)
     score = mathmodel(df, 1, opponent_id=2, last_n=5)
     assert score == 77
+
+
+def _random_fights(seed=0, fighters=40):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for fighter_id in range(fighters):
+        age = int(rng.integers(22, 42))
+        losses = int(rng.integers(0, 3))
+        country = rng.choice(["USA", "Brazil", "Russia", "United States"])
+        for i in range(int(rng.integers(1, 9))):
+            rows.append({
+                "fighter_id": fighter_id,
+                "opponent_id": int(rng.integers(100, 110)),
+                "result": rng.choice(["Win", "Win", "Loss", "Draw"]),
+                "method": rng.choice(["KO", "Submission", "TKO", "Decision - Unanimous", "Decision - Split"]),
+                "date": f"20{10 + i:02d}-0{int(rng.integers(1, 10))}-01",
+                "opponent_rank": rng.choice([None, 0, 1, 5, 15, 16]),
+                "opponent_is_champ": bool(rng.random() < 0.1),
+                "two_judges_all_rounds": bool(rng.random() < 0.5),
+                "fighter_age": age,
+                "fighter_total_losses": losses,
+                "fighter_country": country,
+                "fight_country": rng.choice(["USA", "Brazil", "Russia"]),
+            })
+    # Shuffle so score_all has to do the per-fighter sorting itself
+    return pd.DataFrame(rows).sample(frac=1, random_state=seed)
+
+
+def test_score_all_matches_mathmodel():
+    from Prediction.ufc_predict_math import score_all
+
+    for df in (_random_fights(0), _random_fights(1).drop(columns=["fight_country", "fighter_total_losses"])):
+        for last_n in (3, 5):
+            scores = score_all(df, last_n=last_n)
+            expected = {fighter_id: mathmodel(df, fighter_id, last_n=last_n) for fighter_id in df["fighter_id"].unique()}
+            assert scores.to_dict() == expected
+
+
+def test_fight_history_bonus_matrix():
+    from Prediction.ufc_predict_math import FightHistory, adjusted_scores
+
+    df = pd.DataFrame([
+        {"fighter_id": 1, "opponent_id": 101, "result": "Win", "method": "KO", "date": "2024-01-01"},
+        {"fighter_id": 1, "opponent_id": 102, "result": "Win", "method": "KO", "date": "2024-03-01"},
+        # 2 lost to 101 and 102 but later beat 102
+        {"fighter_id": 2, "opponent_id": 102, "result": "Loss", "method": "Decision", "date": "2023-01-01"},
+        {"fighter_id": 2, "opponent_id": 101, "result": "Loss", "method": "Decision", "date": "2023-02-01"},
+        {"fighter_id": 2, "opponent_id": 102, "result": "Win", "method": "Decision", "date": "2023-06-01"},
+        {"fighter_id": 3, "opponent_id": 101, "result": "Loss", "method": "KO", "date": "2023-06-01"},
+    ])
+    history = FightHistory(df)
+    assert history.relative_victory_score(1, 2) == 5 + 1
+    assert history.relative_victory_score(2, 1) == 0
+
+    matrix = history.bonus_matrix()
+    assert matrix.loc[1].to_dict() == {1: 0, 2: 6, 3: 5}
+    assert matrix.loc[2, 3] == 0 and matrix.loc[3].sum() == 0
+
+    # Every pair in a larger roster agrees with mathmodel's opponent bonus
+    df = _random_fights(2, fighters=25)
+    history = FightHistory(df)
+    matrix = history.bonus_matrix()
+    for a in (0, 5, 11):
+        for b in matrix.columns:
+            assert matrix.loc[a, b] == mathmodel(df, a, opponent_id=b) - mathmodel(df, a)
+    assert adjusted_scores(df, 0, 5, history=history) == adjusted_scores(df, 0, 5)
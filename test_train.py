@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from Prediction.train import DIFF_FEATURES, PRE_FIGHT_COLS, load_fights, metadata_path, train
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "webapp", "backend"))
+
+
+def _write_fights(path, n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for col in PRE_FIGHT_COLS:
+        data[f"r_{col}"] = rng.normal(10, 3, n).round(2)
+        data[f"b_{col}"] = rng.normal(10, 3, n).round(2)
+    logit = 0.8 * (data["r_SLpM_total"] - data["b_SLpM_total"]) - 0.3 * (data["r_age"] - data["b_age"])
+    data["winner"] = np.where(rng.random(n) < 1 / (1 + np.exp(-logit)), "Red", "Blue")
+    data["r_reach"][:3] = np.nan
+    pd.DataFrame(data).to_csv(path, index=False)
+    return pd.DataFrame(data)
+
+
+def test_load_fights_reverses_and_diffs(tmp_path):
+    path = tmp_path / "fights.csv"
+    raw = _write_fights(path)
+
+    X, y = load_fights(str(path))
+    assert list(X.columns) == DIFF_FEATURES
+    assert len(X) == len(raw) - 3  # rows without a reach diff are dropped
+    # Oldest (last) row of the file comes first
+    last = raw.iloc[-1]
+    assert X.iloc[0]["SLpM_total_diff"] == last["r_SLpM_total"] - last["b_SLpM_total"]
+    assert y.iloc[0] == (last["winner"] == "Red")
+
+
+def test_train_writes_model_and_metadata(tmp_path):
+    from model_store import load_booster
+
+    path = tmp_path / "fights.csv"
+    _write_fights(path)
+    output = str(tmp_path / "model.pkl")
+    grid = {"max_depth": [2, 3], "learning_rate": [0.3], "min_child_weight": [1], "subsample": [1.0]}
+
+    meta = train(str(path), output, grid=grid, jobs=2)
+
+    with open(metadata_path(output)) as f:
+        assert json.load(f) == meta
+    assert meta["candidates"] == 2
+    assert set(meta["timings"]) == {"load", "search", "fit", "evaluate", "save"}
+    assert meta["metrics"]["test_accuracy"] > 0.6
+    # The backend can serve it as is
+    assert load_booster(output).feature_names == DIFF_FEATURES
@@ -0,0 +1,221 @@
+import asyncio
+import csv
+import io
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")
+
+from bs4 import BeautifulSoup
+
+from test_ufc_scrape_http import ROUTES, _fixture  # also puts UFC-scrape on sys.path
+
+from checkpoint import CrawlCheckpoint
+from page_cache import PageCache
+from ufc_scrape2 import compute_mma_score
+from ufc_scrape_async import (
+    FIELDNAMES,
+    AsyncPageCache,
+    HostRateLimiter,
+    collect_letter_urls,
+    crawl,
+    listing_pages,
+    parse_recent_fights,
+    scrape_profile,
+)
+
+
+class FakeElement:
+    """The slice of Playwright's element API the engine uses, over parsed HTML."""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    async def query_selector_all(self, selector):
+        return [FakeElement(tag) for tag in self.tag.select(selector)]
+
+    async def query_selector(self, selector):
+        tag = self.tag.select_one(selector)
+        return FakeElement(tag) if tag is not None else None
+
+    async def inner_text(self, selector=None):
+        return (self.tag.select_one(selector) if selector else self.tag).get_text()
+
+    async def get_attribute(self, name):
+        return self.tag.get(name)
+
+
+class FakePage(FakeElement):
+    """A page that serves the fixture HTML for ufcstats.com URLs."""
+
+    def __init__(self, browser):
+        super().__init__(None)
+        self.browser = browser
+        self.url = None
+
+    async def goto(self, url, timeout=None):
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        self.browser.hits.append(path)
+        if path in self.browser.gates:
+            await self.browser.gates[path].wait()
+        if path in self.browser.down:
+            raise TimeoutError(url)
+        self.url = url
+        self.tag = BeautifulSoup(_fixture(ROUTES[path]), "html.parser")
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if self.tag.select_one(selector) is None:
+            raise TimeoutError(selector)
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.hits = []
+        self.down = set()  # paths that fail to load
+        self.gates = {}  # path -> asyncio.Event holding its navigation
+
+    async def new_context(self):
+        return self
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        pass
+
+
+def test_host_rate_limiter_spaces_requests_per_host():
+    limiter = HostRateLimiter(rate=20)
+    times = {}
+
+    async def fetch(url):
+        await limiter.wait(url)
+        times.setdefault(urlsplit(url).netloc, []).append(time.monotonic())
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*[fetch(f"http://{host}/{i}") for i in range(3) for host in ("a.test", "b.test")])
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    for stamps in times.values():
+        assert len(stamps) == 3
+        assert all(later - earlier >= 0.04 for earlier, later in zip(stamps, stamps[1:]))
+    # Hosts are limited independently: 3 slots each, not 6 in a row
+    assert elapsed < 0.2
+    assert HostRateLimiter(rate=0).interval == 0.0
+
+
+def test_async_listing_and_profile_parse():
+    browser = FakeBrowser()
+
+    async def run():
+        page = await browser.new_page()
+        limiter = HostRateLimiter(rate=0)
+        letters = await collect_letter_urls(page, limiter)
+        pages = [item async for item in listing_pages(page, letters[0], limiter)]
+        alpha = pages[0][1][0]
+        fights = await parse_recent_fights(browser, await _profile(alpha), limiter, AsyncPageCache(None))
+        row = await scrape_profile(browser, alpha, limiter, AsyncPageCache(None))
+        return letters, pages, fights, row
+
+    async def _profile(fighter):
+        page = await browser.new_page()
+        await page.goto(fighter["profile_url"])
+        return page
+
+    letters, pages, fights, row = asyncio.run(run())
+    assert letters == ["http://www.ufcstats.com/statistics/fighters?char=a",
+                       "http://www.ufcstats.com/statistics/fighters?char=b"]
+    assert [(number, [f["name"] for f in fighters]) for number, fighters in pages] == \
+        [(1, ["Adam Alpha"]), (2, ["Ann Avery"])]
+    assert pages[0][1][0] == {"name": "Adam Alpha", "profile_url": "/fighter-details/alpha", "nickname": "The Ace",
+                              "wins": 12, "losses": 0, "draws": 0}
+
+    assert [f["result"] for f in fights] == ["Win", "Win"]
+    assert fights[0]["opponent_is_champ"] and fights[0]["opponent_rank"] == 2
+    assert fights[0]["location_country"] == "Brazil"
+    assert fights[1]["all_rounds_judges"] and fights[1]["opponent_rank"] == 9
+    assert row["mma_score"] == compute_mma_score(fights, row["age"], 0, "Brazil")
+
+
+def test_async_crawl_resumes_from_checkpoint(tmp_path):
+    # A crawl that died after page 1 of letter A was written
+    checkpoint = CrawlCheckpoint(str(tmp_path / "scores.csv.checkpoint.json"), {
+        "pages_done": {"http://www.ufcstats.com/statistics/fighters?char=a": 1},
+        "profiles_done": ["/fighter-details/alpha"],
+    })
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=FIELDNAMES)
+    browser = FakeBrowser()
+    cache = PageCache(str(tmp_path / "pages.sqlite"))
+    try:
+        counts = asyncio.run(crawl(browser, writer, checkpoint, HostRateLimiter(rate=0), AsyncPageCache(cache),
+                                   concurrency=2))
+    finally:
+        cache.close()
+
+    assert counts == (2, 0, 0)
+    assert "/statistics/fighters?char=a" not in browser.hits
+    assert "/statistics/fighters?char=a&page=2" in browser.hits
+    assert "/fighter-details/alpha" not in browser.hits
+    assert sorted(row["name"] for row in csv.DictReader(io.StringIO(out.getvalue()), FIELDNAMES)) == \
+        ["Ann Avery", "Ben Bravo"]
+    assert checkpoint.letters_done == {"http://www.ufcstats.com/statistics/fighters?char=a",
+                                       "http://www.ufcstats.com/statistics/fighters?char=b"}
+    assert checkpoint.pages_done["http://www.ufcstats.com/statistics/fighters?char=b"] == 1
+    assert checkpoint.profiles_done == {"/fighter-details/alpha", "/fighter-details/avery", "/fighter-details/bravo"}
+
+
+def _crawl(browser, checkpoint, **kwargs):
+    writer = csv.DictWriter(io.StringIO(), fieldnames=FIELDNAMES)
+    return crawl(browser, writer, checkpoint, HostRateLimiter(rate=0), AsyncPageCache(None), **kwargs)
+
+
+def test_async_listing_runs_ahead_of_slow_profiles(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "scores.csv.checkpoint.json"))
+    browser = FakeBrowser()
+
+    async def run():
+        gate = browser.gates["/fighter-details/alpha"] = asyncio.Event()
+        task = asyncio.create_task(_crawl(browser, checkpoint, concurrency=2))
+
+        async def reached_bravo():
+            while "/fighter-details/bravo" not in browser.hits:
+                await asyncio.sleep(0)
+
+        # Alpha (page 1 of A) is still loading, yet the listing moved on to letter B's
+        # profiles; page 1 of A may not be checkpointed before alpha finishes
+        await asyncio.wait_for(reached_bravo(), timeout=5)
+        assert "http://www.ufcstats.com/statistics/fighters?char=a" not in checkpoint.pages_done
+        gate.set()
+        return await task
+
+    assert asyncio.run(run()) == (3, 0, 0)
+    assert checkpoint.pages_done["http://www.ufcstats.com/statistics/fighters?char=a"] == 2
+    assert len(checkpoint.letters_done) == 2
+
+
+def test_async_failed_profile_keeps_its_page_open(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "scores.csv.checkpoint.json"))
+    browser = FakeBrowser()
+    browser.down.add("/fighter-details/alpha")
+
+    assert asyncio.run(_crawl(browser, checkpoint, concurrency=2)) == (2, 0, 1)
+    letter_a = "http://www.ufcstats.com/statistics/fighters?char=a"
+    assert letter_a not in checkpoint.pages_done and not checkpoint.letter_done(letter_a)
+    assert not checkpoint.profile_done("/fighter-details/alpha")
+    assert checkpoint.letter_done("http://www.ufcstats.com/statistics/fighters?char=b")
+
+    # Resuming walks letter A again and only retries alpha
+    browser = FakeBrowser()
+    assert asyncio.run(_crawl(browser, checkpoint, concurrency=2)) == (1, 0, 0)
+    assert [path for path in browser.hits if path.startswith("/fighter-details")] == ["/fighter-details/alpha"]
+    assert checkpoint.letter_done(letter_a) and checkpoint.pages_done[letter_a] == 2
@@ -0,0 +1,329 @@
+import csv
+import os
+import sqlite3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+SCRAPE_DIR = os.path.join(os.path.dirname(__file__), "UFC-scrape")
+sys.path.insert(0, SCRAPE_DIR)
+
+pytest.importorskip("bs4")
+pytest.importorskip("requests")
+pytest.importorskip("playwright")  # ufc_scrape2 imports it at module level
+
+from checkpoint import page_url
+from db_writer import FIGHT_COLUMNS, FIGHTER_COLUMNS, BatchWriter, fight_writer, ufcstats_id
+from incremental import load_db_snapshot, previous_row
+from page_cache import MISSING, PageCache
+from ufc_scrape2 import compute_mma_score, parse_rank_text
+from ufc_scrape_http import (
+    HttpScraper,
+    parse_fight_rank,
+    parse_listing,
+    parse_profile,
+    scrape_ufc_events,
+)
+
+FIXTURE_DIR = os.path.join(SCRAPE_DIR, "fixtures")
+
+# Request path -> fixture file, standing in for ufcstats.com
+ROUTES = {
+    "/statistics/fighters": "fighters.html",
+    "/statistics/fighters?char=a": "listing_a.html",
+    "/statistics/fighters?char=a&page=2": "listing_a_page2.html",
+    "/statistics/fighters?char=b": "listing_b.html",
+    "/fighter-details/alpha": "fighter_alpha.html",
+    "/fighter-details/avery": "fighter_avery.html",
+    "/fighter-details/bravo": "fighter_bravo.html",
+    "/event-details/ufc-rio": "event_ufc_rio.html",
+    "/event-details/ufc-vegas": "event_ufc_vegas.html",
+    "/fight-details/title-bout": "fight_title_bout.html",
+    "/fight-details/main-card": "fight_main_card.html",
+}
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def ufcstats_site():
+    hits = []
+    down = set()  # paths answered with 404, to simulate an outage
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            name = None if self.path in down else ROUTES.get(self.path)
+            if name is None:
+                self.send_error(404)
+                return
+            body = _fixture(name).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.hits = hits
+    server.down = down
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_parsers_read_fixture_pages():
+    fighters = parse_listing(_fixture("listing_a.html"), "http://www.ufcstats.com/statistics/fighters?char=a")
+    assert fighters == [{
+        "name": "Adam Alpha", "profile_url": "http://www.ufcstats.com/fighter-details/alpha", "nickname": "The Ace",
+        "height": "5' 11\"", "weight": 155, "reach": 72.0, "stance": "Orthodox",
+        "wins": 12, "losses": 0, "draws": 0, "belt": True,
+    }]
+
+    profile = parse_profile(_fixture("fighter_alpha.html"))
+    assert profile["dob"] == "Jul 13, 1990"
+    assert profile["country"] == "Brazil"
+    assert profile["stats"]["Str_Acc"] == 52 and profile["stats"]["SLpM"] == 4.51
+    assert [r["result"] for r in profile["fight_rows"]] == ["Win", "Win"]
+    assert profile["fight_rows"][1]["round"] == 3 and profile["fight_rows"][1]["time"] == "5:00"
+
+    # The upcoming bout row is skipped like the Playwright scrapers do
+    assert len(parse_profile(_fixture("fighter_bravo.html"))["fight_rows"]) == 1
+    assert parse_fight_rank(_fixture("fight_title_bout.html")) == (2, True)
+    assert parse_fight_rank(_fixture("fight_main_card.html")) == (9, False)
+    assert parse_rank_text("#5 contender, ranked #3 on the night") == (3, False)  # rank wording wins
+
+
+def test_http_scrape_writes_scores(tmp_path, ufcstats_site):
+    out = tmp_path / "scores.csv"
+    assert scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, workers=2, cache_path=None) == 3
+
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["name"] for r in rows] == ["Adam Alpha", "Ann Avery", "Ben Bravo"]
+    assert list(rows[0]) == ["name", "nickname", "age", "wins", "losses", "draws", "mma_score"]
+
+    scraper = HttpScraper(ufcstats_site.base_url)
+    alpha = parse_profile(scraper.fetch(ufcstats_site.base_url + "/fighter-details/alpha"), ufcstats_site.base_url)
+    fights = scraper.recent_fights(alpha["fight_rows"])
+    assert fights[0]["opponent_is_champ"] and fights[0]["location_country"] == "Brazil"
+    assert fights[1]["all_rounds_judges"] and fights[1]["opponent_rank"] == 9
+    assert int(rows[0]["mma_score"]) == compute_mma_score(fights, alpha["age"], 0, "Brazil")
+    assert rows[2]["age"] == ""  # DOB "--"
+
+
+def test_http_scrape_stats_mode(tmp_path, ufcstats_site):
+    out = tmp_path / "stats.csv"
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, mode="stats", workers=2, cache_path=None)
+
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = {r["name"]: r for r in csv.DictReader(f)}
+    assert rows["Adam Alpha"]["winstreak"] == "2"
+    assert rows["Adam Alpha"]["belt"] == "True"
+    assert rows["Ann Avery"]["TD_Avg"] == "0.0"  # "--" stored as 0 like ufc_scrape.py
+    assert rows["Ben Bravo"]["TD_Def"] == "0"
+    # Stats mode never opens event or fight-detail pages
+    assert not [p for p in ufcstats_site.hits if p.startswith(("/event-details", "/fight-details"))]
+
+
+def test_page_cache_fetches_each_event_once(tmp_path, ufcstats_site):
+    cache_path = str(tmp_path / "pages.sqlite")
+    detail_hits = lambda: [p for p in ufcstats_site.hits if p.startswith(("/event-details", "/fight-details"))]
+
+    scrape_ufc_events(str(tmp_path / "first.csv"), base_url=ufcstats_site.base_url, workers=3, cache_path=cache_path)
+    # Four bouts share two event pages and two fight pages
+    assert sorted(detail_hits()) == [
+        "/event-details/ufc-rio", "/event-details/ufc-vegas", "/fight-details/main-card", "/fight-details/title-bout",
+    ]
+
+    scrape_ufc_events(str(tmp_path / "second.csv"), base_url=ufcstats_site.base_url, workers=3, cache_path=cache_path)
+    assert len(detail_hits()) == 4
+    assert (tmp_path / "first.csv").read_text() == (tmp_path / "second.csv").read_text()
+
+
+def test_page_cache_ttl(tmp_path):
+    with PageCache(str(tmp_path / "pages.sqlite")) as cache:
+        cache.put("http://x/event", None)
+        assert cache.get("http://x/event") is None
+        assert cache.cached("http://x/fight", lambda: [3, True]) == [3, True]
+        assert cache.cached("http://x/fight", lambda: 1 / 0) == [3, True]
+
+    with PageCache(str(tmp_path / "pages.sqlite"), ttl=-1) as expired:
+        assert expired.get("http://x/event") is MISSING
+        assert expired.purge_expired() == 2
+
+
+def test_incremental_scrape_only_visits_changed_records(tmp_path, ufcstats_site):
+    out = tmp_path / "scores.csv"
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, cache_path=None)
+
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    rows[0]["mma_score"] = "999"  # marks Alpha's row as copied, not rebuilt
+    rows[1]["losses"] = "2"  # Avery lost a fight since the last crawl
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows[:2])  # Bravo is new
+
+    ufcstats_site.hits.clear()
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, cache_path=None, previous_csv=str(out))
+
+    profiles = sorted(p for p in ufcstats_site.hits if p.startswith("/fighter-details"))
+    assert profiles == ["/fighter-details/avery", "/fighter-details/bravo"]
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["name"] for r in rows] == ["Adam Alpha", "Ann Avery", "Ben Bravo"]
+    assert rows[0]["mma_score"] == "999" and rows[1]["losses"] == "3"
+
+    with pytest.raises(ValueError):
+        scrape_ufc_events(str(tmp_path / "stats.csv"), base_url=ufcstats_site.base_url, mode="stats",
+                          cache_path=None, previous_csv=str(out))
+
+
+def test_incremental_db_snapshot_compares_belt():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE ufc_fighters (id INTEGER PRIMARY KEY, name TEXT, nickname TEXT,"
+                 " wins INT, losses INT, draws INT, belt BOOLEAN)")
+    conn.execute("INSERT INTO ufc_fighters VALUES (1, 'Adam  Alpha', 'The Ace', 12, 0, 0, 0)")
+    snapshot = load_db_snapshot(conn.cursor())
+
+    listing = {"name": "Adam Alpha", "nickname": "the ace", "wins": 12, "losses": 0, "draws": 0, "belt": False}
+    assert previous_row(listing, snapshot)["id"] == 1
+    assert previous_row(dict(listing, belt=True), snapshot) is None
+    assert previous_row(dict(listing, name="Someone Else"), snapshot) is None
+
+
+def test_resume_continues_interrupted_crawl(tmp_path, ufcstats_site):
+    full = tmp_path / "full.csv"
+    scrape_ufc_events(str(full), base_url=ufcstats_site.base_url, cache_path=None)
+
+    out = tmp_path / "scores.csv"
+    ufcstats_site.down.add("/statistics/fighters?char=b")
+    with pytest.raises(Exception):
+        scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, cache_path=None)
+    assert os.path.exists(str(out) + ".checkpoint.json")
+    with open(out, "a", encoding="utf-8") as f:
+        f.write("Ben Bra")  # torn write from the crash
+
+    ufcstats_site.down.clear()
+    ufcstats_site.hits.clear()
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, cache_path=None, resume=True)
+
+    # Letter "a" and its profiles were finished and are not fetched again
+    assert not [p for p in ufcstats_site.hits if "char=a" in p or p.endswith(("/alpha", "/avery"))]
+    assert out.read_text() == full.read_text()
+    assert not os.path.exists(str(out) + ".checkpoint.json")
+
+
+def test_checkpoint_page_url():
+    assert page_url("http://www.ufcstats.com/statistics/fighters?char=a", 3) == \
+        "http://www.ufcstats.com/statistics/fighters?char=a&page=3"
+    # Fresh crawls keep the letter URL as linked, including its own page parameter
+    assert page_url("http://www.ufcstats.com/statistics/fighters?char=a&page=all", 1) == \
+        "http://www.ufcstats.com/statistics/fighters?char=a&page=all"
+    assert page_url("http://www.ufcstats.com/statistics/fighters?char=a&page=all", 2) == \
+        "http://www.ufcstats.com/statistics/fighters?char=a&page=2"
+
+
+def _fighters_table():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    columns = ", ".join(c + " TEXT UNIQUE" if c == "ufcstats_id" else c for c in FIGHTER_COLUMNS)
+    conn.execute(f"CREATE TABLE ufc_fighters (id INTEGER PRIMARY KEY, {columns}, CHECK (wins IS NOT NULL))")
+    conn.execute(f"CREATE TABLE fights (id INTEGER PRIMARY KEY, {', '.join(FIGHT_COLUMNS)}, "
+                 "opponent_rank INT, title_bout INT NOT NULL DEFAULT 0, "
+                 "UNIQUE (fighter_id, fight_url), CHECK (fighter_id IS NOT NULL))")
+    return conn
+
+
+def test_batch_writer_upserts_in_batches():
+    conn = _fighters_table()
+    committed = []
+    writer = BatchWriter(conn, batch_size=2, dialect="sqlite", on_commit=committed.extend)
+
+    writer.add({"ufcstats_id": "a1", "name": "Adam Alpha", "wins": 12}, token="a1")
+    assert conn.execute("SELECT COUNT(*) FROM ufc_fighters").fetchone()[0] == 0
+    writer.add({"ufcstats_id": "b2", "name": " Ben  Bravo", "wins": 20}, token="b2")  # stored single-spaced
+    assert committed == ["a1", "b2"]
+
+    writer.add({"ufcstats_id": "a1", "name": "Adam Alpha", "wins": 13}, token="a1")
+    writer.add({"ufcstats_id": "c3", "name": "Broken Row"}, token="c3")  # violates the CHECK
+    writer.close()
+    assert committed == ["a1", "b2", "a1"] and writer.failed == 1
+    assert conn.execute("SELECT name, wins FROM ufc_fighters ORDER BY name").fetchall() == [
+        ("Adam Alpha", 13), ("Ben Bravo", 20),
+    ]
+
+
+def test_db_settings_are_shared_with_the_backend(monkeypatch):
+    import db_settings
+    import db_writer
+
+    assert db_writer.db_config is db_settings.db_config
+    monkeypatch.setenv("UFC_DB_HOST", "db.internal")
+    monkeypatch.setenv("UFC_DB_POOL_SIZE", "8")
+    assert db_writer.db_config()["host"] == "db.internal"
+    assert db_settings.pool_size() == 8
+    monkeypatch.delenv("UFC_DB_POOL_SIZE")
+    assert db_settings.pool_size() == db_settings.DEFAULT_POOL_SIZE
+
+
+def test_http_stats_mode_writes_database(tmp_path, ufcstats_site):
+    conn = _fighters_table()
+    for _ in range(2):  # a re-crawl updates rows instead of duplicating them
+        writer = BatchWriter(conn, batch_size=2, dialect="sqlite")
+        fights = fight_writer(conn, writer, batch_size=2, dialect="sqlite")
+        scrape_ufc_events(str(tmp_path / "stats.csv"), base_url=ufcstats_site.base_url, mode="stats",
+                          cache_path=None, db_writer=writer, fights_writer=fights)
+        assert fights.failed == 0
+
+    rows = conn.execute("SELECT ufcstats_id, name, winstreak, belt FROM ufc_fighters ORDER BY name").fetchall()
+    assert rows == [("alpha", "Adam Alpha", 2, 1), ("avery", "Ann Avery", 0, 0), ("bravo", "Ben Bravo", 0, 0)]
+    # Every scraped profile's past bouts land in fights, linked by row id
+    history = conn.execute(
+        "SELECT f.ufcstats_id, opponent, result, method, round, event, event_date, fights.fight_url "
+        "FROM fights JOIN ufc_fighters f ON f.id = fights.fighter_id ORDER BY f.name, event_date DESC").fetchall()
+    base = ufcstats_site.base_url
+    assert history == [
+        ("alpha", "Ben Bravo", "Win", "KO/TKO", 2, "UFC Rio", "2024-04-13", base + "/fight-details/title-bout"),
+        ("alpha", "Ann Avery", "Win", "Decision - Unanimous", 3, "UFC Vegas", "2023-11-04",
+         base + "/fight-details/main-card"),
+        ("avery", "Adam Alpha", "Loss", "Decision - Unanimous", 3, "UFC Vegas", "2023-11-04",
+         base + "/fight-details/main-card"),
+        ("bravo", "Adam Alpha", "Loss", "KO/TKO", 2, "UFC Rio", "2024-04-13", base + "/fight-details/title-bout"),
+    ]
+    assert ufcstats_id("http://www.ufcstats.com/fighter-details/07f72a2a7591b409/") == "07f72a2a7591b409"
+
+
+def test_incremental_stats_rows_reach_typed_database(tmp_path, ufcstats_site):
+    out = tmp_path / "stats.csv"
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, mode="stats", cache_path=None)
+
+    # STRICT rejects 'True' or '' in INTEGER columns, like MySQL strict mode
+    types = {"ufcstats_id": "TEXT UNIQUE", "name": "TEXT", "nickname": "TEXT", "dob": "TEXT", "height": "TEXT",
+             "stance": "TEXT", "reach": "REAL", "SLpM": "REAL", "SApM": "REAL", "TD_Avg": "REAL", "Sub_Avg": "REAL"}
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    columns = ", ".join(f"{c} {types.get(c, 'INTEGER')}" for c in FIGHTER_COLUMNS)
+    conn.execute(f"CREATE TABLE ufc_fighters (id INTEGER PRIMARY KEY, {columns}) STRICT")
+
+    ufcstats_site.hits.clear()
+    writer = BatchWriter(conn, batch_size=2, dialect="sqlite")
+    scrape_ufc_events(str(out), base_url=ufcstats_site.base_url, mode="stats", cache_path=None,
+                      previous_csv=str(out), db_writer=writer)
+    assert not [p for p in ufcstats_site.hits if p.startswith("/fighter-details")]  # all reused
+    assert writer.failed == 0
+    rows = conn.execute("SELECT name, wins, belt, age FROM ufc_fighters ORDER BY name").fetchall()
+    assert [(name, wins, belt) for name, wins, belt, _ in rows] == [
+        ("Adam Alpha", 12, 1), ("Ann Avery", 8, 0), ("Ben Bravo", 20, 0)]
+    assert all(age is None or isinstance(age, int) for *_, age in rows)
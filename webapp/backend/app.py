@@ -1,30 +1,44 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
-import joblib
-import numpy as np
 import os
-import pandas as pd
 
-# Import custom prediction function
-import custom_inputs
-from custom_inputs import getCustomPredict
-
-# Read in csv file
-DATA_PATH = os.path.join(os.path.dirname(__file__), 'scraped-ufc-data.csv')
-df = pd.read_csv(DATA_PATH, sep=';')
-
-def get_fighter_id(name, df):
-    # Return fighter ID from dataframe using case-insensitive match
-    match = df[df['name'].str.lower() == name.lower()]
-    if not match.empty:
-        return int(match.iloc[0]['id'])
-    return None
+# Request handling shared with the ASGI app
+import metrics
+import predictions
+from registry import registry
 
 app = Flask(__name__)
 CORS(app)
+metrics.configure_logging()
+
+# Load the model and roster up front rather than on the first request
+registry.get()
+
+# Optionally reload automatically when the model or CSV changes on disk
+if os.environ.get('MODEL_WATCH_INTERVAL'):
+    registry.watch(float(os.environ['MODEL_WATCH_INTERVAL']))
+
+
+@app.before_request
+def start_timer():
+    rule = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    g.request_timer = metrics.start_request(rule)
+
+
+@app.after_request
+def note_status(response):
+    g.response_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def record_request(exc):
+    # Teardown also runs when a view raised and no response was made
+    timer = g.pop('request_timer', None)
+    if timer is not None:
+        status = 500 if exc is not None else g.pop('response_status', 500)
+        metrics.finish_request(timer, status)
 
-MODEL_PATH = os.path.join(os.path.dirname(__file__), 'xgb_ufc_model.pkl')
-model = joblib.load(MODEL_PATH)
 
 @app.route('/predict', methods=['POST'])
 def predict():
@@ -33,39 +47,63 @@ def predict():
     fighter_one = data.get('fighterOne')
     fighter_two = data.get('fighterTwo')
 
-    print('Fighter One:', fighter_one)
-    print('Fighter Two:', fighter_two)
+    # Names, ids and the winner go to the sampled request log (see metrics.py)
+    payload, status = predictions.predict_matchup(fighter_one, fighter_two)
 
+    with metrics.stage('serialize'):
+        response = jsonify(payload)
+    return response, status
 
-    fighter_one_id = get_fighter_id(fighter_one, df)
-    fighter_two_id = get_fighter_id(fighter_two, df)
 
-    print('Fighter One ID:', fighter_one_id)
-    print('Fighter Two ID:', fighter_two_id)
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    data = request.get_json(force=True)
+    fights = data.get('fights', []) if isinstance(data, dict) else None
+    payload, status = predictions.predict_card(fights)
+    with metrics.stage('serialize'):
+        response = jsonify(payload)
+    return response, status
 
-    winner_id, confidence = getCustomPredict(fighter_one_id, fighter_two_id)
 
-    if winner_id is None:
-        return jsonify({'error': 'Unable to determine winner'}), 400
+@app.route('/search', methods=['GET'])
+def search():
+    payload, status = predictions.search_fighters(request.args.get('q'), request.args.get('limit'))
+    return jsonify(payload), status
 
-    winner_row = df[df['id'] == winner_id]
-    winner_name = winner_row['name'].iloc[0] if not winner_row.empty else str(winner_id)
 
-    print('Winner ID: ' + str(winner_id))
-    print('Winner Name: ' + str(winner_name))
-    print('Confidence: ' + str(confidence))
+@app.route('/matrix/<int:weight>', methods=['GET'])
+def head_to_head_matrix(weight):
+    payload, status = predictions.head_to_head_matrix(weight)
+    return jsonify(payload), status
 
 
-    return jsonify({'prediction': winner_name, 'confidence': confidence})
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    payload, status = predictions.cache_stats()
+    return jsonify(payload), status
 
 
 @app.route('/feature-importance', methods=['GET'])
 def feature_importance():
-    booster = model.get_booster()
-    importance = booster.get_score(importance_type='gain')
-    sorted_items = sorted(importance.items(), key=lambda x: x[1], reverse=True)
-    features, scores = zip(*sorted_items)
-    return jsonify({'features': list(features), 'scores': list(scores)})
+    body, status, headers = predictions.feature_importance(
+        request.args.get('type', 'gain'), request.headers.get('If-None-Match')
+    )
+    return Response(body, status=status, headers=headers, mimetype='application/json')
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    body, content_type = predictions.metrics_text()
+    return Response(body, content_type=content_type)
+
+
+@app.route('/admin/reload', methods=['POST'])
+def admin_reload():
+    payload, status = predictions.admin_reload(
+        request.headers.get('X-Admin-Token'), wait=bool(request.args.get('wait'))
+    )
+    return jsonify(payload), status
+
 
 if __name__ == '__main__':
     app.run(debug=True)
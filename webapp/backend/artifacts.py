@@ -0,0 +1,20 @@
+"""Version fingerprints for the model and roster files served by the backend."""
+
+import hashlib
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of the file at ``path``."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def artifacts_version(*paths):
+    """Return a short version string covering the contents of ``paths``."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()[:12]
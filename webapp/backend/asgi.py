@@ -0,0 +1,170 @@
+"""ASGI serving mode for the prediction backend.
+
+Exposes the same routes as the Flask app in :mod:`app`, built on
+Starlette.  Request bodies are read without blocking the event loop and
+model work runs in a bounded thread pool, so slow inference never stalls
+other connections.  XGBoost releases the GIL while predicting, so the
+threads run in parallel.
+
+Start it with the production launcher in :mod:`serve`::
+
+    python serve.py --workers 4
+
+Environment:
+
+* ``INFERENCE_THREADS`` -- pool size per worker (default: CPU count)
+* ``MAX_PENDING_REQUESTS`` -- requests allowed in the pool (running or
+  queued) before new ones get ``503`` (default: 64 per thread)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import metrics
+import predictions
+from registry import registry
+
+INFERENCE_THREADS = int(os.environ.get('INFERENCE_THREADS', os.cpu_count() or 4))
+MAX_PENDING_REQUESTS = int(os.environ.get('MAX_PENDING_REQUESTS', 64 * INFERENCE_THREADS))
+
+metrics.configure_logging()
+
+executor = ThreadPoolExecutor(max_workers=INFERENCE_THREADS, thread_name_prefix='inference')
+_pending = None
+
+
+def _pending_slots():
+    # Created lazily so it binds to the server's running event loop
+    global _pending
+    if _pending is None:
+        _pending = asyncio.Semaphore(MAX_PENDING_REQUESTS)
+    return _pending
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """Run ``func`` on the inference pool and return its ``(payload, status)``."""
+    slots = _pending_slots()
+    if slots.locked():
+        return {'error': 'Server busy'}, 503
+    async with slots:
+        loop = asyncio.get_running_loop()
+        # Carry the request's metrics context onto the pool thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
+async def read_json(request):
+    body = await request.body()
+    try:
+        data = json.loads(body) if body else {}
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def respond(result):
+    payload, status = result
+    with metrics.stage('serialize'):
+        return JSONResponse(payload, status_code=status)
+
+
+def timed(route):
+    """Count and time every request to the decorated endpoint under ``route``."""
+    def decorate(endpoint):
+        async def wrapper(request):
+            timer = metrics.start_request(route)
+            status = 500
+            try:
+                response = await endpoint(request)
+                status = response.status_code
+                return response
+            finally:
+                metrics.finish_request(timer, status)
+        return wrapper
+    return decorate
+
+
+async def predict(request):
+    data = await read_json(request)
+    if data is None:
+        return JSONResponse({'error': 'Invalid JSON body'}, status_code=400)
+    return respond(await run_in_pool(predictions.predict_matchup, data.get('fighterOne'), data.get('fighterTwo')))
+
+
+async def predict_batch(request):
+    data = await read_json(request)
+    if data is None:
+        return JSONResponse({'error': 'Invalid JSON body'}, status_code=400)
+    return respond(await run_in_pool(predictions.predict_card, data.get('fights', [])))
+
+
+async def search(request):
+    # In-memory index lookups take microseconds, so no pool hop is needed
+    return respond(predictions.search_fighters(request.query_params.get('q'), request.query_params.get('limit')))
+
+
+async def head_to_head_matrix(request):
+    return respond(await run_in_pool(predictions.head_to_head_matrix, request.path_params['weight']))
+
+
+async def cache_stats(request):
+    return respond(predictions.cache_stats())
+
+
+async def feature_importance(request):
+    # Served from bytes precomputed at model load, so no pool hop is needed
+    body, status, headers = predictions.feature_importance(
+        request.query_params.get('type', 'gain'), request.headers.get('If-None-Match')
+    )
+    return Response(body, status_code=status, headers=headers, media_type='application/json')
+
+
+async def metrics_endpoint(request):
+    body, content_type = predictions.metrics_text()
+    return Response(body, headers={'Content-Type': content_type})
+
+
+async def admin_reload(request):
+    # The reload itself happens on a background thread unless ?wait=1
+    wait = bool(request.query_params.get('wait'))
+    token = request.headers.get('X-Admin-Token')
+    return respond(await run_in_pool(predictions.admin_reload, token, wait=wait))
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # Load the model and roster before accepting traffic
+    await asyncio.get_running_loop().run_in_executor(executor, registry.get)
+    watcher = None
+    if os.environ.get('MODEL_WATCH_INTERVAL'):
+        watcher = registry.watch(float(os.environ['MODEL_WATCH_INTERVAL']))
+    yield
+    if watcher is not None:
+        watcher.set()
+
+
+app = Starlette(
+    routes=[
+        Route('/predict', timed('/predict')(predict), methods=['POST']),
+        Route('/predict/batch', timed('/predict/batch')(predict_batch), methods=['POST']),
+        Route('/search', timed('/search')(search), methods=['GET']),
+        Route('/matrix/{weight:int}', timed('/matrix/<int:weight>')(head_to_head_matrix), methods=['GET']),
+        Route('/cache/stats', timed('/cache/stats')(cache_stats), methods=['GET']),
+        Route('/feature-importance', timed('/feature-importance')(feature_importance), methods=['GET']),
+        Route('/metrics', timed('/metrics')(metrics_endpoint), methods=['GET']),
+        Route('/admin/reload', timed('/admin/reload')(admin_reload), methods=['POST']),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])],
+    lifespan=lifespan,
+)
@@ -1,72 +1,131 @@
-import joblib
+import numpy as np
 import os
 import pandas as pd
+import threading
 
-# Load the model located in the same directory as this file
-MODEL_PATH = os.path.join(os.path.dirname(__file__), "xgb_ufc_model.pkl")
-model = joblib.load(MODEL_PATH)
+import metrics
+from prediction_cache import PredictionCache
+from registry import get_snapshot
 
-# Read in up-to-date dataset that ships with the backend
-DATA_PATH = os.path.join(os.path.dirname(__file__), "scraped-ufc-data.csv")
-df = pd.read_csv(DATA_PATH, sep=';')
+# Repeated matchups are served from here; size/TTL are tunable per deploy
+prediction_cache = PredictionCache(
+    maxsize=int(os.environ.get('PREDICTION_CACHE_SIZE', 4096)),
+    ttl=float(os.environ.get('PREDICTION_CACHE_TTL', 3600)),
+)
 
-# helper function to clean data to match ML dataset
-def height_str_to_cm(height_str):
-    try:
-        feet, inches = height_str.replace('"', '').split("'")
-        feet = int(feet.strip())
-        inches = int(inches.strip())
-        return int(feet * 30.48 + inches * 2.54)
-    except:
-        return None  # or 0, or raise an error
+# SYMMETRIC_PREDICTIONS=1 reports the average of p(f1 wins) over both orientations
+# instead of the more confident orientation (see pick_winner)
+SYMMETRIC_PREDICTIONS = os.environ.get('SYMMETRIC_PREDICTIONS', '').lower() not in ('', '0', 'false', 'no')
 
-# enter fighter ids ex: calcdiff(64, 22)
-def getCustomPredict(fighter1, fighter2):
-    columns = ['SLpM', 'SApM', 'Str_Acc', 'TD_Acc', 'Str_Def', 'TD_Def', 'Sub_Avg',
-               'TD_Avg', 'age', 'height', 'weight', 'reach', 'wins', 'losses']
-
-    f1 = df.loc[df['id'] == fighter1, columns].iloc[0]
-    f2 = df.loc[df['id'] == fighter2, columns].iloc[0]
-
-    f1_height = height_str_to_cm(f1['height'])
-    f2_height = height_str_to_cm(f2['height'])
-
-
-    def make_input(winner, loser, winner_height, loser_height):
-        return pd.DataFrame([{
-            'SLpM_total_diff': winner['SLpM'] - loser['SLpM'],
-            'SApM_total_diff': winner['SApM'] - loser['SApM'],
-            'sig_str_acc_total_diff': winner['Str_Acc'] - loser['Str_Acc'],
-            'td_acc_total_diff': winner['TD_Acc'] - loser['TD_Acc'],
-            'str_def_total_diff': winner['Str_Def'] - loser['Str_Def'],
-            'td_def_total_diff': winner['TD_Def'] - loser['TD_Def'],
-            'sub_avg_diff': winner['Sub_Avg'] - loser['Sub_Avg'],
-            'td_avg_diff': winner['TD_Avg'] - loser['TD_Avg'],
-            'age_diff': winner['age'] - loser['age'],
-            'height_diff': winner_height - loser_height,
-            'weight_diff': winner['weight'] - loser['weight'],
-            'reach_diff': winner['reach'] - loser['reach'],
-            'wins_total_diff': winner['wins'] - loser['wins'],
-            'losses_total_diff': winner['losses'] - loser['losses']
-        }])
-
-    # Try both orders
-    X1 = make_input(f1, f2, f1_height, f2_height)
-    X2 = make_input(f2, f1, f2_height, f1_height)
-
-    # Predict both directions
-    p1 = model.predict_proba(X1)[0][1]  # prob f1 wins
-    p2 = model.predict_proba(X2)[0][1]  # prob f2 wins (if f2 was first)
+# Model inputs, in the same order as fighter_index.FEATURE_COLUMNS
+FEATURE_NAMES = ['SLpM_total_diff', 'SApM_total_diff', 'sig_str_acc_total_diff', 'td_acc_total_diff',
+                 'str_def_total_diff', 'td_def_total_diff', 'sub_avg_diff', 'td_avg_diff', 'age_diff',
+                 'height_diff', 'weight_diff', 'reach_diff', 'wins_total_diff', 'losses_total_diff']
+
+
+def make_input(winner, loser):
+    # winner/loser are feature rows (or broadcastable stacks of rows) from the fighter index
+    diff = np.reshape(winner - loser, (-1, len(FEATURE_NAMES)))
+    return pd.DataFrame(diff, columns=FEATURE_NAMES)
+
+
+def predict_proba(X, snapshot=None):
+    # Probability that the first fighter of each row wins
+    if snapshot is None:
+        snapshot = get_snapshot()
+    return snapshot.booster.inplace_predict(X)
+
+
+# Per-thread float32 buffer holding both orientations of one matchup
+_buffers = threading.local()
 
+
+def _pair_buffer():
+    buffer = getattr(_buffers, 'pair', None)
+    if buffer is None:
+        buffer = _buffers.pair = np.empty((2, len(FEATURE_NAMES)), dtype=np.float32)
+    return buffer
+
+
+def orientation_rows(features1, features2, out=None):
+    # Both orientations of n matchups as one float32 model input: rows [:n] are f1 - f2,
+    # rows [n:] the same differences negated. The difference is taken once, in the store's
+    # float64, and rounded to float32 on write, so inputs match the notebook; negation is exact.
+    n = len(features1)
+    if out is None:
+        out = np.empty((2 * n, len(FEATURE_NAMES)), dtype=np.float32)
+    np.subtract(features1, features2, out=out[:n], casting='same_kind')
+    np.negative(out[:n], out=out[n:])
+    return out
+
+
+def pick_winner(fighter1, fighter2, p1, p2, symmetric=None):
+    # p1: fighter1 wins with fighter1 first; p2: fighter2 wins with fighter2 first
+    if symmetric is None:
+        symmetric = SYMMETRIC_PREDICTIONS
+    if symmetric:
+        # Average both orientations so swapping the fighters gives the complementary confidence
+        p = (float(p1) + 1.0 - float(p2)) / 2
+        return (fighter1, p) if p >= 0.5 else (fighter2, 1.0 - p)
     # Choose the higher confidence direction and return the winner id and probability
     if p1 >= p2:
-        winner_id = fighter1
-        confidence = float(p1)
-    else:
-        winner_id = fighter2
-        confidence = float(p2)
+        return fighter1, float(p1)
+    return fighter2, float(p2)
+
+
+def _pair_probs(fighter1, fighter2, snapshot):
+    with metrics.stage('features'):
+        f1 = snapshot.index.feature_row(fighter1)
+        f2 = snapshot.index.feature_row(fighter2)
+
+        # Try both orders: row 0 is f1 - f2, row 1 is f2 - f1
+        X = orientation_rows(f1[None], f2[None], out=_pair_buffer())
+
+    # Predict both directions in one call
+    with metrics.stage('predict_proba'):
+        p1, p2 = predict_proba(X, snapshot)  # prob f1 wins, prob f2 wins (if f2 was first)
+    return float(p1), float(p2)
+
+
+# enter fighter ids ex: calcdiff(64, 22)
+def getCustomPredict(fighter1, fighter2, snapshot=None, symmetric=None):
+    if snapshot is None:
+        snapshot = get_snapshot()
+
+    # Cache on the order-normalized pair so both orderings share an entry
+    key = (fighter1, fighter2) if fighter1 <= fighter2 else (fighter2, fighter1)
+    probs = prediction_cache.get(key, snapshot.version)
+    if probs is None:
+        probs = _pair_probs(key[0], key[1], snapshot)
+        prediction_cache.put(key, snapshot.version, probs)
+
+    p1, p2 = probs if key[0] == fighter1 else probs[::-1]
+    return pick_winner(fighter1, fighter2, p1, p2, symmetric)
+
+
+# Score many matchups at once, pairs ex: [(64, 22), (18, 1313)]
+def getCustomPredictBatch(pairs, snapshot=None, symmetric=None):
+    if snapshot is None:
+        snapshot = get_snapshot()
+    if not pairs:
+        return []
+
+    index = snapshot.index
+
+    with metrics.stage('features'):
+        rows1 = [index.rows_by_id[fighter1] for fighter1, _ in pairs]
+        rows2 = [index.rows_by_id[fighter2] for _, fighter2 in pairs]
+
+        # Both orientations stacked into one matrix: f1 - f2 rows, then f2 - f1 rows
+        X = orientation_rows(index.features[rows1], index.features[rows2])
+
+    with metrics.stage('predict_proba'):
+        probs = predict_proba(X, snapshot)
+    p1s = probs[:len(pairs)]
+    p2s = probs[len(pairs):]
 
-    return winner_id, confidence
+    return [pick_winner(fighter1, fighter2, p1, p2, symmetric)
+            for (fighter1, fighter2), p1, p2 in zip(pairs, p1s, p2s)]
 
 
 
@@ -0,0 +1,32 @@
+"""Database connection settings shared by the backend and the scrapers.
+
+Both sides talk to the same MySQL database, configured through the
+environment:
+
+* ``UFC_DB_HOST`` (default ``localhost``), ``UFC_DB_PORT`` (``3306``)
+* ``UFC_DB_USER`` (``root``), ``UFC_DB_PASSWORD`` (empty)
+* ``UFC_DB_NAME`` (``ufc_data``), ``UFC_DB_POOL_SIZE`` (``4``)
+
+This module has no dependencies, so ``UFC-scrape/db_writer.py`` imports
+it from here rather than keeping its own copy.
+"""
+
+import os
+
+DEFAULT_POOL_SIZE = 4
+
+
+def db_config():
+    """Return ``mysql.connector`` connection settings from the environment."""
+    return {
+        'host': os.environ.get('UFC_DB_HOST', 'localhost'),
+        'port': int(os.environ.get('UFC_DB_PORT', 3306)),
+        'user': os.environ.get('UFC_DB_USER', 'root'),
+        'password': os.environ.get('UFC_DB_PASSWORD', ''),
+        'database': os.environ.get('UFC_DB_NAME', 'ufc_data'),
+    }
+
+
+def pool_size():
+    """Return the connection pool size from ``UFC_DB_POOL_SIZE``."""
+    return max(1, int(os.environ.get('UFC_DB_POOL_SIZE', DEFAULT_POOL_SIZE)))
@@ -0,0 +1,145 @@
+"""Database access to the fighter roster and fight history.
+
+The scrapers write ``ufc_fighters`` and the crawl ends with
+``CALL refresh_clean_ufc_fights()``, which rebuilds the materialized
+``clean_ufc_fights`` table (see ``SQL/database-init.sql``).  This module
+reads that table instead of ``scraped-ufc-data.csv``:
+
+* :meth:`FighterDB.roster_frame` returns the roster in the CSV's columns,
+  so the backend builds the same :class:`fighter_index.FighterIndex` from it
+* :meth:`FighterDB.get` / :meth:`FighterDB.find` are single-row lookups on
+  the primary key and the ``name_normalized`` index
+* :meth:`FighterDB.search` matches partial names through the FULLTEXT index
+* :meth:`FighterDB.recent_fights` reads the ``fights`` history table
+
+Set ``FIGHTER_DB=1`` to have the backend load its roster from here; the
+connection is configured with the same ``UFC_DB_*`` variables as the
+scrapers (see :mod:`db_settings`).  The ``sqlite`` dialect runs the same queries against SQLite
+for local runs and tests.
+"""
+
+import os
+import re
+import threading
+
+import pandas as pd
+
+from db_settings import db_config
+from fighter_index import normalize_name
+
+CLEAN_TABLE = 'clean_ufc_fights'
+FIGHTS_TABLE = 'fights'
+REFRESH_TABLE = 'clean_ufc_fights_refresh'
+
+# Columns of scraped-ufc-data.csv, in order
+ROSTER_COLUMNS = ['id', 'name', 'nickname', 'dob', 'age', 'height', 'weight', 'reach', 'stance',
+                  'winstreak', 'wins', 'losses', 'draws', 'belt',
+                  'SLpM', 'Str_Acc', 'SApM', 'Str_Def', 'TD_Avg', 'TD_Acc', 'TD_Def', 'Sub_Avg']
+
+
+def connect(config=None):
+    import mysql.connector
+
+    return mysql.connector.connect(**(config or db_config()))
+
+
+def from_env():
+    """Return a :class:`FighterDB` when ``FIGHTER_DB`` is set, else ``None``."""
+    if not os.environ.get('FIGHTER_DB'):
+        return None
+    return FighterDB(connect())
+
+
+def _fulltext_query(text):
+    # Every word must match, each as a prefix: "alex per" -> "+alex* +per*"
+    words = re.findall(r'\w+', text)
+    return ' '.join(f'+{word}*' for word in words)
+
+
+class FighterDB:
+    """Keyed and partial-name queries over one DB-API connection.
+
+    Queries are serialized with a lock, so one instance can be shared by
+    the request threads and the registry's reload thread.
+    """
+
+    def __init__(self, conn, dialect='mysql', table=CLEAN_TABLE):
+        self.conn = conn
+        self.dialect = dialect
+        self.table = table
+        self._placeholder = '%s' if dialect == 'mysql' else '?'
+        self._lock = threading.Lock()
+
+    def _query(self, sql, params=()):
+        sql = sql.replace('%s', self._placeholder)
+        with self._lock:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute(sql, params)
+                columns = [d[0] for d in cursor.description]
+                rows = [dict(zip(columns, values)) for values in cursor.fetchall()]
+            finally:
+                cursor.close()
+            # Don't hold a snapshot open between queries (InnoDB repeatable read)
+            self.conn.commit()
+        return rows
+
+    def _one(self, sql, params=()):
+        rows = self._query(sql, params)
+        return rows[0] if rows else None
+
+    def get(self, fighter_id):
+        """Return the roster row for ``fighter_id`` or ``None``."""
+        return self._one(f'SELECT {", ".join(ROSTER_COLUMNS)} FROM {self.table} WHERE id = %s', (fighter_id,))
+
+    def find(self, name):
+        """Return the roster row whose name matches ``name`` (case and spacing insensitive)."""
+        # Keep the first fighter for duplicated names, like FighterIndex
+        return self._one(
+            f'SELECT {", ".join(ROSTER_COLUMNS)} FROM {self.table} WHERE name_normalized = %s ORDER BY id LIMIT 1',
+            (normalize_name(name),),
+        )
+
+    def get_id(self, name):
+        row = self.find(name)
+        return None if row is None else row['id']
+
+    def search(self, text, limit=10):
+        """Return up to ``limit`` ``{id, name, nickname}`` rows matching part of a name."""
+        if self.dialect == 'mysql':
+            query = _fulltext_query(text)
+            if not query:
+                return []
+            return self._query(
+                f'SELECT id, name, nickname FROM {self.table} '
+                f'WHERE MATCH(name, nickname) AGAINST (%s IN BOOLEAN MODE) LIMIT %s',
+                (query, limit),
+            )
+        pattern = f'%{normalize_name(text)}%'
+        return self._query(
+            f'SELECT id, name, nickname FROM {self.table} '
+            f'WHERE name_normalized LIKE %s OR lower(nickname) LIKE %s ORDER BY id LIMIT %s',
+            (pattern, pattern, limit),
+        )
+
+    def recent_fights(self, fighter_id, limit=5):
+        """Return the last ``limit`` fights of ``fighter_id``, newest first."""
+        return self._query(
+            f'SELECT opponent, opponent_id, result, method, round, time, event, event_date, '
+            f'opponent_rank, title_bout FROM {FIGHTS_TABLE} '
+            f'WHERE fighter_id = %s ORDER BY event_date DESC LIMIT %s',
+            (fighter_id, limit),
+        )
+
+    def roster_frame(self):
+        """Return the whole clean roster as a DataFrame shaped like the CSV."""
+        rows = self._query(f'SELECT {", ".join(ROSTER_COLUMNS)} FROM {self.table} ORDER BY id')
+        return pd.DataFrame(rows, columns=ROSTER_COLUMNS)
+
+    def version(self):
+        """Return a string that changes every time the clean table is refreshed."""
+        row = self._one(f'SELECT MAX(id) AS refresh FROM {REFRESH_TABLE}')
+        return f'db{row["refresh"] if row else None}'
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,83 @@
+"""In-memory fighter lookup index for the prediction backend.
+
+The index sits on top of the memory-mapped columnar store written by
+:mod:`fighter_store` and maps a normalized fighter name to its id, and an
+id to its precomputed feature row.  Names that do not match exactly fall
+back to their accent-folded form (see :func:`search_index.fold`), so
+``"Jose Aldo"`` finds the fighter ``/search`` shows as ``"José Aldo"``.  Request handlers use it
+instead of scanning the roster DataFrame with boolean masks.
+
+The backend keeps the current index in :mod:`registry`, which builds a
+new one when the CSV (or, with ``FIGHTER_DB``, the database roster)
+changes and swaps it in once it is complete.
+"""
+
+import os
+
+from artifacts import artifacts_version
+from fighter_store import DATA_PATH, FEATURE_COLUMNS, frame_to_columns, open_store
+from search_index import fold
+
+
+def normalize_name(name):
+    """Return the lookup key for ``name`` (case and whitespace insensitive)."""
+    if not name:
+        return ''
+    return ' '.join(str(name).split()).lower()
+
+
+class FighterIndex:
+    """Name -> id and id -> feature row lookups for one roster snapshot."""
+
+    def __init__(self, columns, mtime=None, version=None):
+        self.mtime = mtime
+        self.version = version
+
+        ids = columns['ids'].tolist()
+        names = columns['names'].tolist()
+
+        # Keep the first fighter for duplicated names, like the old mask lookup
+        self.ids_by_name = {}
+        self.ids_by_folded_name = {}
+        for fighter_id, name in zip(ids, names):
+            self.ids_by_name.setdefault(normalize_name(name), fighter_id)
+            self.ids_by_folded_name.setdefault(fold(name), fighter_id)
+
+        self.names_by_id = dict(zip(ids, names))
+        self.nicknames_by_id = dict(zip(ids, columns['nicknames'].tolist()))
+        self.rows_by_id = {fighter_id: pos for pos, fighter_id in enumerate(ids)}
+
+        # Memory-mapped when built from the store, shared across workers
+        self.features = columns['features']
+
+    @classmethod
+    def from_frame(cls, df, mtime=None):
+        return cls(frame_to_columns(df), mtime=mtime)
+
+    @classmethod
+    def from_csv(cls, path=DATA_PATH):
+        mtime = os.stat(path).st_mtime_ns
+        return cls(open_store(path), mtime=mtime, version=artifacts_version(path))
+
+    @classmethod
+    def from_db(cls, db):
+        """Build the index from a :class:`fighter_db.FighterDB` roster."""
+        version = db.version()
+        return cls(frame_to_columns(db.roster_frame()), version=version)
+
+    def __len__(self):
+        return len(self.rows_by_id)
+
+    def get_id(self, name):
+        """Return the fighter id for ``name`` or ``None`` when unknown."""
+        fighter_id = self.ids_by_name.get(normalize_name(name))
+        if fighter_id is None:
+            fighter_id = self.ids_by_folded_name.get(fold(name))
+        return fighter_id
+
+    def get_name(self, fighter_id):
+        return self.names_by_id.get(fighter_id)
+
+    def feature_row(self, fighter_id):
+        """Return the feature row for ``fighter_id`` (raises ``KeyError`` if unknown)."""
+        return self.features[self.rows_by_id[fighter_id]]
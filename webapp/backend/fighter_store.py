@@ -0,0 +1,131 @@
+"""Preprocessed columnar copy of the fighter roster.
+
+``python fighter_store.py`` parses ``scraped-ufc-data.csv`` once and
+writes typed ``.npy`` columns to ``fighter_store/``:
+
+* ``ids.npy`` -- int32 fighter ids
+* ``names.npy`` / ``nicknames.npy`` -- fixed-width unicode strings
+* ``features.npy`` -- C-contiguous matrix in ``FEATURE_COLUMNS`` order
+  with heights already converted to centimetres (missing values are NaN)
+
+The features stay float64: the model was trained on float64 differences
+cast to float32, and differencing float32 stats lands on the other side
+of its split thresholds for some matchups.
+
+The backend memory-maps these files, so every worker shares the same
+pages instead of parsing the CSV and holding its own copy.  The store is
+rebuilt automatically when the CSV no longer matches the one it was built
+from.
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "scraped-ufc-data.csv")
+STORE_DIR = os.path.join(os.path.dirname(__file__), "fighter_store")
+MANIFEST_NAME = "manifest.json"
+
+# Roster columns used by the model, in the order of its diff features
+FEATURE_COLUMNS = ['SLpM', 'SApM', 'Str_Acc', 'TD_Acc', 'Str_Def', 'TD_Def', 'Sub_Avg',
+                   'TD_Avg', 'age', 'height', 'weight', 'reach', 'wins', 'losses']
+
+
+# helper function to clean data to match ML dataset
+def height_str_to_cm(height_str):
+    try:
+        feet, inches = height_str.replace('"', '').split("'")
+        feet = int(feet.strip())
+        inches = int(inches.strip())
+        return int(feet * 30.48 + inches * 2.54)
+    except:
+        return None  # or 0, or raise an error
+
+
+def default_store_dir(csv_path):
+    """Return the store directory for ``csv_path`` (``fighter_store/`` for the bundled CSV)."""
+    if os.path.abspath(csv_path) == os.path.abspath(DATA_PATH):
+        return STORE_DIR
+    return os.path.splitext(csv_path)[0] + '_store'
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def frame_to_columns(df):
+    """Return the typed store columns for a roster DataFrame."""
+    features = df[FEATURE_COLUMNS].copy()
+    features['height'] = features['height'].map(height_str_to_cm)
+    return {
+        'ids': df['id'].to_numpy(dtype=np.int32),
+        'names': df['name'].fillna('').astype(str).to_numpy(dtype=str),
+        'nicknames': df['nickname'].fillna('').astype(str).to_numpy(dtype=str),
+        'features': np.ascontiguousarray(features.to_numpy(dtype=np.float64, na_value=np.nan)),
+    }
+
+
+def build_store(csv_path=DATA_PATH, out_dir=None):
+    """Parse ``csv_path`` and write the columnar store to ``out_dir``."""
+    if out_dir is None:
+        out_dir = default_store_dir(csv_path)
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = _source_stamp(csv_path)
+    columns = frame_to_columns(pd.read_csv(csv_path, sep=';'))
+
+    # Each file is swapped in whole; the manifest goes last so readers
+    # never pair new columns with an old manifest.  Temp names are unique
+    # because every worker may rebuild at once after a reload.
+    for name, values in columns.items():
+        with _temp_file(out_dir, f'{name}.npy') as f:
+            np.save(f, values)
+        os.replace(f.name, os.path.join(out_dir, f'{name}.npy'))
+
+    manifest = {'source': stamp, 'rows': len(columns['ids']), 'features': FEATURE_COLUMNS}
+    with _temp_file(out_dir, MANIFEST_NAME, mode='w') as f:
+        json.dump(manifest, f)
+    os.replace(f.name, os.path.join(out_dir, MANIFEST_NAME))
+    return manifest
+
+
+def _temp_file(out_dir, name, mode='wb'):
+    # Per-process unique sibling of out_dir/name, renamed into place by the caller
+    return tempfile.NamedTemporaryFile(mode, dir=out_dir, prefix=name + '.', suffix='.tmp', delete=False)
+
+
+def store_is_current(csv_path=DATA_PATH, out_dir=None):
+    """Return ``True`` if ``out_dir`` holds a store built from the current CSV."""
+    if out_dir is None:
+        out_dir = default_store_dir(csv_path)
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return manifest.get('source') == _source_stamp(csv_path) and manifest.get('features') == FEATURE_COLUMNS
+
+
+def load_store(out_dir=STORE_DIR):
+    """Memory-map the store columns in ``out_dir``."""
+    return {
+        name: np.load(os.path.join(out_dir, f'{name}.npy'), mmap_mode='r')
+        for name in ('ids', 'names', 'nicknames', 'features')
+    }
+
+
+def open_store(csv_path=DATA_PATH, out_dir=None):
+    """Return the memory-mapped store, rebuilding it first if it is stale."""
+    if out_dir is None:
+        out_dir = default_store_dir(csv_path)
+    if not store_is_current(csv_path, out_dir):
+        build_store(csv_path, out_dir)
+    return load_store(out_dir)
+
+
+if __name__ == '__main__':
+    manifest = build_store()
+    print(f"Wrote {manifest['rows']} fighters to {STORE_DIR}")
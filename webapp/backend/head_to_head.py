@@ -0,0 +1,157 @@
+"""Precomputed head-to-head win probabilities per weight class.
+
+Run ``python head_to_head.py`` after the roster or model changes.  For
+every value of the roster's ``weight`` column it scores all fighter
+pairs with :func:`custom_inputs.make_input` and writes:
+
+* ``matrices/<build>/<weight>.npy`` -- float32 matrix where ``[i, j]``
+  is the probability that ``ids[i]`` beats ``ids[j]`` with ``ids[i]`` in
+  the first slot (the ``p1`` of ``getCustomPredict``)
+* ``matrices/<build>/<weight>_ids.npy`` -- the fighter ids for the
+  rows/columns
+* ``matrices/manifest.json`` -- the build directory, weights and the
+  model/roster version
+
+The backend memory-maps the matrices, so a lookup is an array index
+instead of a model call.  Matrices built from another model or roster
+version are ignored.  Every build writes a fresh directory and then
+swaps the manifest, so running workers keep reading the files they
+mapped; the previous build is kept for readers that are just switching.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from custom_inputs import make_input, predict_proba
+from fighter_index import FEATURE_COLUMNS
+from registry import get_snapshot, load_snapshot
+
+MATRIX_DIR = os.path.join(os.path.dirname(__file__), 'matrices')
+MANIFEST_NAME = 'manifest.json'
+BUILD_PREFIX = 'build-'
+
+WEIGHT_COLUMN = FEATURE_COLUMNS.index('weight')
+
+
+def weight_classes(index):
+    """Return ``{weight: [fighter ids]}`` for the roster in ``index``."""
+    classes = {}
+    for fighter_id, row in index.rows_by_id.items():
+        weight = index.features[row, WEIGHT_COLUMN]
+        if np.isnan(weight):
+            continue
+        classes.setdefault(int(weight), []).append(fighter_id)
+    return {weight: sorted(ids) for weight, ids in sorted(classes.items())}
+
+
+def build_weight_matrix(ids, snapshot):
+    """Score every ordered pair of ``ids`` in one model call."""
+    index = snapshot.index
+    features = index.features[[index.rows_by_id[fighter_id] for fighter_id in ids]]
+    X = make_input(features[:, None, :], features[None, :, :])
+    probs = predict_proba(X, snapshot)
+    return probs.reshape(len(ids), len(ids)).astype(np.float32)
+
+
+def build_matrices(out_dir=MATRIX_DIR, snapshot=None):
+    """Write the matrices for every weight class plus their manifest."""
+    os.makedirs(out_dir, exist_ok=True)
+    if snapshot is None:
+        snapshot = load_snapshot()
+
+    # Never touch files a running worker may have memory-mapped
+    build_dir = tempfile.mkdtemp(prefix=BUILD_PREFIX, dir=out_dir)
+    weights = []
+    for weight, ids in weight_classes(snapshot.index).items():
+        if len(ids) < 2:
+            continue
+        np.save(os.path.join(build_dir, f'{weight}.npy'), build_weight_matrix(ids, snapshot))
+        np.save(os.path.join(build_dir, f'{weight}_ids.npy'), np.asarray(ids, dtype=np.int32))
+        weights.append(weight)
+        print(f'Weight {weight}: {len(ids)} fighters')
+
+    previous = _read_manifest(out_dir)
+
+    # Written last so a half-built directory is never picked up
+    manifest = {'version': snapshot.version, 'weights': weights, 'build': os.path.basename(build_dir)}
+    fd, tmp_path = tempfile.mkstemp(prefix=MANIFEST_NAME + '.', suffix='.tmp', dir=out_dir)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+
+    keep = {manifest['build'], (previous or {}).get('build')}
+    for name in os.listdir(out_dir):
+        if name.startswith(BUILD_PREFIX) and name not in keep:
+            shutil.rmtree(os.path.join(out_dir, name), ignore_errors=True)
+    return manifest
+
+
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class HeadToHead:
+    """Memory-mapped matrices for one manifest."""
+
+    def __init__(self, directory, manifest, key=None):
+        self.key = key
+        self.version = manifest['version']
+        self.matrices = {}
+        self.ids = {}
+        self.positions = {}  # fighter id -> (weight, position)
+        directory = os.path.join(directory, manifest.get('build', ''))
+        for weight in manifest['weights']:
+            ids = np.load(os.path.join(directory, f'{weight}_ids.npy'))
+            self.matrices[weight] = np.load(os.path.join(directory, f'{weight}.npy'), mmap_mode='r')
+            self.ids[weight] = ids
+            for pos, fighter_id in enumerate(ids.tolist()):
+                self.positions[fighter_id] = (weight, pos)
+
+    def lookup(self, fighter1, fighter2):
+        """Return ``(p1, p2)`` for two fighters of the same weight class, else ``None``."""
+        pos1 = self.positions.get(fighter1)
+        pos2 = self.positions.get(fighter2)
+        if pos1 is None or pos2 is None or pos1[0] != pos2[0]:
+            return None
+        matrix = self.matrices[pos1[0]]
+        return matrix[pos1[1], pos2[1]], matrix[pos2[1], pos1[1]]
+
+
+_matrices = None
+_matrices_lock = threading.Lock()
+
+
+def get_matrices(snapshot=None, directory=MATRIX_DIR):
+    """Return the loaded matrices, or ``None`` if missing or built for another version."""
+    global _matrices
+    if snapshot is None:
+        snapshot = get_snapshot()
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    try:
+        key = os.stat(manifest_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    matrices = _matrices
+    if matrices is None or matrices.key != key:
+        with _matrices_lock:
+            if _matrices is None or _matrices.key != key:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+                _matrices = HeadToHead(directory, manifest, key=key)
+            matrices = _matrices
+
+    return matrices if matrices.version == snapshot.version else None
+
+
+if __name__ == '__main__':
+    build_matrices()
@@ -0,0 +1,295 @@
+"""In-process request metrics and sampled request logging.
+
+Handlers time their stages with :func:`stage`::
+
+    with metrics.stage('lookup'):
+        fighter_id = index.get_id(name)
+
+Every stage feeds a latency histogram, and the request it runs in (see
+:func:`start_request`) keeps a per-stage breakdown for its log record.
+:func:`render` writes everything in the Prometheus text format for
+``GET /metrics``:
+
+* ``fightmetrics_requests_total`` -- requests by route and status
+* ``fightmetrics_request_duration_seconds`` -- request latency histogram
+* ``fightmetrics_stage_duration_seconds`` -- the same per stage
+  (``lookup``, ``matrix_lookup``, ``features``, ``predict_proba``,
+  ``search``, ``serialize``)
+* ``fightmetrics_*_recent_seconds`` -- p50/p95/p99 of the last
+  ``METRICS_WINDOW`` observations
+* gauges and counters refreshed by the collectors registered with
+  :func:`register_collector` (cache size, hit rate and events, model
+  version)
+
+Metrics live in the process, so with several uvicorn workers each one
+reports its own.  Finished requests are logged to the
+``fightmetrics.requests`` logger as one JSON object per line, but only
+when that logger is enabled for ``INFO`` and then only a
+``REQUEST_LOG_SAMPLE_RATE`` fraction of them (default 1%).  Server
+errors are always logged.  The apps call :func:`configure_logging`,
+which sets that level from ``REQUEST_LOG_LEVEL`` (default ``WARNING``).
+"""
+
+import bisect
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+WINDOW = int(os.environ.get('METRICS_WINDOW', 1024))
+REQUEST_LOG_SAMPLE_RATE = float(os.environ.get('REQUEST_LOG_SAMPLE_RATE', 0.01))
+QUANTILES = (0.5, 0.95, 0.99)
+# Seconds; most predictions finish well under a millisecond
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+log = logging.getLogger('fightmetrics.requests')
+
+
+def configure_logging(level=None):
+    """Send request logs to stderr at ``level`` (default: ``REQUEST_LOG_LEVEL``)."""
+    log.setLevel((level or os.environ.get('REQUEST_LOG_LEVEL', 'WARNING')).upper())
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+        log.propagate = False
+
+
+def _labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def set_total(self, *label_values, value):
+        """Mirror a running total kept elsewhere (from a collector)."""
+        with self._lock:
+            self._values[label_values] = value
+
+    def value(self, *label_values):
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, _labels(self.labels, key), value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    """Current value per label set."""
+
+    kind = 'gauge'
+
+    def set(self, *label_values, value):
+        with self._lock:
+            self._values[label_values] = value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Bucketed latency distribution, plus a window of recent observations for quantiles."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS, window=WINDOW):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.window = window
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = {
+                    'counts': [0] * (len(self.buckets) + 1),
+                    'sum': 0.0,
+                    'recent': deque(maxlen=self.window),
+                }
+            series['counts'][bisect.bisect_left(self.buckets, value)] += 1
+            series['sum'] += value
+            series['recent'].append(value)
+
+    def count(self, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series['counts']) if series else 0
+
+    def quantiles(self, *label_values):
+        """Return ``{q: seconds}`` over the recent window (empty before any observation)."""
+        with self._lock:
+            series = self._series.get(label_values)
+            recent = sorted(series['recent']) if series else []
+        if not recent:
+            return {}
+        return {q: recent[min(int(q * len(recent)), len(recent) - 1)] for q in QUANTILES}
+
+    def samples(self):
+        with self._lock:
+            series = {key: (list(s['counts']), s['sum']) for key, s in sorted(self._series.items())}
+        lines = []
+        for key, (counts, total) in series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                lines.append((f'{self.name}_bucket', _labels(self.labels + ('le',), key + (_format(bound),)),
+                              cumulative))
+            lines.append((f'{self.name}_sum', _labels(self.labels, key), total))
+            lines.append((f'{self.name}_count', _labels(self.labels, key), cumulative))
+        return lines
+
+    def render_quantiles(self):
+        # Exposed as a separate summary so the histogram stays aggregatable
+        name = f'{self.name.removesuffix("_duration_seconds")}_recent_seconds'
+        lines = [f'# HELP {name} Quantiles of the last {self.window} observations of {self.name}.',
+                 f'# TYPE {name} summary']
+        with self._lock:
+            keys = sorted(self._series)
+        for key in keys:
+            for q, value in self.quantiles(*key).items():
+                lines.append(f'{name}{_labels(self.labels + ("quantile",), key + (q,))} {_format(value)}')
+        return lines
+
+
+requests_total = Counter('fightmetrics_requests_total', 'HTTP requests handled.', ('route', 'status'))
+request_duration = Histogram('fightmetrics_request_duration_seconds', 'HTTP request latency.', ('route',))
+stage_duration = Histogram('fightmetrics_stage_duration_seconds', 'Latency of each request stage.', ('stage',))
+
+_metrics = [requests_total, request_duration, stage_duration]
+_collectors = []
+
+
+def register(metric):
+    _metrics.append(metric)
+    return metric
+
+
+def register_collector(func):
+    """Call ``func()`` before every :func:`render` to refresh gauges."""
+    _collectors.append(func)
+    return func
+
+
+class RequestTimer:
+    """Stage timings and log fields of one request."""
+
+    def __init__(self, route):
+        self.route = route
+        self.start = time.perf_counter()
+        self.stages = {}
+        self.fields = {}
+        self.token = None
+
+
+_current = contextvars.ContextVar('fightmetrics_request', default=None)
+
+
+def start_request(route):
+    """Begin timing a request; stages run in this context are attributed to it."""
+    timer = RequestTimer(route)
+    timer.token = _current.set(timer)
+    return timer
+
+
+def current_request():
+    return _current.get()
+
+
+def finish_request(timer, status):
+    """Record the request's latency and status, and log it if sampled."""
+    elapsed = time.perf_counter() - timer.start
+    if timer.token is not None:
+        try:
+            _current.reset(timer.token)
+        except ValueError:
+            # Finished from a different context than it started in
+            _current.set(None)
+        timer.token = None
+
+    requests_total.inc(timer.route, str(status))
+    request_duration.observe(elapsed, timer.route)
+
+    level = logging.WARNING if status >= 500 else logging.INFO
+    if not log.isEnabledFor(level):
+        return
+    if level == logging.INFO and random.random() >= REQUEST_LOG_SAMPLE_RATE:
+        return
+    record = {'route': timer.route, 'status': status, 'duration_ms': round(elapsed * 1000, 3),
+              'stages_ms': {name: round(seconds * 1000, 3) for name, seconds in timer.stages.items()}}
+    record.update(timer.fields)
+    log.log(level, json.dumps(record, default=str))
+
+
+def annotate(**fields):
+    """Attach fields to the current request's log record."""
+    timer = _current.get()
+    if timer is not None:
+        timer.fields.update(fields)
+
+
+@contextlib.contextmanager
+def stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_duration.observe(elapsed, name)
+        timer = _current.get()
+        if timer is not None:
+            timer.stages[name] = timer.stages.get(name, 0.0) + elapsed
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def render():
+    """Return every metric in the Prometheus text exposition format."""
+    for collect in _collectors:
+        collect()
+    lines = []
+    for metric in _metrics:
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines.extend(f'{name}{labels} {_format(value)}' for name, labels, value in metric.samples())
+        if isinstance(metric, Histogram):
+            lines.extend(metric.render_quantiles())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,74 @@
+"""Loading and exporting the XGBoost model used by the backend.
+
+``xgb_ufc_model.pkl`` (a pickled ``XGBClassifier``) stays the source of
+truth.  ``python model_store.py`` exports its booster to XGBoost's native
+format (``xgb_ufc_model.json`` by default, or ``--format ubj``), which
+loads faster and without the sklearn wrapper.  The export records a digest
+of the pickle it came from, so a stale export is ignored after the pickle
+is retrained.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+import joblib
+import xgboost as xgb
+
+from artifacts import file_digest
+
+MODEL_DIR = os.path.dirname(__file__)
+MODEL_PATH = os.path.join(MODEL_DIR, "xgb_ufc_model.pkl")
+NATIVE_FORMATS = ('json', 'ubj')
+IMPORTANCE_TYPES = ('gain', 'weight', 'cover', 'total_gain', 'total_cover')
+
+
+def native_model_path(fmt, model_path=MODEL_PATH):
+    return os.path.splitext(model_path)[0] + '.' + fmt
+
+
+def export_model(model_path=MODEL_PATH, fmt='json'):
+    """Write the booster inside ``model_path`` to XGBoost's native ``fmt``."""
+    booster = joblib.load(model_path).get_booster()
+    booster.set_attr(source_digest=file_digest(model_path))
+    out_path = native_model_path(fmt, model_path)
+    booster.save_model(out_path)
+    return out_path
+
+
+def load_booster(model_path=MODEL_PATH):
+    """Return the model as a ``Booster``, preferring an up-to-date native export."""
+    digest = file_digest(model_path)
+    for fmt in NATIVE_FORMATS:
+        path = native_model_path(fmt, model_path)
+        if not os.path.exists(path):
+            continue
+        booster = xgb.Booster(model_file=path)
+        if booster.attr('source_digest') == digest:
+            return booster
+    return joblib.load(model_path).get_booster()
+
+
+def importance_responses(booster):
+    """Return ``{importance_type: (json_body, etag)}`` for every importance type.
+
+    The bodies are serialized once per model load so the endpoint only has
+    to hand back bytes.
+    """
+    responses = {}
+    for importance_type in IMPORTANCE_TYPES:
+        importance = booster.get_score(importance_type=importance_type)
+        sorted_items = sorted(importance.items(), key=lambda x: x[1], reverse=True)
+        features, scores = zip(*sorted_items) if sorted_items else ((), ())
+        body = json.dumps({'features': list(features), 'scores': list(scores)}).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        responses[importance_type] = (body, etag)
+    return responses
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export the backend model to XGBoost's native format.")
+    parser.add_argument('--format', choices=NATIVE_FORMATS, default='json')
+    args = parser.parse_args()
+    print(f'Wrote {export_model(fmt=args.format)}')
@@ -0,0 +1,72 @@
+"""Bounded LRU/TTL cache for matchup predictions.
+
+Entries are keyed on the model/roster version they were computed from and
+the order-normalized fighter pair, so a reloaded model or CSV never serves
+stale predictions.  Entries of a replaced version are not dropped at once:
+while a reload is in flight, requests on the old and new snapshots share
+the cache without wiping each other's entries, and the old ones age out
+through the LRU and TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class PredictionCache:
+    """Thread-safe LRU cache with a per-entry time-to-live."""
+
+    def __init__(self, maxsize=4096, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """Return the value cached for ``key`` under ``version`` or ``None`` on a miss."""
+        entry_key = (version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[entry_key]
+            self.misses += 1
+            return None
+
+    def put(self, key, version, value):
+        if self.maxsize <= 0:
+            return
+        entry_key = (version, key)
+        with self._lock:
+            # The version last stored, reported by stats()
+            self.version = version
+            self._entries[entry_key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'version': self.version,
+            }
@@ -0,0 +1,212 @@
+"""Framework-independent request handling shared by the Flask and ASGI apps.
+
+Each function takes already-parsed request data and returns a
+``(payload, status)`` pair, so :mod:`app` and :mod:`asgi` only deal with
+HTTP plumbing.  :func:`feature_importance` returns a pre-serialized body
+plus caching headers instead.  :func:`metrics_text` renders ``/metrics``.
+"""
+
+import hmac
+import json
+import os
+
+import numpy as np
+
+import metrics
+from custom_inputs import getCustomPredict, getCustomPredictBatch, pick_winner, prediction_cache
+from head_to_head import get_matrices
+from registry import get_snapshot, registry
+from search_index import DEFAULT_LIMIT, MAX_LIMIT
+
+
+def get_fighter_id(name, index=None):
+    # Return fighter ID from the lookup index using case-insensitive match
+    if index is None:
+        index = get_snapshot().index
+    return index.get_id(name)
+
+
+def predict_matchup(fighter_one, fighter_two, snapshot=None):
+    # Use one model/roster snapshot for the whole request
+    if snapshot is None:
+        snapshot = get_snapshot()
+    index = snapshot.index
+
+    with metrics.stage('lookup'):
+        fighter_one_id = get_fighter_id(fighter_one, index)
+        fighter_two_id = get_fighter_id(fighter_two, index)
+    metrics.annotate(fighter_one=fighter_one, fighter_two=fighter_two,
+                     fighter_one_id=fighter_one_id, fighter_two_id=fighter_two_id, version=snapshot.version)
+    if fighter_one_id is None or fighter_two_id is None:
+        return {'error': 'Unknown fighter'}, 404
+
+    # Fast path: same weight class pairs are looked up in the precomputed matrices
+    probs = None
+    matrices = get_matrices(snapshot)
+    if matrices is not None:
+        with metrics.stage('matrix_lookup'):
+            probs = matrices.lookup(fighter_one_id, fighter_two_id)
+
+    if probs is not None:
+        winner_id, confidence = pick_winner(fighter_one_id, fighter_two_id, *probs)
+    else:
+        winner_id, confidence = getCustomPredict(fighter_one_id, fighter_two_id, snapshot)
+
+    if winner_id is None:
+        return {'error': 'Unable to determine winner'}, 400
+
+    winner_name = index.get_name(winner_id) or str(winner_id)
+    metrics.annotate(prediction=winner_name, confidence=confidence)
+    return {'prediction': winner_name, 'confidence': confidence}, 200
+
+
+# Largest card /predict/batch accepts in one request
+MAX_CARD_FIGHTS = int(os.environ.get('MAX_CARD_FIGHTS', 100))
+
+
+def predict_card(fights, snapshot=None):
+    if not isinstance(fights, list) or not all(isinstance(fight, dict) for fight in fights):
+        return {'error': 'fights must be a list of {"fighterOne", "fighterTwo"} objects'}, 400
+    if len(fights) > MAX_CARD_FIGHTS:
+        return {'error': f'At most {MAX_CARD_FIGHTS} fights per request'}, 413
+    if snapshot is None:
+        snapshot = get_snapshot()
+    index = snapshot.index
+
+    pairs = []
+    positions = []
+    results = []
+    with metrics.stage('lookup'):
+        for pos, fight in enumerate(fights):
+            fighter_one = fight.get('fighterOne')
+            fighter_two = fight.get('fighterTwo')
+            result = {'fighterOne': fighter_one, 'fighterTwo': fighter_two}
+
+            fighter_one_id = get_fighter_id(fighter_one, index)
+            fighter_two_id = get_fighter_id(fighter_two, index)
+            if fighter_one_id is None or fighter_two_id is None:
+                result['error'] = 'Unknown fighter'
+            else:
+                pairs.append((fighter_one_id, fighter_two_id))
+                positions.append(pos)
+            results.append(result)
+    metrics.annotate(fights=len(fights), resolved=len(pairs), version=snapshot.version)
+
+    # One model call for every resolvable bout on the card
+    for pos, (winner_id, confidence) in zip(positions, getCustomPredictBatch(pairs, snapshot)):
+        results[pos]['prediction'] = index.get_name(winner_id) or str(winner_id)
+        results[pos]['confidence'] = confidence
+
+    return {'predictions': results}, 200
+
+
+def search_fighters(query, limit=None, snapshot=None):
+    # Typeahead over names and nicknames; an empty query returns no matches
+    if snapshot is None:
+        snapshot = get_snapshot()
+    try:
+        limit = DEFAULT_LIMIT if limit in (None, '') else int(limit)
+    except (TypeError, ValueError):
+        return {'error': 'limit must be an integer'}, 400
+    limit = max(0, min(limit, MAX_LIMIT))
+
+    with metrics.stage('search'):
+        matches = snapshot.search.search(query or '', limit)
+    return {'query': query or '', 'results': matches}, 200
+
+
+def head_to_head_matrix(weight, snapshot=None):
+    if snapshot is None:
+        snapshot = get_snapshot()
+    index = snapshot.index
+
+    matrices = get_matrices(snapshot)
+    if matrices is None:
+        return {'error': 'Head-to-head matrices are not built for this model'}, 404
+    if weight not in matrices.matrices:
+        return {'error': 'Unknown weight class'}, 404
+
+    ids = matrices.ids[weight].tolist()
+    return {
+        'weight': weight,
+        'fighters': [{'id': fighter_id, 'name': index.get_name(fighter_id)} for fighter_id in ids],
+        'probabilities': np.asarray(matrices.matrices[weight]).tolist(),
+    }, 200
+
+
+def cache_stats():
+    return prediction_cache.stats(), 200
+
+
+cache_entries = metrics.register(metrics.Gauge('fightmetrics_prediction_cache_entries', 'Cached matchups.'))
+cache_hit_rate = metrics.register(metrics.Gauge('fightmetrics_prediction_cache_hit_rate',
+                                                'Prediction cache hits per lookup since startup.'))
+cache_events = metrics.register(metrics.Counter('fightmetrics_prediction_cache_events_total',
+                                                'Prediction cache hits, misses and evictions.', ('event',)))
+model_info = metrics.register(metrics.Gauge('fightmetrics_model_info',
+                                            'Model/roster version being served (always 1).', ('version',)))
+
+
+@metrics.register_collector
+def _collect_gauges():
+    stats = prediction_cache.stats()
+    cache_entries.set(value=stats['size'])
+    cache_hit_rate.set(value=stats['hit_rate'])
+    for event in ('hits', 'misses', 'evictions'):
+        cache_events.set_total(event, value=stats[event])
+    model_info.clear()
+    model_info.set(get_snapshot().version, value=1)
+
+
+def metrics_text():
+    """Return ``(body, content_type)`` for ``GET /metrics``."""
+    return metrics.render(), metrics.CONTENT_TYPE
+
+
+# Browsers may reuse the response this long, then revalidate with the ETag
+FEATURE_IMPORTANCE_MAX_AGE = 60
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+
+def feature_importance(importance_type='gain', if_none_match=None, snapshot=None):
+    """Return ``(json_body, status, headers)``; the body is ``b''`` for a 304."""
+    if snapshot is None:
+        snapshot = get_snapshot()
+
+    response = snapshot.importance.get(importance_type or 'gain')
+    if response is None:
+        body = json.dumps({'error': 'Unknown importance type'}).encode()
+        return body, 400, {}
+
+    body, etag = response
+    headers = {'ETag': etag, 'Cache-Control': f'public, max-age={FEATURE_IMPORTANCE_MAX_AGE}'}
+    if _etag_matches(if_none_match, etag):
+        return b'', 304, headers
+    return body, 200, headers
+
+
+def admin_reload(token, wait=False):
+    # Disabled unless ADMIN_TOKEN is configured; CORS lets any page POST here
+    expected = os.environ.get('ADMIN_TOKEN')
+    if not expected or not hmac.compare_digest((token or '').encode(), expected.encode()):
+        return {'error': 'Forbidden'}, 403
+
+    # wait reloads before responding; otherwise reload in the background
+    if wait:
+        try:
+            snapshot = registry.reload()
+        except Exception as e:
+            return {'error': f'Reload failed: {e}', 'version': get_snapshot().version}, 500
+        return {'status': 'reloaded', 'version': snapshot.version}, 200
+
+    started = registry.reload_in_background()
+    return {
+        'status': 'started' if started else 'already running',
+        'version': get_snapshot().version,
+    }, 202
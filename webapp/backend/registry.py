@@ -0,0 +1,158 @@
+"""Versioned registry of the model and roster served by the backend.
+
+A :class:`Snapshot` bundles one loaded booster with one fighter index.
+Request handlers take the current snapshot once and use it for the whole
+request.  Reloads build a complete new snapshot in the background and then
+swap a single reference, so in-flight requests finish on the old version
+and new ones never wait on a cold load.
+
+Reloads are triggered through ``POST /admin/reload`` or, when
+``MODEL_WATCH_INTERVAL`` is set, by polling the model and CSV files for
+changes.  With ``FIGHTER_DB`` set the roster is read from the database
+instead of the CSV, and a refresh of ``clean_ufc_fights`` counts as a
+change.
+"""
+
+import os
+import threading
+import traceback
+
+import fighter_db
+from artifacts import artifacts_version
+from fighter_index import FighterIndex
+from fighter_store import DATA_PATH
+from model_store import MODEL_PATH, importance_responses, load_booster
+from search_index import SearchIndex
+
+
+def _mtime(path):
+    return os.stat(path).st_mtime_ns
+
+
+def _roster_stamp(data_path, db=None):
+    return db.version() if db is not None else _mtime(data_path)
+
+
+class Snapshot:
+    """One immutable model + roster pairing."""
+
+    def __init__(self, booster, index, model_version, stamps=None):
+        self.booster = booster
+        self.index = index
+        self.model_version = model_version
+        self.stamps = stamps
+        self.version = f'{model_version}-{index.version}'
+        # Serialized /feature-importance bodies, computed once per model load
+        self.importance = importance_responses(booster)
+        # Name/nickname typeahead index for /search, built once per roster load
+        self.search = SearchIndex.from_index(index)
+
+
+def load_snapshot(model_path=MODEL_PATH, data_path=DATA_PATH, db=None):
+    """Load the model and roster (CSV, or ``db`` if given) into a new :class:`Snapshot`."""
+    stamps = (_mtime(model_path), _roster_stamp(data_path, db))
+    return Snapshot(
+        booster=load_booster(model_path),
+        index=FighterIndex.from_db(db) if db is not None else FighterIndex.from_csv(data_path),
+        model_version=artifacts_version(model_path),
+        stamps=stamps,
+    )
+
+
+class ModelRegistry:
+    """Holds the current snapshot and swaps in reloaded ones atomically."""
+
+    def __init__(self, model_path=MODEL_PATH, data_path=DATA_PATH, db=None):
+        self.model_path = model_path
+        self.data_path = data_path
+        self.db = db
+        self.last_error = None
+        self._current = None
+        self._load_lock = threading.Lock()
+        self._reload_thread = None
+        self._watch_thread = None
+        self._watch_stop = None
+
+    def get(self):
+        """Return the current snapshot, loading the first one if needed."""
+        snapshot = self._current
+        if snapshot is None:
+            with self._load_lock:
+                if self._current is None:
+                    self._current = load_snapshot(self.model_path, self.data_path, self.db)
+                snapshot = self._current
+        return snapshot
+
+    def reload(self):
+        """Load the files again and swap the result in; returns the new snapshot.
+
+        On failure the current snapshot keeps serving and the error is kept in
+        ``last_error``.
+        """
+        with self._load_lock:
+            try:
+                snapshot = load_snapshot(self.model_path, self.data_path, self.db)
+            except Exception as e:
+                traceback.print_exc()
+                self.last_error = str(e)
+                raise
+            self.last_error = None
+            self._current = snapshot
+        return snapshot
+
+    def reload_in_background(self):
+        """Start a background reload unless one is already running."""
+        thread = self._reload_thread
+        if thread is not None and thread.is_alive():
+            return False
+
+        def run():
+            try:
+                self.reload()
+            except Exception:
+                pass
+
+        self._reload_thread = threading.Thread(target=run, name='model-reload', daemon=True)
+        self._reload_thread.start()
+        return True
+
+    def is_stale(self):
+        """Return ``True`` if the model or roster changed since the current load."""
+        snapshot = self._current
+        if snapshot is None:
+            return False
+        try:
+            return snapshot.stamps != (_mtime(self.model_path), _roster_stamp(self.data_path, self.db))
+        except Exception:
+            # A file is mid-replace or the database is unreachable; check
+            # again on the next poll
+            return False
+
+    def watch(self, interval):
+        """Poll the files every ``interval`` seconds and reload when they change.
+
+        Returns the :class:`threading.Event` that stops the watcher when set;
+        calling this again while it runs returns the same event.
+        """
+        thread = self._watch_thread
+        if thread is not None and thread.is_alive() and not self._watch_stop.is_set():
+            return self._watch_stop
+
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                if self.is_stale():
+                    self.reload_in_background()
+
+        self._watch_stop = stop
+        self._watch_thread = threading.Thread(target=run, name='model-watch', daemon=True)
+        self._watch_thread.start()
+        return stop
+
+
+registry = ModelRegistry(db=fighter_db.from_env())
+
+
+def get_snapshot():
+    return registry.get()
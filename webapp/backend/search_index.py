@@ -0,0 +1,166 @@
+"""Typeahead search over fighter names and nicknames.
+
+:class:`SearchIndex` is built once per roster snapshot (see
+:mod:`registry`) and answers ``GET /search?q=`` without touching the
+roster again.  Names and nicknames are folded to lowercase ASCII words
+(``"José Aldo"`` -> ``"jose aldo"``) and indexed two ways:
+
+* a sorted word list, so every query word matches the start of some word
+  of the fighter (``"jon jo"`` finds Jon Jones) with a binary search
+* trigram -> fighters maps for names and for nicknames, so misspelled
+  queries (``"jonathon jons"``) still find the fighters sharing most of
+  their trigrams with either one
+
+Prefix matches rank first; trigram matches fill the remaining slots when
+there are not enough of them.
+"""
+
+import bisect
+import heapq
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+# Share of the query's trigrams a typo match must have (Dice coefficient)
+MIN_SIMILARITY = 0.4
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def fold(text):
+    """Return ``text`` as lowercase ASCII words separated by single spaces."""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    ascii_text = ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return _NON_WORD.sub(' ', ascii_text.replace("'", '')).strip()
+
+
+def trigrams(folded):
+    """Return the set of trigrams of ``folded``, padded so word starts count double."""
+    padded = f'  {folded} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Prefix and trigram lookups over one roster's names and nicknames."""
+
+    def __init__(self, ids, names, nicknames):
+        self.ids = list(ids)
+        self.names = [str(name) for name in names]
+        self.nicknames = [str(nickname) if nickname else '' for nickname in nicknames]
+
+        folded_names = [fold(name) for name in self.names]
+        folded_nicknames = [fold(nickname) for nickname in self.nicknames]
+        self._folded_names = folded_names
+
+        # (word, entry) pairs sorted by word; a prefix is a contiguous range
+        words = set()
+        self._words_by_entry = []
+        for entry, (name, nickname) in enumerate(zip(folded_names, folded_nicknames)):
+            entry_words = set(name.split()) | set(nickname.split())
+            self._words_by_entry.append(entry_words)
+            words.update((word, entry) for word in entry_words)
+        self._words = sorted(words)
+        self._keys = [word for word, _ in self._words]
+        # Names and nicknames are scored separately; mixing their trigrams
+        # in one Dice coefficient can push it past 1
+        self._gram_fields = [self._gram_field(folded_names), self._gram_field(folded_nicknames)]
+
+    @staticmethod
+    def _gram_field(texts):
+        """Return ``(trigram -> entries, trigram count per entry)`` for one field."""
+        grams = defaultdict(set)
+        for entry, text in enumerate(texts):
+            if text:
+                for gram in trigrams(text):
+                    grams[gram].add(entry)
+        postings = {gram: np.fromiter(entries, dtype=np.int32, count=len(entries))
+                    for gram, entries in grams.items()}
+        sizes = np.array([len(trigrams(text)) if text else np.inf for text in texts], dtype=np.float64)
+        return postings, sizes
+
+    @classmethod
+    def from_index(cls, index):
+        """Build from a :class:`fighter_index.FighterIndex`."""
+        ids = list(index.names_by_id)
+        return cls(ids, [index.names_by_id[i] for i in ids], [index.nicknames_by_id.get(i, '') for i in ids])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _prefix_entries(self, prefix):
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + '\x7f', start)
+        return {entry for _, entry in self._words[start:end]}
+
+    def _prefix_matches(self, words):
+        # Entries where every query word starts a different word of the name or nickname
+        words = sorted(words, key=len, reverse=True)
+        entries = None
+        for word in words:
+            found = self._prefix_entries(word)
+            entries = found if entries is None else entries & found
+            if not entries:
+                return set()
+        if len(words) > 1:
+            entries = {entry for entry in entries if self._distinct_prefixes(entry, words)}
+        return entries
+
+    def _distinct_prefixes(self, entry, words):
+        unused = set(self._words_by_entry[entry])
+        for word in words:
+            match = next((candidate for candidate in unused if candidate.startswith(word)), None)
+            if match is None:
+                return False
+            unused.discard(match)
+        return True
+
+    def _prefix_rank(self, entry, query):
+        name = self._folded_names[entry]
+        if name == query:
+            return 0
+        if name.startswith(query):
+            return 1
+        if all(word in self._words_by_entry[entry] for word in query.split()):
+            return 2
+        return 3
+
+    def _similar(self, query, exclude):
+        query_grams = trigrams(query)
+        scores = np.zeros(len(self.ids))
+        for grams, sizes in self._gram_fields:
+            postings = [grams[gram] for gram in query_grams if gram in grams]
+            if postings:
+                shared = np.bincount(np.concatenate(postings), minlength=len(self.ids))
+                np.maximum(scores, 2 * shared / (len(query_grams) + sizes), out=scores)
+        scored = [(float(scores[entry]), int(entry)) for entry in np.flatnonzero(scores >= MIN_SIMILARITY)
+                  if entry not in exclude]
+        scored.sort(key=lambda item: (-item[0], self.names[item[1]]))
+        return scored
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Return up to ``limit`` matches for ``query``, best first.
+
+        Each match is ``{'id', 'name', 'nickname', 'match'}`` where
+        ``match`` is ``'prefix'`` or ``'fuzzy'``.
+        """
+        folded = fold(query)
+        if not folded or limit <= 0:
+            return []
+
+        prefix = self._prefix_matches(folded.split())
+        best = heapq.nsmallest(limit, prefix, key=lambda entry: (self._prefix_rank(entry, folded), self.names[entry]))
+        ranked = [(entry, 'prefix') for entry in best]
+        if len(ranked) < limit and len(folded) >= 3:
+            ranked += [(entry, 'fuzzy') for _, entry in self._similar(folded, prefix)[:limit - len(ranked)]]
+
+        return [
+            {'id': self.ids[entry], 'name': self.names[entry], 'nickname': self.nicknames[entry] or None,
+             'match': match}
+            for entry, match in ranked
+        ]
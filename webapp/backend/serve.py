@@ -0,0 +1,44 @@
+"""Production launcher for the ASGI prediction backend.
+
+Runs :mod:`asgi` under uvicorn with several worker processes, no reload
+and no per-request access log::
+
+    python serve.py --host 0.0.0.0 --port 5000 --workers 4
+
+Each worker memory-maps the same fighter store, so extra workers cost
+little memory beyond the model itself.
+"""
+
+import argparse
+import os
+
+import uvicorn
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the prediction backend with uvicorn.')
+    parser.add_argument('--host', default=os.environ.get('HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1)))
+    parser.add_argument('--backlog', type=int, default=4096)
+    parser.add_argument('--log-level', default='warning')
+    args = parser.parse_args()
+
+    # Build the columnar store once here instead of racing in every worker
+    from fighter_store import open_store
+    open_store()
+
+    uvicorn.run(
+        'asgi:app',
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        backlog=args.backlog,
+        log_level=args.log_level,
+        access_log=False,
+    )
+
+
+if __name__ == '__main__':
+    main()
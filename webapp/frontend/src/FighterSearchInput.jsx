@@ -0,0 +1,51 @@
+import { useState, useEffect } from 'react';
+
+const SEARCH_DELAY_MS = 120;
+
+function FighterSearchInput({ id, placeholder, value, onChange }) {
+  const [options, setOptions] = useState([]);
+
+  useEffect(() => {
+    const query = value.trim();
+    if (!query) {
+      setOptions([]);
+      return;
+    }
+
+    // Wait for a pause in typing and drop responses for superseded queries
+    const controller = new AbortController();
+    const timer = setTimeout(() => {
+      fetch(`http://localhost:5000/search?q=${encodeURIComponent(query)}&limit=8`, { signal: controller.signal })
+        .then((res) => res.json())
+        .then((data) => setOptions(data.results || []))
+        .catch((err) => {
+          if (err.name !== 'AbortError') console.error(err);
+        });
+    }, SEARCH_DELAY_MS);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [value]);
+
+  return (
+    <>
+      <input
+        list={`${id}-options`}
+        placeholder={placeholder}
+        value={value}
+        onChange={(e) => onChange(e.target.value)}
+      />
+      <datalist id={`${id}-options`}>
+        {options.map((fighter) => (
+          <option key={fighter.id} value={fighter.name}>
+            {fighter.nickname ? `"${fighter.nickname}"` : ''}
+          </option>
+        ))}
+      </datalist>
+    </>
+  );
+}
+
+export default FighterSearchInput;